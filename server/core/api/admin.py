@@ -14,6 +14,9 @@ from .models import (
     ContributionChannel,
     ContributionIntent,
     Reel,
+    BibleVerse,
+    DailyMetric,
+    SearchDocument,
     SiteSettings,
     ThemeSettings,
     NavigationItem,
@@ -115,6 +118,29 @@ class ReelAdmin(admin.ModelAdmin):
     ordering = ('-published_at', '-created_at')
 
 
+@admin.register(BibleVerse)
+class BibleVerseAdmin(admin.ModelAdmin):
+    list_display = ('book', 'chapter', 'verse', 'translation')
+    search_fields = ('text',)
+    list_filter = ('translation', 'book')
+
+
+@admin.register(DailyMetric)
+class DailyMetricAdmin(admin.ModelAdmin):
+    list_display = ('day', 'metric', 'count', 'updated_at')
+    list_filter = ('metric',)
+    ordering = ('-day', 'metric')
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ('title', 'content_type', 'is_public', 'date', 'updated_at')
+    search_fields = ('title', 'body')
+    list_filter = ('content_type', 'is_public')
+    readonly_fields = ('updated_at',)
+
+
 @admin.register(SiteSettings)
 class SiteSettingsAdmin(admin.ModelAdmin):
     list_display = ('church_name', 'email', 'phone', 'updated_at')
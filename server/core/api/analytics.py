@@ -0,0 +1,187 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.db.models import Count, DateTimeField, DecimalField, F, IntegerField, Value
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import (
+    ContributionIntent,
+    DailyMetric,
+    Devotion,
+    Event,
+    GalleryImage,
+    Prayer_request,
+    Reel,
+    Reflection,
+    Sermon,
+    Series,
+)
+
+# Metric name -> (model, timestamp field) counted per day by the rollup.
+DAILY_METRICS = {
+    "sermons": (Sermon, "date"),
+    "series": (Series, "date"),
+    "events": (Event, "date"),
+    "devotions": (Devotion, "date"),
+    "reflections": (Reflection, "date"),
+    "prayer_requests": (Prayer_request, "date"),
+    "gallery_images": (GalleryImage, "date"),
+    "reels": (Reel, "created_at"),
+    "contribution_intents": (ContributionIntent, "created_at"),
+}
+
+
+def _coerce(value, output_field):
+    # UNION ALL applies the first arm's converters to every row, so each value
+    # is normalised against the field of the aggregate that produced it.
+    if value is None:
+        return None
+    if isinstance(output_field, DecimalField):
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return value.quantize(Decimal(1).scaleb(-output_field.decimal_places))
+    if isinstance(output_field, IntegerField):
+        return int(value)
+    return value
+
+
+def aggregate_metrics(metrics):
+    """
+    Evaluate a dict of named aggregates in a single SQL statement.
+
+    ``metrics`` maps a result key to ``(source, aggregate)`` where ``source``
+    is a model class or queryset. Aggregates sharing a source are computed in
+    one SELECT (use ``filter=Q(...)`` for conditional counts and sums) and the
+    per-source SELECTs are combined with UNION ALL. Returns ``{key: value}``.
+    """
+    if not metrics:
+        return {}
+
+    groups = {}
+    for key, (source, aggregate) in metrics.items():
+        groups.setdefault(source, []).append((key, aggregate))
+
+    width = max(len(items) for items in groups.values())
+    slot_names = [f"m{slot}" for slot in range(width)]
+
+    arms = []
+    arm_slots = []
+    for arm_index, (source, items) in enumerate(groups.items()):
+        queryset = source.all() if hasattr(source, "query") else source._default_manager.all()
+        annotations = {}
+        for slot, name in enumerate(slot_names):
+            if slot < len(items):
+                annotations[name] = items[slot][1]
+            else:
+                annotations[name] = Value(None, output_field=IntegerField())
+        arm = (
+            queryset.order_by()
+            .annotate(_arm=Value(arm_index))
+            .values("_arm")
+            .annotate(**annotations)
+            .values_list("_arm", *slot_names)
+        )
+        arms.append(arm)
+        arm_slots.append([
+            (key, arm.query.annotations[name].output_field)
+            for (key, _), name in zip(items, slot_names)
+        ])
+
+    combined = arms[0].union(*arms[1:], all=True) if len(arms) > 1 else arms[0]
+
+    results = {}
+    for row in combined:
+        for (key, output_field), value in zip(arm_slots[row[0]], row[1:]):
+            results[key] = _coerce(value, output_field)
+    return {key: results.get(key) for key in metrics}
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def live_daily_counts(metrics, start_date, end_date):
+    """
+    Count records per day in ``[start_date, end_date)`` straight from the
+    source tables, one grouped SELECT per metric combined with UNION ALL.
+    Returns ``{metric: {day: count}}`` with only non-zero days present.
+    """
+    metrics = list(metrics)
+    counts = {metric: {} for metric in metrics}
+    if not metrics or start_date >= end_date:
+        return counts
+
+    arms = []
+    for index, metric in enumerate(metrics):
+        model, field_name = DAILY_METRICS[metric]
+        if not isinstance(model._meta.get_field(field_name), DateTimeField):
+            queryset = model.objects.filter(**{f"{field_name}__gte": start_date, f"{field_name}__lt": end_date})
+            day = F(field_name)
+        else:
+            queryset = model.objects.filter(**{
+                f"{field_name}__gte": _day_start(start_date),
+                f"{field_name}__lt": _day_start(end_date),
+            })
+            day = TruncDate(field_name)
+        arms.append(
+            queryset.order_by()
+            .annotate(_day=day)
+            .values("_day")
+            .annotate(_count=Count("pk"), _metric=Value(index))
+            .values_list("_metric", "_day", "_count")
+        )
+
+    combined = arms[0].union(*arms[1:], all=True) if len(arms) > 1 else arms[0]
+    for index, day, count in combined:
+        if isinstance(day, datetime):
+            day = day.date()
+        elif isinstance(day, str):
+            day = date.fromisoformat(day)
+        counts[metrics[index]][day] = count
+    return counts
+
+
+def daily_counts(metrics, start_date, end_date):
+    """
+    Per-day counts for ``[start_date, end_date)``. Days already closed by the
+    ``rollup_daily_metrics`` command are read from DailyMetric; days after the
+    last rolled-up day (normally just today) are counted live.
+    """
+    counts = {metric: {} for metric in metrics}
+    rolled_until = None
+    rows = DailyMetric.objects.filter(
+        metric__in=metrics, day__gte=start_date, day__lt=end_date
+    ).values_list("metric", "day", "count")
+    for metric, day, count in rows:
+        if count:
+            counts[metric][day] = count
+        if rolled_until is None or day > rolled_until:
+            rolled_until = day
+
+    live_start = start_date if rolled_until is None else rolled_until + timedelta(days=1)
+    for metric, days in live_daily_counts(metrics, live_start, end_date).items():
+        counts[metric].update(days)
+    return counts
+
+
+def rollup_daily_metrics(start_date, end_date):
+    """Write one DailyMetric row per metric and day in ``[start_date, end_date)``, zeros included."""
+    metrics = list(DAILY_METRICS)
+    counts = live_daily_counts(metrics, start_date, end_date)
+    now = timezone.now()
+    rows = []
+    day = start_date
+    while day < end_date:
+        for metric in metrics:
+            rows.append(DailyMetric(day=day, metric=metric, count=counts[metric].get(day, 0), updated_at=now))
+        day += timedelta(days=1)
+
+    DailyMetric.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["day", "metric"],
+        update_fields=["count", "updated_at"],
+    )
+    return len(rows)
@@ -0,0 +1,295 @@
+"""
+Query-count, latency and response-size regression benchmarks for the API.
+
+Not part of the default test run (the module name does not match
+``test*.py``). Run it explicitly::
+
+    python manage.py test api.benchmarks
+
+Each endpoint is measured against seeded, realistic volumes and compared with
+``benchmark_baseline.json``. A run fails when an endpoint issues more queries
+than its baseline, grows its response by more than ``SIZE_TOLERANCE``, or its
+p95 latency exceeds the baseline by more than ``LATENCY_TOLERANCE`` (plus
+``LATENCY_SLACK_MS`` for timer noise). Latency baselines depend on the
+machine and database; after an intended change, or on a new machine, rewrite
+the baseline with ``BENCHMARK_UPDATE_BASELINE=1``. ``BENCHMARK_REPORT=1``
+prints each endpoint's measurements after the run.
+
+Endpoints run with the response cache off, so each request does the full
+work. Those in ``CACHED_ENDPOINTS`` are measured again with it on and
+recorded as ``<name>:cached``, the cost of a cache hit.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from .models import (
+    Announcement,
+    ContributionChannel,
+    ContributionIntent,
+    Devotion,
+    Event,
+    Gallery,
+    GalleryImage,
+    Live_stream,
+    Prayer_request,
+    Reel,
+    Reflection,
+    Resource,
+    Sermon,
+    Series,
+)
+
+BASELINE_PATH = Path(__file__).with_name('benchmark_baseline.json')
+ITERATIONS = int(os.environ.get('BENCHMARK_ITERATIONS', 20))
+LATENCY_TOLERANCE = float(os.environ.get('BENCHMARK_LATENCY_TOLERANCE', 0.5))
+LATENCY_SLACK_MS = float(os.environ.get('BENCHMARK_LATENCY_SLACK_MS', 20))
+SIZE_TOLERANCE = 0.1
+
+VOLUMES = {
+    'series': 100,
+    'sermons': 2000,
+    'devotions': 300,
+    'reflections': 3000,
+    'galleries': 100,
+    'gallery_images': 2000,
+    'events': 500,
+    'announcements': 500,
+    'live_streams': 300,
+    'prayer_requests': 1000,
+    'reels': 500,
+    'contribution_intents': 2000,
+}
+
+PUBLIC_ENDPOINTS = [
+    'sermon-list',
+    'series-list',
+    'resource-list',
+    'event-list',
+    'devotion-list',
+    'reflection-list',
+    'announcement-list',
+    'live-stream-list',
+    'gallery-list',
+    'gallery-image-list',
+    'reel-list',
+    'contribution-channel-list',
+    'site-config-public',
+]
+
+ADMIN_ENDPOINTS = [
+    'prayer-request-list',
+    'contribution-intent-list',
+    'analytics-dashboard',
+    'analytics-overview',
+    'analytics-growth',
+    'analytics-engagement',
+    'analytics-contributions',
+    'analytics-upcoming',
+    'analytics-top-content',
+    'analytics-timeline',
+]
+
+# Endpoints behind the response cache (see response_cache.py).
+CACHED_ENDPOINTS = [
+    'sermon-list',
+    'event-list',
+    'devotion-list',
+    'announcement-list',
+    'reel-list',
+]
+
+
+def seed(volumes):
+    """Bulk-insert a realistic data set; timestamps are spread over the last year."""
+    now = timezone.now()
+
+    def ago(index, total):
+        return now - timedelta(days=365 * index / total)
+
+    resources = Resource.objects.bulk_create([
+        Resource(name=f'Resource {index}', purchase_link='https://example.com/buy', price=Decimal('9.99'))
+        for index in range(50)
+    ])
+    series = Series.objects.bulk_create([
+        Series(title=f'Series {index}', description='A sermon series', date=ago(index, volumes['series']))
+        for index in range(volumes['series'])
+    ])
+    Sermon.objects.bulk_create([
+        Sermon(
+            title=f'Sermon {index}',
+            description='Sermon notes ' * 10,
+            preacher='Pastor',
+            series=series[index % len(series)],
+            resource=resources[index % len(resources)] if index % 3 == 0 else None,
+            likes=index % 40,
+            date=ago(index, volumes['sermons']),
+        )
+        for index in range(volumes['sermons'])
+    ], batch_size=500)
+
+    devotions = Devotion.objects.bulk_create([
+        Devotion(
+            title=f'Devotion {index}',
+            Bible_verse={'reference': 'John 3:16', 'verse_content': ''},
+            content='Devotion content ' * 20,
+            date=ago(index, volumes['devotions']),
+        )
+        for index in range(volumes['devotions'])
+    ], batch_size=500)
+    # Skewed so a few devotions carry most reflections, as popular ones do.
+    Reflection.objects.bulk_create([
+        Reflection(name=f'Member {index}', content='Amen', likes=index % 7, devotion=devotions[index % 10 if index % 2 else index % len(devotions)])
+        for index in range(volumes['reflections'])
+    ], batch_size=500)
+
+    galleries = Gallery.objects.bulk_create([
+        Gallery(title=f'Album {index}', description='Photos', date=ago(index, volumes['galleries']))
+        for index in range(volumes['galleries'])
+    ])
+    GalleryImage.objects.bulk_create([
+        GalleryImage(
+            gallery=galleries[index % len(galleries)],
+            title=f'Photo {index}',
+            image=f'https://example.com/photos/{index}.jpg',
+            description='Photo',
+            date=ago(index, volumes['gallery_images']),
+        )
+        for index in range(volumes['gallery_images'])
+    ], batch_size=500)
+
+    Event.objects.bulk_create([
+        Event(
+            name=f'Event {index}', description='Event', location='Main hall',
+            date=(now + timedelta(days=index - volumes['events'] // 2)).date(),
+        )
+        for index in range(volumes['events'])
+    ], batch_size=500)
+    Announcement.objects.bulk_create([
+        Announcement(title=f'Announcement {index}', content='Details', date=ago(index, volumes['announcements']))
+        for index in range(volumes['announcements'])
+    ], batch_size=500)
+    Live_stream.objects.bulk_create([
+        Live_stream(title=f'Stream {index}', description='Live', reactions=index % 50, date=ago(index, volumes['live_streams']))
+        for index in range(volumes['live_streams'])
+    ], batch_size=500)
+    Prayer_request.objects.bulk_create([
+        Prayer_request(name=f'Member {index}', subject='Please pray', date=ago(index, volumes['prayer_requests']))
+        for index in range(volumes['prayer_requests'])
+    ], batch_size=500)
+    Reel.objects.bulk_create([
+        Reel(
+            title=f'Reel {index}', video_url='https://example.com/reel.mp4', is_published=index % 10 != 0,
+            published_at=ago(index, volumes['reels']), views_count=index, likes_count=index % 30,
+        )
+        for index in range(volumes['reels'])
+    ], batch_size=500)
+
+    channels = ContributionChannel.objects.bulk_create([
+        ContributionChannel(name=f'Channel {index}', channel_type='momo', account_name='Elevation', account_number=f'02400000{index}')
+        for index in range(5)
+    ])
+    statuses = ['confirmed', 'confirmed', 'pending', 'rejected']
+    ContributionIntent.objects.bulk_create([
+        ContributionIntent(
+            channel=channels[index % len(channels)],
+            amount=Decimal(index % 200 + 1),
+            status=statuses[index % len(statuses)],
+        )
+        for index in range(volumes['contribution_intents'])
+    ], batch_size=500)
+
+
+@override_settings(RESPONSE_CACHE={'ENABLED': False})
+class ApiBenchmark(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Kept off setUpTestData, whose attributes are copied for every test.
+        cls.baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        cls.results = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed(VOLUMES)
+        cls.admin = get_user_model().objects.create_user(
+            username='benchmark_admin', email='benchmark@example.com', password='pass12345',
+            is_staff=True, is_superuser=True,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.environ.get('BENCHMARK_REPORT'):
+            # Alongside the runner's own output, which goes to stderr.
+            for name, result in sorted(cls.results.items()):
+                sys.stderr.write(
+                    f"{name:<28} {result['queries']:>3} queries  p50 {result['p50_ms']:>8.2f} ms  "
+                    f"p95 {result['p95_ms']:>8.2f} ms  {result['bytes']:>8} bytes\n"
+                )
+        if os.environ.get('BENCHMARK_UPDATE_BASELINE') and cls.results:
+            BASELINE_PATH.write_text(json.dumps(dict(sorted(cls.results.items())), indent=2) + '\n')
+        super().tearDownClass()
+
+    def measure(self, name):
+        url = reverse(name)
+        cache.clear()
+        for _ in range(2):
+            self.assertEqual(self.client.get(url).status_code, 200, name)
+
+        timings = []
+        for _ in range(ITERATIONS):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = self.client.get(url)
+                timings.append((time.perf_counter() - started) * 1000)
+        cut = statistics.quantiles(timings, n=20, method='inclusive')
+        return {
+            'queries': len(queries.captured_queries),
+            'p50_ms': round(statistics.median(timings), 2),
+            'p95_ms': round(cut[-1], 2),
+            'bytes': len(response.content),
+        }
+
+    def check(self, name, label=None):
+        label = label or name
+        result = self.measure(name)
+        self.results[label] = result
+        baseline = self.baseline.get(label)
+        if baseline is None or os.environ.get('BENCHMARK_UPDATE_BASELINE'):
+            return
+
+        with self.subTest(endpoint=label, metric='queries'):
+            self.assertLessEqual(result['queries'], baseline['queries'], f'{label}: {result} vs {baseline}')
+        with self.subTest(endpoint=label, metric='bytes'):
+            self.assertLessEqual(result['bytes'], baseline['bytes'] * (1 + SIZE_TOLERANCE), f'{label}: {result} vs {baseline}')
+        with self.subTest(endpoint=label, metric='p95_ms'):
+            allowed = baseline['p95_ms'] * (1 + LATENCY_TOLERANCE) + LATENCY_SLACK_MS
+            self.assertLessEqual(result['p95_ms'], allowed, f'{label}: {result} vs {baseline}')
+
+    def test_public_endpoints(self):
+        for name in PUBLIC_ENDPOINTS:
+            self.check(name)
+
+    @override_settings(RESPONSE_CACHE={'ENABLED': True})
+    def test_cached_endpoints(self):
+        for name in CACHED_ENDPOINTS:
+            self.check(name, label=f'{name}:cached')
+
+    def test_admin_endpoints(self):
+        self.client.force_authenticate(self.admin)
+        for name in ADMIN_ENDPOINTS:
+            self.check(name)
@@ -0,0 +1,132 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .bible_reference import reference_key
+from .bible_service import BiblePassageNotFound, fetch_bible_passages
+from .models import BiblePassageCache
+
+DEFAULTS = {
+    'DEFAULT_TTL': 60 * 60 * 24 * 30,
+    'TRANSLATION_TTLS': {},
+    'MAX_ROWS': 20000,
+}
+
+
+def _policy():
+    return {**DEFAULTS, **getattr(settings, 'BIBLE_PASSAGE_CACHE', {})}
+
+
+def ttl_for(translation):
+    """Seconds a cached passage in ``translation`` stays fresh, or ``None`` for no expiry."""
+    policy = _policy()
+    return policy['TRANSLATION_TTLS'].get(translation, policy['DEFAULT_TTL'])
+
+
+def is_fresh(passage, now=None):
+    ttl = ttl_for(passage.translation)
+    if ttl is None:
+        return True
+    return passage.fetched_at > (now or timezone.now()) - timedelta(seconds=ttl)
+
+
+def record_hits(passages):
+    """Count a cache hit on each passage and bump its last access time, in one UPDATE."""
+    if not passages:
+        return
+    now = timezone.now()
+    BiblePassageCache.objects.filter(pk__in=[passage.pk for passage in passages]).update(
+        hit_count=F('hit_count') + 1, last_accessed_at=now
+    )
+    for passage in passages:
+        passage.last_accessed_at = now
+
+
+def record_hit(passage):
+    record_hits([passage])
+
+
+def store_passage(reference, translation, passage_data):
+    """Insert or refresh the cached copy of a fetched passage."""
+    passage, _ = BiblePassageCache.objects.update_or_create(
+        reference_key=reference_key(reference),
+        translation=translation,
+        defaults={
+            'reference': reference,
+            'passage_text': passage_data['passage_text'],
+            'raw_response': passage_data['raw_response'],
+            'last_accessed_at': timezone.now(),
+        },
+    )
+    return passage
+
+
+def resolve_passages(lookups, count_hits=True):
+    """
+    Return ``{(reference_key, translation): passage or error}`` for canonical
+    ``(reference, translation)`` lookups.
+
+    Fresh cached passages are read with one query; the rest are fetched
+    together and stored. A failed refresh falls back to the expired copy
+    unless the upstream says the passage does not exist. Pass
+    ``count_hits=False`` when nobody is reading the result, e.g. warm-ups.
+    """
+    references = {}
+    for reference, translation in lookups:
+        references.setdefault((reference_key(reference), translation), reference)
+    if not references:
+        return {}
+
+    condition = Q()
+    for key, translation in references:
+        condition |= Q(reference_key=key, translation=translation)
+    cached = {
+        (passage.reference_key, passage.translation): passage
+        for passage in BiblePassageCache.objects.filter(condition)
+    }
+    resolved = {key: passage for key, passage in cached.items() if is_fresh(passage)}
+    hits = list(resolved.values())
+
+    missing = [key for key in references if key not in resolved]
+    fetched = fetch_bible_passages([(references[key], key[1]) for key in missing])
+    for key, result in zip(missing, fetched):
+        if not isinstance(result, Exception):
+            resolved[key] = store_passage(references[key], key[1], result)
+        elif key in cached and not isinstance(result, BiblePassageNotFound):
+            resolved[key] = cached[key]
+            hits.append(cached[key])
+        else:
+            resolved[key] = result
+    if count_hits:
+        record_hits(hits)
+    return resolved
+
+
+def prune(now=None, max_rows=None):
+    """
+    Delete expired passages, then evict the least recently used rows beyond
+    ``max_rows`` (default ``MAX_ROWS``), fewest hits first among equals.
+    Returns ``(expired, evicted)`` row counts.
+    """
+    policy = _policy()
+    now = now or timezone.now()
+    max_rows = policy['MAX_ROWS'] if max_rows is None else max_rows
+
+    expired_filter = Q()
+    translation_ttls = policy['TRANSLATION_TTLS']
+    for translation, ttl in translation_ttls.items():
+        if ttl is not None:
+            expired_filter |= Q(translation=translation, fetched_at__lte=now - timedelta(seconds=ttl))
+    if policy['DEFAULT_TTL'] is not None:
+        expired_filter |= Q(fetched_at__lte=now - timedelta(seconds=policy['DEFAULT_TTL'])) & ~Q(
+            translation__in=list(translation_ttls)
+        )
+    expired = BiblePassageCache.objects.filter(expired_filter).delete()[0] if expired_filter else 0
+
+    evicted = 0
+    if max_rows is not None:
+        overflow = BiblePassageCache.objects.order_by('-last_accessed_at', '-hit_count', '-pk').values('pk')[max_rows:]
+        evicted = BiblePassageCache.objects.filter(pk__in=overflow).delete()[0]
+    return expired, evicted
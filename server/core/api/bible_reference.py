@@ -0,0 +1,195 @@
+import re
+
+# Canonical book name -> extra abbreviations. The canonical name itself, and
+# any unambiguous prefix of it, are always accepted.
+BOOKS = {
+    "Genesis": ["gen", "ge", "gn"],
+    "Exodus": ["exod", "exo", "ex"],
+    "Leviticus": ["lev", "le", "lv"],
+    "Numbers": ["num", "nu", "nm", "nb"],
+    "Deuteronomy": ["deut", "dt"],
+    "Joshua": ["josh", "jos", "jsh"],
+    "Judges": ["judg", "jdg", "jg", "jdgs"],
+    "Ruth": ["rth", "ru"],
+    "1 Samuel": ["1sam", "1sa", "1sm"],
+    "2 Samuel": ["2sam", "2sa", "2sm"],
+    "1 Kings": ["1kgs", "1ki", "1kg"],
+    "2 Kings": ["2kgs", "2ki", "2kg"],
+    "1 Chronicles": ["1chron", "1chr", "1ch"],
+    "2 Chronicles": ["2chron", "2chr", "2ch"],
+    "Ezra": ["ezr"],
+    "Nehemiah": ["neh", "ne"],
+    "Esther": ["esth", "est", "es"],
+    "Job": ["jb"],
+    "Psalms": ["psalm", "ps", "psa", "pss", "psm"],
+    "Proverbs": ["prov", "pro", "prv", "pr"],
+    "Ecclesiastes": ["eccles", "eccl", "ecc", "qoh"],
+    "Song of Solomon": ["songofsongs", "song", "sos", "so", "canticles"],
+    "Isaiah": ["isa", "is"],
+    "Jeremiah": ["jer", "je", "jr"],
+    "Lamentations": ["lam", "la"],
+    "Ezekiel": ["ezek", "eze", "ezk"],
+    "Daniel": ["dan", "da", "dn"],
+    "Hosea": ["hos", "ho"],
+    "Joel": ["jl"],
+    "Amos": ["am"],
+    "Obadiah": ["obad", "ob"],
+    "Jonah": ["jnh", "jon"],
+    "Micah": ["mic", "mc"],
+    "Nahum": ["nah", "na"],
+    "Habakkuk": ["hab", "hb"],
+    "Zephaniah": ["zeph", "zep", "zp"],
+    "Haggai": ["hag", "hg"],
+    "Zechariah": ["zech", "zec", "zc"],
+    "Malachi": ["mal", "ml"],
+    "Matthew": ["matt", "mat", "mt"],
+    "Mark": ["mrk", "mar", "mk", "mr"],
+    "Luke": ["luk", "lk"],
+    "John": ["joh", "jhn", "jn"],
+    "Acts": ["act", "ac"],
+    "Romans": ["rom", "ro", "rm"],
+    "1 Corinthians": ["1cor", "1co"],
+    "2 Corinthians": ["2cor", "2co"],
+    "Galatians": ["gal", "ga"],
+    "Ephesians": ["eph", "ephes"],
+    "Philippians": ["phil", "php", "pp"],
+    "Colossians": ["col", "co"],
+    "1 Thessalonians": ["1thess", "1thes", "1th"],
+    "2 Thessalonians": ["2thess", "2thes", "2th"],
+    "1 Timothy": ["1tim", "1ti"],
+    "2 Timothy": ["2tim", "2ti"],
+    "Titus": ["tit", "ti"],
+    "Philemon": ["philem", "phm", "pm"],
+    "Hebrews": ["heb"],
+    "James": ["jas", "jm"],
+    "1 Peter": ["1pet", "1pe", "1pt", "1p"],
+    "2 Peter": ["2pet", "2pe", "2pt", "2p"],
+    "1 John": ["1jn", "1jhn", "1jo", "1j"],
+    "2 John": ["2jn", "2jhn", "2jo", "2j"],
+    "3 John": ["3jn", "3jhn", "3jo", "3j"],
+    "Jude": ["jud", "jd"],
+    "Revelation": ["rev", "re", "revelations"],
+}
+
+# Books with one chapter, where "Jude 3" means verse 3.
+SINGLE_CHAPTER_BOOKS = {"Obadiah", "Philemon", "2 John", "3 John", "Jude"}
+
+_ORDINALS = {"i": "1", "ii": "2", "iii": "3", "first": "1", "second": "2", "third": "3"}
+
+_ORDINAL = r"(?:(?P<ordinal>[123]|(?:iii|ii|i|first|second|third)(?=\s))\s*)?"
+_REFERENCE_RE = re.compile(
+    r"^" + _ORDINAL +
+    r"(?P<book>[a-z][a-z .]*?)\.?\s*"
+    r"(?P<location>\d[\d\s:.,\-–—]*)?$"
+)
+_BOOK_RE = re.compile(r"^" + _ORDINAL + r"(?P<book>[a-z][a-z .]*)$")
+_LOCATION_RE = re.compile(r"^\d+(?::\d+)?(?:-\d+(?::\d+)?)?(?:,\d+(?:-\d+)?)*$")
+
+
+def _alias(name):
+    return re.sub(r"[\s.]", "", name).lower()
+
+
+def _build_aliases():
+    aliases = {}
+    for canonical, extra in BOOKS.items():
+        for name in [canonical, *extra]:
+            aliases[_alias(name)] = canonical
+    return aliases
+
+
+_ALIASES = _build_aliases()
+_FULL_NAMES = {_alias(canonical): canonical for canonical in BOOKS}
+
+
+def _resolve_book(ordinal, book):
+    key = (_ORDINALS.get(ordinal, ordinal) or "") + _alias(book)
+    if key in _ALIASES:
+        return _ALIASES[key]
+    if len(key) - (1 if ordinal else 0) < 3:
+        return None
+    matches = {canonical for name, canonical in _FULL_NAMES.items() if name.startswith(key)}
+    return matches.pop() if len(matches) == 1 else None
+
+
+def canonical_book(name):
+    """Return the canonical name for a book name or abbreviation, or ``None``."""
+    match = _BOOK_RE.match(" ".join((name or "").split()).lower())
+    if match is None:
+        return None
+    return _resolve_book(match.group("ordinal"), match.group("book"))
+
+
+def canonical_reference(reference):
+    """
+    Return ``reference`` in canonical form, e.g. ``"Jn 3 : 16"`` and
+    ``"john 3.16"`` both become ``"John 3:16"``.
+
+    Book names and common abbreviations map to the full book name and chapter
+    and verse punctuation is normalised. A reference that cannot be parsed is
+    returned with its whitespace collapsed, so it still caches consistently.
+    """
+    collapsed = " ".join((reference or "").split())
+    match = _REFERENCE_RE.match(collapsed.lower())
+    if match is None:
+        return collapsed
+
+    book = _resolve_book(match.group("ordinal"), match.group("book"))
+    if book is None:
+        return collapsed
+
+    location = match.group("location")
+    if not location:
+        return book
+    location = re.sub(r"(?<=\d)\.(?=\d)", ":", re.sub(r"\s+", "", location))
+    location = re.sub(r"[–—]", "-", location)
+    if not _LOCATION_RE.match(location):
+        return collapsed
+    return f"{book} {location}"
+
+
+def reference_key(reference):
+    """Lookup key for the passage cache: the canonical reference, case-folded."""
+    return canonical_reference(reference).casefold()
+
+
+def parse_reference(reference):
+    """
+    Split a reference into ``(book, spans)``, or return ``None`` if it does
+    not name a book and chapter.
+
+    Each span is ``((chapter, verse), (chapter, verse))``, inclusive, where a
+    ``None`` verse means the start or end of that chapter. For example
+    ``"Jn 3:16-18,20"`` gives ``("John", [((3, 16), (3, 18)), ((3, 20), (3, 20))])``.
+    """
+    book, _, location = canonical_reference(reference).rpartition(" ")
+    if book not in BOOKS or not _LOCATION_RE.match(location):
+        return None
+    if book in SINGLE_CHAPTER_BOOKS and ":" not in location and location != "1":
+        location = f"1:{location}"
+
+    first, *rest = location.split(",")
+    start, _, end = first.partition("-")
+    start_chapter, _, start_verse = start.partition(":")
+    start = (int(start_chapter), int(start_verse) if start_verse else None)
+    if not end:
+        end = start
+    elif ":" in end:
+        end_chapter, _, end_verse = end.partition(":")
+        end = (int(end_chapter), int(end_verse))
+        if start[1] is None:
+            start = (start[0], 1)
+    elif start[1] is None:
+        end = (int(end), None)
+    else:
+        end = (start[0], int(end))
+
+    spans = [(start, end)]
+    chapter = end[0]
+    for part in rest:
+        low, _, high = part.partition("-")
+        if start[1] is None:
+            spans.append(((int(low), None), (int(high or low), None)))
+        else:
+            spans.append(((chapter, int(low)), (chapter, int(high or low))))
+    return book, spans
@@ -1,36 +1,221 @@
-import json
+import threading
+import time
 import urllib.parse
-import urllib.request
-from urllib.error import HTTPError, URLError
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .bible_reference import reference_key
+from .bible_store import local_passage
+from .models import BibleVerse
 
 BIBLE_API_BASE = "https://bible-api.com"
+USER_AGENT = "ElevationChurchBibleClient/1.0"
+# (connect, read) timeouts in seconds; a slow upstream should fail fast
+# rather than hold a worker.
+REQUEST_TIMEOUT = (3.05, 8)
 
 
-def fetch_bible_passage(reference: str, translation: str = "kjv") -> dict:
-    reference = (reference or '').strip()
-    translation = (translation or 'kjv').strip().lower() or 'kjv'
+class BiblePassageNotFound(ValueError):
+    """The upstream answered, but has no passage for the reference."""
+
+
+class BibleServiceUnavailable(ValueError):
+    """The upstream is failing, or the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stop calling the upstream after ``failure_threshold`` consecutive failures.
+
+    While open every call is refused. Once ``reset_timeout`` seconds have
+    passed a single trial call is let through; its outcome closes the circuit
+    again or re-opens it for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
 
-    if not reference:
-        raise ValueError('Bible reference is required.')
 
-    url = f"{BIBLE_API_BASE}/{urllib.parse.quote(reference)}?translation={urllib.parse.quote(translation)}"
-    request = urllib.request.Request(url, headers={"User-Agent": "ElevationChurchBibleClient/1.0"})
+class BibleClient:
+    """
+    Thread-safe client for bible-api.com.
 
+    Connections are pooled and kept alive across requests, identical
+    in-flight lookups are coalesced into one upstream call, and a circuit
+    breaker turns a failing upstream into an immediate
+    ``BibleServiceUnavailable`` instead of a timeout per request.
+    """
+
+    def __init__(self, base_url=BIBLE_API_BASE, timeout=REQUEST_TIMEOUT, pool_size=10, breaker=None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        self._flight = SingleFlight()
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def fetch_passage(self, reference, translation='kjv'):
+        reference = (reference or '').strip()
+        translation = (translation or 'kjv').strip().lower() or 'kjv'
+
+        if not reference:
+            raise ValueError('Bible reference is required.')
+
+        key = (reference_key(reference), translation)
+        return self._flight.do(key, lambda: self._fetch(reference, translation))
+
+    def _fetch(self, reference, translation):
+        if not self.breaker.allow():
+            raise BibleServiceUnavailable('Bible API is temporarily unavailable.')
+
+        url = f"{self.base_url}/{urllib.parse.quote(reference)}"
+        try:
+            response = self.session.get(url, params={'translation': translation}, timeout=self.timeout)
+        except requests.RequestException as exc:
+            self.breaker.record_failure()
+            raise BibleServiceUnavailable(f'Bible API request failed: {exc}') from exc
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+            raise BibleServiceUnavailable(f'Bible API request failed: {response.status_code} {response.reason}')
+        self.breaker.record_success()
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            raise ValueError(f'Bible API returned an invalid response: {response.status_code} {response.reason}')
+        if 'error' in data or not response.ok:
+            raise BiblePassageNotFound(data.get('error') or 'Bible passage not found.')
+
+        return {
+            'reference': data.get('reference', reference),
+            'translation': translation,
+            'passage_text': data.get('text', '').strip(),
+            'raw_response': data,
+        }
+
+
+client = BibleClient()
+
+
+def _local_passage(reference, translation):
     try:
-        with urllib.request.urlopen(request, timeout=15) as response:
-            raw_text = response.read().decode('utf-8')
-            data = json.loads(raw_text)
-    except HTTPError as exc:
-        raise ValueError(f'Bible API request failed: {exc.code} {exc.reason}') from exc
-    except URLError as exc:
-        raise ValueError(f'Bible API request failed: {exc.reason}') from exc
-
-    if 'error' in data:
-        raise ValueError(data.get('error', 'Bible passage not found.'))
-
-    return {
-        'reference': data.get('reference', reference),
-        'translation': translation,
-        'passage_text': data.get('text', '').strip(),
-        'raw_response': data,
-    }
+        return local_passage(reference, translation)
+    except BibleVerse.DoesNotExist as exc:
+        raise BiblePassageNotFound('Bible passage not found.') from exc
+
+
+def fetch_bible_passage(reference: str, translation: str = "kjv") -> dict:
+    """Serve the passage from the imported local Bible when possible, else from the Bible API."""
+    passage = _local_passage(reference, translation)
+    if passage is not None:
+        return passage
+    return client.fetch_passage(reference, translation)
+
+
+def fetch_bible_passages(lookups, max_workers=8) -> list:
+    """
+    Fetch many ``(reference, translation)`` pairs at once.
+
+    Passages in imported translations are assembled locally; the rest are
+    requested from the Bible API concurrently. Returns one entry per lookup,
+    in order: the passage dict, or the ``ValueError`` that lookup raised.
+    """
+    results = [None] * len(lookups)
+    remote = []
+    for index, (reference, translation) in enumerate(lookups):
+        try:
+            results[index] = _local_passage(reference, translation)
+        except ValueError as exc:
+            results[index] = exc
+            continue
+        if results[index] is None:
+            remote.append(index)
+
+    if remote:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(remote))) as executor:
+            futures = {index: executor.submit(client.fetch_passage, *lookups[index]) for index in remote}
+        for index, future in futures.items():
+            try:
+                results[index] = future.result()
+            except ValueError as exc:
+                results[index] = exc
+    return results
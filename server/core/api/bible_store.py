@@ -0,0 +1,58 @@
+from django.db.models import Q
+
+from .bible_reference import canonical_reference, parse_reference
+from .models import BibleVerse
+
+
+def has_translation(translation):
+    return BibleVerse.objects.filter(translation=translation).exists()
+
+
+def _span_filter(start, end):
+    (start_chapter, start_verse), (end_chapter, end_verse) = start, end
+    after_start = Q(chapter__gt=start_chapter) | Q(chapter=start_chapter, verse__gte=start_verse or 1)
+    before_end = Q(chapter__lt=end_chapter) | Q(chapter=end_chapter)
+    if end_verse is not None:
+        before_end = Q(chapter__lt=end_chapter) | Q(chapter=end_chapter, verse__lte=end_verse)
+    return after_start & before_end
+
+
+def local_passage(reference, translation='kjv'):
+    """
+    Assemble a passage from imported BibleVerse rows.
+
+    Returns ``None`` when the translation has not been imported or the
+    reference cannot be parsed, so the caller can fall back to the Bible
+    API. Raises ``BibleVerse.DoesNotExist`` when the translation is imported
+    but holds no verses for the reference. The result has the same shape as
+    ``BibleClient.fetch_passage`` and ``raw_response`` mirrors bible-api.com.
+    """
+    parsed = parse_reference(reference)
+    if parsed is None or not has_translation(translation):
+        return None
+
+    book, spans = parsed
+    condition = Q()
+    for start, end in spans:
+        condition |= _span_filter(start, end)
+    verses = list(
+        BibleVerse.objects.filter(condition, translation=translation, book=book)
+        .order_by('chapter', 'verse')
+        .values('chapter', 'verse', 'text')
+    )
+    if not verses:
+        raise BibleVerse.DoesNotExist(f'No {translation} verses for {reference}.')
+
+    reference = canonical_reference(reference)
+    text = '\n'.join(verse['text'] for verse in verses)
+    return {
+        'reference': reference,
+        'translation': translation,
+        'passage_text': text,
+        'raw_response': {
+            'reference': reference,
+            'verses': [{'book_name': book, **verse} for verse in verses],
+            'text': text + '\n',
+            'translation_id': translation,
+        },
+    }
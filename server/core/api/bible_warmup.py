@@ -0,0 +1,65 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from .bible_cache import resolve_passages
+from .bible_reference import canonical_reference
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSLATION = 'kjv'
+BATCH_SIZE = 50
+
+# One worker: warm-ups are small and should never compete with requests for
+# the upstream or the database.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bible-warmup')
+
+
+def devotion_references(devotion):
+    """References quoted by a devotion's ``Bible_verse``; several may be separated by ``;``."""
+    verse = devotion.Bible_verse
+    if isinstance(verse, str):
+        try:
+            verse = json.loads(verse)
+        except ValueError:
+            return []
+    if not isinstance(verse, dict):
+        return []
+    reference = verse.get('reference') or ''
+    if not isinstance(reference, str):
+        return []
+    return [canonical_reference(part) for part in reference.split(';') if part.strip()]
+
+
+def warm_references(references, translation=DEFAULT_TRANSLATION):
+    """
+    Make sure every reference is cached and fresh. Returns ``(cached, failed)``
+    counts of distinct passages.
+    """
+    lookups = list(dict.fromkeys((reference, translation) for reference in references))
+    cached = failed = 0
+    for start in range(0, len(lookups), BATCH_SIZE):
+        for result in resolve_passages(lookups[start:start + BATCH_SIZE], count_hits=False).values():
+            if isinstance(result, Exception):
+                failed += 1
+            else:
+                cached += 1
+    return cached, failed
+
+
+def _warm_in_background(references, translation):
+    try:
+        warm_references(references, translation)
+    except Exception:
+        logger.exception('Bible cache warm-up failed for %s', references)
+    finally:
+        close_old_connections()
+
+
+def enqueue_warmup(references, translation=DEFAULT_TRANSLATION):
+    """Warm the cache for ``references`` on the background worker."""
+    references = list(references)
+    if references:
+        _executor.submit(_warm_in_background, references, translation)
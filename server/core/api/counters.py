@@ -0,0 +1,205 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, F, IntegerField, When
+from django.utils import timezone
+
+from . import response_cache
+from .models import Gallery, GalleryImage, Live_stream, Reel, Reflection, Sermon, Series
+
+# Counter kind -> (model, integer field it increments).
+COUNTERS = {
+    "sermons": (Sermon, "likes"),
+    "series": (Series, "likes"),
+    "reflections": (Reflection, "likes"),
+    "galleries": (Gallery, "likes"),
+    "gallery-images": (GalleryImage, "likes"),
+    "reels": (Reel, "likes_count"),
+    "live-streams": (Live_stream, "reactions"),
+}
+
+# Extra conditions an object must meet to be counted, e.g. drafts take no likes.
+COUNTER_FILTERS = {
+    "reels": {"is_published": True},
+}
+
+DEFAULTS = {
+    # Increments an object may take within RATE_WINDOW seconds before further
+    # increments are buffered in the cache instead of updating its row.
+    "HOT_THRESHOLD": 20,
+    "RATE_WINDOW": 10,
+    # Buffered increments are written back at most this many seconds apart.
+    "FLUSH_INTERVAL": 5,
+}
+
+# Buffered objects are listed in the cache itself, so any process (a later
+# request, or `manage.py flush_counters`) can find and flush them: each
+# object that starts buffering takes the next sequence number and stores
+# (kind, pk) under it; flushes walk the sequence from where the last one
+# stopped.
+_SEQUENCE_KEY = "counter:index:sequence"
+_FLUSHED_KEY = "counter:index:flushed"
+_GAP_KEY = "counter:index:gap"
+_FLUSH_LOCK_KEY = "counter:flush:lock"
+_FLUSH_DUE_KEY = "counter:flush:due"
+_FLUSH_LOCK_TIMEOUT = 60
+
+
+def _policy():
+    return {**DEFAULTS, **getattr(settings, "COUNTER_BUFFER", {})}
+
+
+def _pending_key(kind, pk):
+    return f"counter:pending:{kind}:{pk}"
+
+
+def _index_key(sequence):
+    return f"counter:index:{sequence}"
+
+
+def _rate_key(kind, pk, window):
+    return f"counter:rate:{kind}:{pk}:{int(time.time() // window)}"
+
+
+def _register(kind, pk):
+    cache.add(_SEQUENCE_KEY, 0, timeout=None)
+    cache.set(_index_key(cache.incr(_SEQUENCE_KEY)), (kind, str(pk)), timeout=None)
+
+
+def _write(queryset, field, value):
+    # Move updated_at with the count so the list ETag/Last-Modified change.
+    # Queryset updates send no post_save, so drop cached list responses here,
+    # but at most once per FLUSH_INTERVAL per group: a like on every request
+    # must not empty the response cache on every request.
+    updated = queryset.update(**{field: value, "updated_at": timezone.now()})
+    if updated:
+        interval = _policy()["FLUSH_INTERVAL"]
+        for group in response_cache.groups_for(queryset.model):
+            if cache.add(f"counter:invalidated:{group}", 1, timeout=interval):
+                response_cache.invalidate(group)
+    return updated
+
+
+def _stored(kind, pk):
+    model, field = COUNTERS[kind]
+    return model.objects.filter(pk=pk).values_list(field, flat=True).first()
+
+
+def pending(kind, pk):
+    """Increments buffered for the object and not yet written to its row."""
+    return cache.get(_pending_key(kind, pk), 0)
+
+
+def increment(kind, pk):
+    """
+    Add one to the object's counter and return the new total, or ``None`` if
+    the object does not exist.
+
+    Cold objects are updated in place with an ``F()`` expression. Once an
+    object takes more than ``HOT_THRESHOLD`` increments in a rate window, the
+    rest of that window's increments go to a cache counter and reach the row
+    in one batched update per ``FLUSH_INTERVAL``.
+    """
+    model, field = COUNTERS[kind]
+    policy = _policy()
+    rate_key = _rate_key(kind, pk, policy["RATE_WINDOW"])
+
+    # The rate key only exists once an increment has hit a real row, so
+    # unknown ids are never buffered.
+    try:
+        rate = cache.incr(rate_key)
+    except ValueError:
+        rate = None
+
+    if rate is not None and rate > policy["HOT_THRESHOLD"]:
+        flush_if_due()
+        key = _pending_key(kind, pk)
+        cache.add(key, 0, timeout=None)
+        if cache.incr(key) == 1:
+            _register(kind, pk)
+        stored = _stored(kind, pk)
+        return None if stored is None else stored + pending(kind, pk)
+
+    queryset = model.objects.filter(pk=pk, **COUNTER_FILTERS.get(kind, {}))
+    if not _write(queryset, field, F(field) + 1):
+        return None
+    if rate is None:
+        cache.add(rate_key, 1, timeout=policy["RATE_WINDOW"] * 2)
+    return _stored(kind, pk) + pending(kind, pk)
+
+
+def flush_if_due():
+    if cache.add(_FLUSH_DUE_KEY, 1, timeout=_policy()["FLUSH_INTERVAL"]):
+        return flush()
+    return 0
+
+
+def _claim_index():
+    """(kind, pk) pairs registered since the last flush, advancing the pointer."""
+    flushed = cache.get(_FLUSHED_KEY, 0)
+    sequence = cache.get(_SEQUENCE_KEY, 0)
+    keys = [_index_key(number) for number in range(flushed + 1, sequence + 1)]
+    entries = cache.get_many(keys)
+
+    claimed = []
+    for number, key in enumerate(keys, start=flushed + 1):
+        if key not in entries:
+            # Usually a registration still in flight: stop here and pick it
+            # up next time. If the same entry is still missing then, it was
+            # evicted; skip it rather than stall the index.
+            if cache.get(_GAP_KEY) != number:
+                cache.set(_GAP_KEY, number, timeout=None)
+                break
+        else:
+            claimed.append(entries[key])
+        flushed = number
+    cache.set(_FLUSHED_KEY, flushed, timeout=None)
+    cache.delete_many(list(entries))
+    return claimed
+
+
+def flush():
+    """
+    Write every buffered increment back to its row, one UPDATE per counter
+    kind. Safe to call from any process; concurrent calls skip while one is
+    running. Returns the number of increments written.
+    """
+    if not cache.add(_FLUSH_LOCK_KEY, 1, timeout=_FLUSH_LOCK_TIMEOUT):
+        return 0
+    try:
+        by_kind = {}
+        for kind, pk in _claim_index():
+            by_kind.setdefault(kind, set()).add(pk)
+
+        written = 0
+        for kind, pks in by_kind.items():
+            model, field = COUNTERS[kind]
+            amounts = cache.get_many([_pending_key(kind, pk) for pk in pks])
+            deltas = {pk: amounts.get(_pending_key(kind, pk), 0) for pk in pks}
+            deltas = {pk: amount for pk, amount in deltas.items() if amount > 0}
+            if not deltas:
+                continue
+            try:
+                _write(model.objects.filter(pk__in=list(deltas)), field, Case(
+                    *[When(pk=pk, then=F(field) + amount) for pk, amount in deltas.items()],
+                    default=F(field),
+                    output_field=IntegerField(),
+                ))
+            except Exception:
+                # Keep the increments buffered for the next flush.
+                for pk in deltas:
+                    _register(kind, pk)
+                raise
+            # Subtract only what was written; increments buffered meanwhile
+            # stay and are listed again for the next flush.
+            for pk, amount in deltas.items():
+                try:
+                    if cache.decr(_pending_key(kind, pk), amount) > 0:
+                        _register(kind, pk)
+                except ValueError:
+                    pass
+            written += sum(deltas.values())
+        return written
+    finally:
+        cache.delete(_FLUSH_LOCK_KEY)
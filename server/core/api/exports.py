@@ -0,0 +1,67 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Export column -> ContributionIntent lookup. Flat values only, so rows come
+# straight off the cursor without building model instances.
+INTENT_COLUMNS = {
+    "id": "id",
+    "created_at": "created_at",
+    "status": "status",
+    "amount": "amount",
+    "purpose": "purpose",
+    "channel": "channel__name",
+    "channel_type": "channel__channel_type",
+    "donor_name": "donor_name",
+    "donor_phone": "donor_phone",
+    "reference": "reference",
+    "proof_url": "proof_url",
+    "confirmed_by": "confirmed_by__username",
+    "confirmed_at": "confirmed_at",
+    "admin_note": "admin_note",
+}
+
+CHUNK_SIZE = 2000
+
+# Spreadsheet apps run cells starting with these as formulas.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Echo:
+    """csv.writer target that hands each formatted line back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def intent_rows(queryset):
+    """
+    Yield one dict per intent. ``iterator()`` reads through a server-side
+    cursor on PostgreSQL, so memory stays flat however many rows match.
+    """
+    columns = list(INTENT_COLUMNS)
+    rows = queryset.values_list(*INTENT_COLUMNS.values()).iterator(chunk_size=CHUNK_SIZE)
+    for row in rows:
+        yield dict(zip(columns, row))
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    value = str(value)
+    return "'" + value if value.startswith(_FORMULA_PREFIXES) else value
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(list(INTENT_COLUMNS))
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row.values()])
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
@@ -0,0 +1,33 @@
+from rest_framework.filters import BaseFilterBackend
+
+
+class FieldFilterBackend(BaseFilterBackend):
+    """
+    Exact-match filtering on the fields a view lists in ``filterset_fields``,
+    e.g. ``?preacher=Pastor%20Obed&series__title=Grace``. Parameters not
+    listed there are ignored; blank values are skipped.
+    """
+
+    def get_filter_kwargs(self, request, view):
+        fields = getattr(view, 'filterset_fields', None) or ()
+        return {
+            field: request.query_params[field]
+            for field in fields
+            if request.query_params.get(field, '') != ''
+        }
+
+    def filter_queryset(self, request, queryset, view):
+        filters = self.get_filter_kwargs(request, view)
+        return queryset.filter(**filters) if filters else queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': field,
+                'required': False,
+                'in': 'query',
+                'description': f'Only rows whose {field.replace("__", " ")} is exactly this value.',
+                'schema': {'type': 'string'},
+            }
+            for field in getattr(view, 'filterset_fields', None) or ()
+        ]
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from api.counters import flush
+
+
+class Command(BaseCommand):
+    help = (
+        "Write like and reaction increments buffered in the cache back to their "
+        "rows. Requests flush on their own every COUNTER_BUFFER['FLUSH_INTERVAL'] "
+        "seconds while increments keep arriving; run this from cron or on "
+        "shutdown so the tail of a burst is written too. Buffers are only "
+        "visible across processes with a shared cache backend."
+    )
+
+    def handle(self, *args, **options):
+        written = flush()
+        self.stdout.write(self.style.SUCCESS(f"Flushed {written} buffered increments."))
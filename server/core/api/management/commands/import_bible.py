@@ -0,0 +1,72 @@
+import csv
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from api.bible_reference import canonical_book
+from api.models import BibleVerse
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a full Bible translation into the local verse store so passages "
+        "in that translation are served without calling the Bible API. Accepts "
+        "CSV with book,chapter,verse,text columns, or JSON holding a list of "
+        "such objects (or bible-api.com style {\"verses\": [...]})."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSON file to import.")
+        parser.add_argument(
+            "--translation",
+            required=True,
+            help="Translation code to store the verses under, e.g. kjv.",
+        )
+
+    def _read_rows(self, path):
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as handle:
+                if Path(path).suffix.lower() == ".json":
+                    data = json.load(handle)
+                    return data.get("verses", []) if isinstance(data, dict) else data
+                return list(csv.DictReader(handle))
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read {path}: {exc}") from exc
+
+    def _verses(self, rows, translation):
+        verses = []
+        for line, row in enumerate(rows, start=1):
+            name = row.get("book") or row.get("book_name")
+            book = canonical_book(str(name or ""))
+            if book is None:
+                raise CommandError(f"Row {line}: unknown book {name!r}.")
+            try:
+                chapter, verse = int(row["chapter"]), int(row["verse"])
+            except (KeyError, TypeError, ValueError) as exc:
+                raise CommandError(f"Row {line}: chapter and verse must be numbers.") from exc
+            verses.append(BibleVerse(
+                translation=translation,
+                book=book,
+                chapter=chapter,
+                verse=verse,
+                text=" ".join(str(row.get("text") or "").split()),
+            ))
+        return verses
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        translation = options["translation"].strip().lower()
+        verses = self._verses(self._read_rows(options["path"]), translation)
+        if not verses:
+            raise CommandError("No verses found to import.")
+
+        # Replace the whole translation so re-imports never leave stale verses.
+        BibleVerse.objects.filter(translation=translation).delete()
+        try:
+            BibleVerse.objects.bulk_create(verses, batch_size=1000)
+        except IntegrityError as exc:
+            raise CommandError(f"The file lists a verse more than once: {exc}") from exc
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {len(verses)} {translation} verses."))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from api.bible_cache import prune
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired Bible passages and evict the least recently used ones "
+        "beyond BIBLE_PASSAGE_CACHE['MAX_ROWS']. Safe to run repeatedly, e.g. nightly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-rows",
+            type=int,
+            help="Keep at most this many passages instead of the configured MAX_ROWS.",
+        )
+
+    def handle(self, *args, **options):
+        expired, evicted = prune(max_rows=options["max_rows"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Removed {expired} expired and {evicted} least recently used Bible passages."
+        ))
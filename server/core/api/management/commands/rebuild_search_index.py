@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from api.search_index import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the unified search documents from sermons, series, devotions, "
+        "events, reels, announcements and resources. Run once after migrating, "
+        "and after bulk imports that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        written = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {written} search documents."))
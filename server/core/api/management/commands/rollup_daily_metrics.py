@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from api.analytics import DAILY_METRICS, aggregate_metrics, rollup_daily_metrics
+from api.models import DailyMetric
+
+
+class Command(BaseCommand):
+    help = (
+        "Roll closed days up into the DailyMetric table used by the analytics "
+        "timeline and growth endpoints. Safe to run repeatedly, e.g. nightly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=3,
+            help="Also recount this many trailing closed days to pick up late edits (default 3).",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recount every day since the oldest record.",
+        )
+
+    def _earliest_day(self):
+        firsts = aggregate_metrics({
+            metric: (model, Min(field_name)) for metric, (model, field_name) in DAILY_METRICS.items()
+        })
+        days = [
+            timezone.localtime(value).date() if isinstance(value, datetime) else value
+            for value in firsts.values()
+            if value is not None
+        ]
+        return min(days) if days else None
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        # Today is still open; it is always counted live by the API.
+        end_date = timezone.localdate()
+        last_rolled = DailyMetric.objects.aggregate(day=Max("day"))["day"]
+
+        if options["rebuild"] or last_rolled is None:
+            DailyMetric.objects.all().delete()
+            start_date = self._earliest_day()
+        else:
+            start_date = min(
+                last_rolled + timedelta(days=1),
+                end_date - timedelta(days=max(options["days"], 0)),
+            )
+
+        if start_date is None or start_date >= end_date:
+            self.stdout.write("Daily metrics are up to date.")
+            return
+
+        written = 0
+        chunk_start = start_date
+        while chunk_start < end_date:
+            chunk_end = min(chunk_start + timedelta(days=90), end_date)
+            written += rollup_daily_metrics(chunk_start, chunk_end)
+            chunk_start = chunk_end
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rolled up {written} daily metric rows from {start_date} to {end_date - timedelta(days=1)}."
+        ))
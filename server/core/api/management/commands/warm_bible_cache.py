@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from api.bible_warmup import DEFAULT_TRANSLATION, devotion_references, warm_references
+from api.models import Devotion
+
+
+class Command(BaseCommand):
+    help = (
+        "Fetch every Bible passage quoted by a devotion into the passage cache, "
+        "so readers never wait on the Bible API. Already fresh passages are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--translation",
+            default=DEFAULT_TRANSLATION,
+            help=f"Translation to warm (default {DEFAULT_TRANSLATION}).",
+        )
+
+    def handle(self, *args, **options):
+        references = []
+        for devotion in Devotion.objects.only("Bible_verse").iterator(chunk_size=500):
+            references.extend(devotion_references(devotion))
+
+        cached, failed = warm_references(references, options["translation"].strip().lower())
+        self.stdout.write(self.style.SUCCESS(
+            f"{cached} devotion passages are cached; {failed} could not be fetched."
+        ))
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0020_resource_category_resource_description_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyMetric",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(help_text="Calendar day the count belongs to"),
+                ),
+                (
+                    "metric",
+                    models.CharField(
+                        help_text="Metric name, e.g. 'sermons'", max_length=50
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of records created on this day"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["day", "metric"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "metric"), name="unique_daily_metric"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,187 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:25
+
+import re
+
+from django.db import migrations, models
+
+
+# Frozen copy of api.bible_reference.reference_key as of this migration, so
+# later changes to the normaliser cannot change what this migration writes.
+
+BOOKS = {
+    "Genesis": ["gen", "ge", "gn"],
+    "Exodus": ["exod", "exo", "ex"],
+    "Leviticus": ["lev", "le", "lv"],
+    "Numbers": ["num", "nu", "nm", "nb"],
+    "Deuteronomy": ["deut", "dt"],
+    "Joshua": ["josh", "jos", "jsh"],
+    "Judges": ["judg", "jdg", "jg", "jdgs"],
+    "Ruth": ["rth", "ru"],
+    "1 Samuel": ["1sam", "1sa", "1sm"],
+    "2 Samuel": ["2sam", "2sa", "2sm"],
+    "1 Kings": ["1kgs", "1ki", "1kg"],
+    "2 Kings": ["2kgs", "2ki", "2kg"],
+    "1 Chronicles": ["1chron", "1chr", "1ch"],
+    "2 Chronicles": ["2chron", "2chr", "2ch"],
+    "Ezra": ["ezr"],
+    "Nehemiah": ["neh", "ne"],
+    "Esther": ["esth", "est", "es"],
+    "Job": ["jb"],
+    "Psalms": ["psalm", "ps", "psa", "pss", "psm"],
+    "Proverbs": ["prov", "pro", "prv", "pr"],
+    "Ecclesiastes": ["eccles", "eccl", "ecc", "qoh"],
+    "Song of Solomon": ["songofsongs", "song", "sos", "so", "canticles"],
+    "Isaiah": ["isa", "is"],
+    "Jeremiah": ["jer", "je", "jr"],
+    "Lamentations": ["lam", "la"],
+    "Ezekiel": ["ezek", "eze", "ezk"],
+    "Daniel": ["dan", "da", "dn"],
+    "Hosea": ["hos", "ho"],
+    "Joel": ["jl"],
+    "Amos": ["am"],
+    "Obadiah": ["obad", "ob"],
+    "Jonah": ["jnh", "jon"],
+    "Micah": ["mic", "mc"],
+    "Nahum": ["nah", "na"],
+    "Habakkuk": ["hab", "hb"],
+    "Zephaniah": ["zeph", "zep", "zp"],
+    "Haggai": ["hag", "hg"],
+    "Zechariah": ["zech", "zec", "zc"],
+    "Malachi": ["mal", "ml"],
+    "Matthew": ["matt", "mat", "mt"],
+    "Mark": ["mrk", "mar", "mk", "mr"],
+    "Luke": ["luk", "lk"],
+    "John": ["joh", "jhn", "jn"],
+    "Acts": ["act", "ac"],
+    "Romans": ["rom", "ro", "rm"],
+    "1 Corinthians": ["1cor", "1co"],
+    "2 Corinthians": ["2cor", "2co"],
+    "Galatians": ["gal", "ga"],
+    "Ephesians": ["eph", "ephes"],
+    "Philippians": ["phil", "php", "pp"],
+    "Colossians": ["col", "co"],
+    "1 Thessalonians": ["1thess", "1thes", "1th"],
+    "2 Thessalonians": ["2thess", "2thes", "2th"],
+    "1 Timothy": ["1tim", "1ti"],
+    "2 Timothy": ["2tim", "2ti"],
+    "Titus": ["tit", "ti"],
+    "Philemon": ["philem", "phm", "pm"],
+    "Hebrews": ["heb"],
+    "James": ["jas", "jm"],
+    "1 Peter": ["1pet", "1pe", "1pt", "1p"],
+    "2 Peter": ["2pet", "2pe", "2pt", "2p"],
+    "1 John": ["1jn", "1jhn", "1jo", "1j"],
+    "2 John": ["2jn", "2jhn", "2jo", "2j"],
+    "3 John": ["3jn", "3jhn", "3jo", "3j"],
+    "Jude": ["jud", "jd"],
+    "Revelation": ["rev", "re", "revelations"],
+}
+
+_ORDINALS = {"i": "1", "ii": "2", "iii": "3", "first": "1", "second": "2", "third": "3"}
+
+_ORDINAL = r"(?:(?P<ordinal>[123]|(?:iii|ii|i|first|second|third)(?=\s))\s*)?"
+_REFERENCE_RE = re.compile(
+    r"^" + _ORDINAL +
+    r"(?P<book>[a-z][a-z .]*?)\.?\s*"
+    r"(?P<location>\d[\d\s:.,\-–—]*)?$"
+)
+_BOOK_RE = re.compile(r"^" + _ORDINAL + r"(?P<book>[a-z][a-z .]*)$")
+_LOCATION_RE = re.compile(r"^\d+(?::\d+)?(?:-\d+(?::\d+)?)?(?:,\d+(?:-\d+)?)*$")
+
+
+def _alias(name):
+    return re.sub(r"[\s.]", "", name).lower()
+
+
+def _build_aliases():
+    aliases = {}
+    for canonical, extra in BOOKS.items():
+        for name in [canonical, *extra]:
+            aliases[_alias(name)] = canonical
+    return aliases
+
+
+_ALIASES = _build_aliases()
+_FULL_NAMES = {_alias(canonical): canonical for canonical in BOOKS}
+
+
+def _resolve_book(ordinal, book):
+    key = (_ORDINALS.get(ordinal, ordinal) or "") + _alias(book)
+    if key in _ALIASES:
+        return _ALIASES[key]
+    if len(key) - (1 if ordinal else 0) < 3:
+        return None
+    matches = {canonical for name, canonical in _FULL_NAMES.items() if name.startswith(key)}
+    return matches.pop() if len(matches) == 1 else None
+
+
+def canonical_reference(reference):
+    collapsed = " ".join((reference or "").split())
+    match = _REFERENCE_RE.match(collapsed.lower())
+    if match is None:
+        return collapsed
+
+    book = _resolve_book(match.group("ordinal"), match.group("book"))
+    if book is None:
+        return collapsed
+
+    location = match.group("location")
+    if not location:
+        return book
+    location = re.sub(r"(?<=\d)\.(?=\d)", ":", re.sub(r"\s+", "", location))
+    location = re.sub(r"[–—]", "-", location)
+    if not _LOCATION_RE.match(location):
+        return collapsed
+    return f"{book} {location}"
+
+
+def reference_key(reference):
+    return canonical_reference(reference).casefold()
+
+
+def populate_reference_keys(apps, schema_editor):
+    BiblePassageCache = apps.get_model("api", "BiblePassageCache")
+    seen = set()
+    duplicates = set()
+    passages = list(BiblePassageCache.objects.order_by("-fetched_at"))
+    for passage in passages:
+        passage.reference_key = reference_key(passage.reference)
+        if (passage.reference_key, passage.translation) in seen:
+            # Spellings of the same reference collapse to one key; keep the newest.
+            duplicates.add(passage.pk)
+        seen.add((passage.reference_key, passage.translation))
+    BiblePassageCache.objects.filter(pk__in=duplicates).delete()
+    BiblePassageCache.objects.bulk_update(
+        [passage for passage in passages if passage.pk not in duplicates],
+        ["reference_key"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0022_add_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="biblepassagecache",
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name="biblepassagecache",
+            name="reference_key",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="Normalised reference used for cache lookups, e.g. 'john 3:16'",
+                max_length=200,
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_reference_keys, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name="biblepassagecache",
+            unique_together={("reference_key", "translation")},
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0023_bible_reference_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BibleVerse",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "translation",
+                    models.CharField(
+                        help_text="Bible translation code, e.g. 'kjv'", max_length=50
+                    ),
+                ),
+                (
+                    "book",
+                    models.CharField(
+                        help_text="Canonical book name, e.g. 'John'", max_length=30
+                    ),
+                ),
+                (
+                    "chapter",
+                    models.PositiveSmallIntegerField(help_text="Chapter number"),
+                ),
+                ("verse", models.PositiveSmallIntegerField(help_text="Verse number")),
+                ("text", models.TextField(help_text="Verse text")),
+            ],
+            options={
+                "ordering": ["translation", "book", "chapter", "verse"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("translation", "book", "chapter", "verse"),
+                        name="unique_bible_verse",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["search_vector"], name="biblepassage_search_gin"
+)
+
+
+def create_search_index(apps, schema_editor):
+    # GIN and tsvector only exist on PostgreSQL; other backends keep the
+    # icontains fallback in BiblePassageSearch.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    BiblePassageCache = apps.get_model("api", "BiblePassageCache")
+    schema_editor.add_index(BiblePassageCache, INDEX)
+    BiblePassageCache.objects.update(
+        search_vector=SearchVector("reference", weight="A", config="english")
+        + SearchVector("passage_text", weight="B", config="english")
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.remove_index(apps.get_model("api", "BiblePassageCache"), INDEX)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0024_bibleverse"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="biblepassagecache",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text index of the reference and passage text (PostgreSQL only)",
+                null=True,
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="biblepassagecache", index=INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
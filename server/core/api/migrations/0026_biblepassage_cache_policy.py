@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:45
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0025_biblepassage_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="biblepassagecache",
+            name="hit_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of times this passage was served from the cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="biblepassagecache",
+            name="last_accessed_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="When the passage was last served; used for LRU eviction",
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:50
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def trigram_index(prefix, field):
+    return django.contrib.postgres.indexes.GinIndex(
+        django.contrib.postgres.indexes.OpClass(
+            django.db.models.functions.text.Upper(field), name="gin_trgm_ops"
+        ),
+        name=f"{prefix}_{field}_trgm",
+    )
+
+
+INDEXES = [
+    ("event", trigram_index("event", "name")),
+    ("event", trigram_index("event", "description")),
+    ("event", trigram_index("event", "location")),
+    ("gallery", trigram_index("gallery", "title")),
+    ("gallery", trigram_index("gallery", "description")),
+    ("gallery", trigram_index("gallery", "venue")),
+    ("galleryimage", trigram_index("galleryimage", "title")),
+    ("galleryimage", trigram_index("galleryimage", "description")),
+    ("reel", trigram_index("reel", "title")),
+    ("reel", trigram_index("reel", "caption")),
+    ("series", trigram_index("series", "title")),
+    ("series", trigram_index("series", "description")),
+    ("sermon", trigram_index("sermon", "title")),
+    ("sermon", trigram_index("sermon", "description")),
+    ("sermon", trigram_index("sermon", "preacher")),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # gin_trgm_ops only exists on PostgreSQL; other backends search unindexed.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, index in INDEXES:
+        schema_editor.add_index(apps.get_model("api", model_name), index)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, index in INDEXES:
+        schema_editor.remove_index(apps.get_model("api", model_name), index)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0026_biblepassage_cache_policy"),
+    ]
+
+    operations = [
+        # No-op outside PostgreSQL.
+        TrigramExtension(),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+            ],
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:52
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["search_vector"], name="searchdocument_vector_gin"
+)
+
+
+def create_search_index(apps, schema_editor):
+    # GIN and tsvector only exist on PostgreSQL; other backends search with
+    # icontains in UnifiedSearch.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.add_index(apps.get_model("api", "SearchDocument"), INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.remove_index(apps.get_model("api", "SearchDocument"), INDEX)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0027_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.CharField(
+                        choices=[
+                            ("sermon", "Sermon"),
+                            ("series", "Series"),
+                            ("devotion", "Devotion"),
+                            ("event", "Event"),
+                            ("reel", "Reel"),
+                            ("announcement", "Announcement"),
+                            ("resource", "Resource"),
+                        ],
+                        help_text="Kind of content the document indexes",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.UUIDField(help_text="Primary key of the indexed object"),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        help_text="Title shown in search results", max_length=300
+                    ),
+                ),
+                (
+                    "body",
+                    models.TextField(
+                        blank=True,
+                        help_text="Searchable text of the object, e.g. description and preacher",
+                    ),
+                ),
+                (
+                    "date",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Date of the content, used to order equally ranked results",
+                        null=True,
+                    ),
+                ),
+                (
+                    "is_public",
+                    models.BooleanField(
+                        default=True,
+                        help_text="Whether anonymous users may find this document",
+                    ),
+                ),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        editable=False,
+                        help_text="Full-text index of the title and body (PostgreSQL only)",
+                        null=True,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["-date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("content_type", "object_id"),
+                        name="unique_search_document",
+                    )
+                ],
+            },
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="searchdocument", index=INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0028_searchdocument"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="announcement",
+            index=models.Index(fields=["-date"], name="announcement_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="contributionchannel",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["display_order", "name"],
+                name="channel_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contributionintent",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="intent_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contributionintent",
+            index=models.Index(
+                fields=["status", "-created_at"], name="intent_status_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="devotion",
+            index=models.Index(fields=["-date"], name="devotion_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["date"], name="event_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="gallery",
+            index=models.Index(fields=["-date"], name="gallery_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="galleryimage",
+            index=models.Index(fields=["-date"], name="galleryimage_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="live_stream",
+            index=models.Index(fields=["-date"], name="live_stream_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="live_stream",
+            index=models.Index(
+                fields=["status", "-date"], name="live_stream_status_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="prayer_request",
+            index=models.Index(fields=["-date", "-id"], name="prayer_request_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reel",
+            index=models.Index(
+                fields=["-published_at", "-created_at", "-id"], name="reel_feed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reel",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["-published_at", "-created_at", "-id"],
+                name="reel_published_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reflection",
+            index=models.Index(fields=["-date", "-id"], name="reflection_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reflection",
+            index=models.Index(
+                fields=["devotion", "-date", "-id"], name="reflection_devotion_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="series",
+            index=models.Index(fields=["-date"], name="series_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="sermon",
+            index=models.Index(fields=["-date"], name="sermon_date_idx"),
+        ),
+    ]
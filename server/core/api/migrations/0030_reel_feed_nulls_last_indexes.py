@@ -0,0 +1,65 @@
+# Generated by Django 5.2.6 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+FEED_FIELDS = ["-published_at", "-created_at", "-id"]
+PUBLISHED = models.Q(("is_published", True))
+
+
+def feed_index(**kwargs):
+    return models.Index(
+        models.OrderBy(models.F("published_at"), descending=True, nulls_last=True),
+        models.OrderBy(models.F("created_at"), descending=True),
+        models.OrderBy(models.F("id"), descending=True),
+        **kwargs,
+    )
+
+
+OLD_INDEXES = [
+    models.Index(fields=FEED_FIELDS, name="reel_feed_idx"),
+    models.Index(fields=FEED_FIELDS, condition=PUBLISHED, name="reel_published_feed_idx"),
+]
+NEW_INDEXES = [
+    feed_index(name="reel_feed_idx"),
+    feed_index(condition=PUBLISHED, name="reel_published_feed_idx"),
+]
+
+
+def _swap(schema_editor, model, old, new):
+    # NULLS LAST in an index is PostgreSQL-only; elsewhere keep the plain
+    # column index under the same name.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index in old:
+        schema_editor.remove_index(model, index)
+    for index in new:
+        schema_editor.add_index(model, index)
+
+
+def use_nulls_last(apps, schema_editor):
+    _swap(schema_editor, apps.get_model("api", "reel"), OLD_INDEXES, NEW_INDEXES)
+
+
+def use_plain_order(apps, schema_editor):
+    _swap(schema_editor, apps.get_model("api", "reel"), NEW_INDEXES, OLD_INDEXES)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0029_list_view_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(model_name="reel", name="reel_feed_idx"),
+                migrations.RemoveIndex(model_name="reel", name="reel_published_feed_idx"),
+            ]
+            + [migrations.AddIndex(model_name="reel", index=index) for index in NEW_INDEXES],
+            database_operations=[
+                migrations.RunPython(use_nulls_last, use_plain_order),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0030_reel_feed_nulls_last_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="reel",
+            options={
+                "ordering": [
+                    models.OrderBy(
+                        models.F("published_at"), descending=True, nulls_last=True
+                    ),
+                    "-created_at",
+                ]
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-18 15:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0031_reel_ordering_nulls_last"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="biblepassagecache",
+            index=models.Index(
+                fields=["reference_key"],
+                name="biblepassage_ref_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -1,8 +1,22 @@
-from django.db import models
+from django.db import connections, models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db.models.functions import Upper
+from django.utils import timezone
 import uuid
 from datetime import datetime
+from .bible_reference import reference_key
+
+
+def trigram_indexes(prefix, *fields):
+    # icontains (and so ?search=) compiles to UPPER("col"::text) LIKE on
+    # PostgreSQL; a trigram GIN index on the same expression serves it.
+    return [
+        GinIndex(OpClass(Upper(field), name='gin_trgm_ops'), name=f'{prefix}_{field}_trgm')
+        for field in fields
+    ]
 
 class Sermon(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -16,6 +30,12 @@ class Sermon(models.Model):
     likes = models.IntegerField(default=0, help_text="Number of likes for this reflection")
     comments = models.TextField(blank=True, help_text="Comments on the reflection")
     date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date'], name='sermon_date_idx'),
+        ] + trigram_indexes('sermon', 'title', 'description', 'preacher')
     
     def __str__(self):
         return self.title
@@ -29,6 +49,7 @@ class Resource(models.Model):
     description = models.TextField(blank=True, default="", help_text="Enter a description of the resource")
     image_url = models.URLField(blank=True, default="", help_text="Enter an image URL for the resource")
     is_available = models.BooleanField(default=True, help_text="Whether the resource is currently available for purchase")
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -42,10 +63,14 @@ class Series(models.Model):
     likes = models.IntegerField(default=0, help_text="Number of likes for this Series")
     thoughts=models.ManyToManyField('Reflection', related_name='series_thoughts', blank=True, help_text="Add thoughts on this series")
     date = models.DateTimeField(auto_now_add=True, help_text="Date the series was created")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Series"
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['-date'], name='series_date_idx'),
+        ] + trigram_indexes('series', 'title', 'description')
 
     def __str__(self):
         return self.title
@@ -61,6 +86,12 @@ class Event(models.Model):
     start_time = models.TimeField(null=True, blank=True, help_text="Enter the start time of the event")
     end_time = models.TimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['date'], name='event_date_idx'),
+        ] + trigram_indexes('event', 'name', 'description', 'location')
 
     def __str__(self):
         return self.name
@@ -74,6 +105,12 @@ class Devotion(models.Model):
     thumbnail = models.URLField(blank=True, null=True, help_text="Enter a thumbnail URL for the devotional")
     #reflection = models.ManyToManyField('Reflection', related_name='devotion_reflections', blank=True, help_text="Add reflections for this devotional")
     date = models.DateTimeField(default=datetime.now, help_text="Date the devotional was created")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date'], name='devotion_date_idx'),
+        ]
     
 
     def __str__(self):
@@ -84,19 +121,61 @@ class Devotion(models.Model):
 class BiblePassageCache(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     reference = models.CharField(max_length=200, help_text="Bible reference, e.g. 'John 3:16'")
+    reference_key = models.CharField(max_length=200, editable=False, help_text="Normalised reference used for cache lookups, e.g. 'john 3:16'")
     translation = models.CharField(max_length=50, default='kjv', help_text="Bible translation code, e.g. 'kjv'")
     passage_text = models.TextField(blank=True, help_text="The fetched Bible passage text")
     raw_response = models.JSONField(default=dict, blank=True, help_text="Raw response returned from the Bible API")
     fetched_at = models.DateTimeField(auto_now=True, help_text="Timestamp when the passage was last fetched")
+    hit_count = models.PositiveIntegerField(default=0, editable=False, help_text="Number of times this passage was served from the cache")
+    last_accessed_at = models.DateTimeField(default=timezone.now, db_index=True, editable=False, help_text="When the passage was last served; used for LRU eviction")
+    search_vector = SearchVectorField(null=True, editable=False, help_text="Full-text index of the reference and passage text (PostgreSQL only)")
 
     class Meta:
-        unique_together = ('reference', 'translation')
+        unique_together = ('reference_key', 'translation')
         ordering = ['-fetched_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='biblepassage_search_gin'),
+            # LIKE 'john 3:%' prefix lookups; the unique index only serves
+            # them under the C collation.
+            models.Index(fields=['reference_key'], name='biblepassage_ref_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ]
+
+    @staticmethod
+    def search_vector_expression():
+        return (
+            SearchVector('reference', weight='A', config='english')
+            + SearchVector('passage_text', weight='B', config='english')
+        )
+
+    def save(self, *args, **kwargs):
+        self.reference_key = reference_key(self.reference)
+        super().save(*args, **kwargs)
+        if connections[self._state.db].vendor == 'postgresql':
+            BiblePassageCache.objects.using(self._state.db).filter(pk=self.pk).update(
+                search_vector=self.search_vector_expression()
+            )
 
     def __str__(self):
         return f"{self.reference} ({self.translation})"
 
 
+class BibleVerse(models.Model):
+    translation = models.CharField(max_length=50, help_text="Bible translation code, e.g. 'kjv'")
+    book = models.CharField(max_length=30, help_text="Canonical book name, e.g. 'John'")
+    chapter = models.PositiveSmallIntegerField(help_text="Chapter number")
+    verse = models.PositiveSmallIntegerField(help_text="Verse number")
+    text = models.TextField(help_text="Verse text")
+
+    class Meta:
+        ordering = ['translation', 'book', 'chapter', 'verse']
+        constraints = [
+            models.UniqueConstraint(fields=['translation', 'book', 'chapter', 'verse'], name='unique_bible_verse')
+        ]
+
+    def __str__(self):
+        return f"{self.book} {self.chapter}:{self.verse} ({self.translation})"
+
+
 class Reflection(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200, help_text="Enter your name here")
@@ -112,6 +191,14 @@ class Reflection(models.Model):
         help_text="Select the devotion this reflection belongs to"
     )
     date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date', '-id'], name='reflection_date_idx'),
+            # Per-devotion listing and the devotion preview window.
+            models.Index(fields=['devotion', '-date', '-id'], name='reflection_devotion_date_idx'),
+        ]
 
     def __str__(self):
         return self.content[:10] + '...' if len(self.content) > 10 else self.content
@@ -123,6 +210,12 @@ class Prayer_request(models.Model):
     phone_contact = models.CharField(max_length=30, blank=True, help_text="Optional phone number for follow-up")
     subject = models.TextField(help_text="Enter the content of your prayer request")
     date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date', '-id'], name='prayer_request_date_idx'),
+        ]
 
     def __str__(self):
         return self.subject
@@ -132,6 +225,12 @@ class Announcement(models.Model):
     title = models.CharField(max_length=200, help_text="Enter the title of the announcement")
     content = models.TextField(help_text="Enter the content of the announcement")
     date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date'], name='announcement_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -151,6 +250,13 @@ class Live_stream(models.Model):
     reactions = models.IntegerField(default=0, help_text="Number of reactions for this live stream")
     comments = models.TextField(blank=True, help_text="Comments on the live stream")
     date = models.DateTimeField(auto_now_add=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date'], name='live_stream_date_idx'),
+            models.Index(fields=['status', '-date'], name='live_stream_status_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -163,10 +269,14 @@ class Gallery(models.Model):
     venue = models.CharField(max_length=300, help_text="Enter the venue where the images were taken", blank=True)
     likes = models.IntegerField(default=0, help_text="Number of likes for this gallery")
     date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-date']
         verbose_name_plural = "Galleries"
+        indexes = [
+            models.Index(fields=['-date'], name='gallery_date_idx'),
+        ] + trigram_indexes('gallery', 'title', 'description', 'venue')
 
     def __str__(self):
         return self.title
@@ -181,6 +291,12 @@ class GalleryImage(models.Model):
     venue = models.CharField(max_length=300, help_text="Enter the venue where the image was taken", blank=True)
     likes = models.IntegerField(default=0, help_text="Number of likes for this gallery image")
     date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-date'], name='galleryimage_date_idx'),
+        ] + trigram_indexes('galleryimage', 'title', 'description')
 
     def __str__(self):
         return self.title
@@ -209,6 +325,14 @@ class ContributionChannel(models.Model):
 
     class Meta:
         ordering = ['display_order', 'name']
+        indexes = [
+            # Only active channels are listed publicly.
+            models.Index(
+                fields=['display_order', 'name'],
+                condition=models.Q(is_active=True),
+                name='channel_active_order_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.channel_type.upper()})"
@@ -251,6 +375,10 @@ class ContributionIntent(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='intent_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='intent_status_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.channel.name} - {self.amount} ({self.status})"
@@ -278,12 +406,94 @@ class Reel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-published_at', '-created_at']
+        # Unpublished drafts (no published_at) last, as in the cursor feed.
+        ordering = [models.F('published_at').desc(nulls_last=True), '-created_at']
+        indexes = [
+            # Same NULLS LAST order as the feed, so PostgreSQL can walk the
+            # index instead of sorting (plain DESC puts NULLs first there).
+            models.Index(
+                models.F('published_at').desc(nulls_last=True),
+                models.F('created_at').desc(),
+                models.F('id').desc(),
+                name='reel_feed_idx',
+            ),
+            # The public feed only ever reads published reels.
+            models.Index(
+                models.F('published_at').desc(nulls_last=True),
+                models.F('created_at').desc(),
+                models.F('id').desc(),
+                condition=models.Q(is_published=True),
+                name='reel_published_feed_idx',
+            ),
+        ] + trigram_indexes('reel', 'title', 'caption')
 
     def __str__(self):
         return self.title
 
 
+class DailyMetric(models.Model):
+    day = models.DateField(help_text="Calendar day the count belongs to")
+    metric = models.CharField(max_length=50, help_text="Metric name, e.g. 'sermons'")
+    count = models.PositiveIntegerField(default=0, help_text="Number of records created on this day")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['day', 'metric']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'metric'], name='unique_daily_metric')
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.metric}: {self.count}"
+
+
+class SearchDocument(models.Model):
+    CONTENT_TYPES = [
+        ('sermon', 'Sermon'),
+        ('series', 'Series'),
+        ('devotion', 'Devotion'),
+        ('event', 'Event'),
+        ('reel', 'Reel'),
+        ('announcement', 'Announcement'),
+        ('resource', 'Resource'),
+    ]
+
+    content_type = models.CharField(max_length=20, choices=CONTENT_TYPES, help_text="Kind of content the document indexes")
+    object_id = models.UUIDField(help_text="Primary key of the indexed object")
+    title = models.CharField(max_length=300, help_text="Title shown in search results")
+    body = models.TextField(blank=True, help_text="Searchable text of the object, e.g. description and preacher")
+    date = models.DateTimeField(null=True, blank=True, help_text="Date of the content, used to order equally ranked results")
+    is_public = models.BooleanField(default=True, help_text="Whether anonymous users may find this document")
+    search_vector = SearchVectorField(null=True, editable=False, help_text="Full-text index of the title and body (PostgreSQL only)")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='unique_search_document')
+        ]
+        indexes = [
+            GinIndex(fields=['search_vector'], name='searchdocument_vector_gin'),
+        ]
+
+    @staticmethod
+    def search_vector_expression():
+        return (
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('body', weight='B', config='english')
+        )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if connections[self._state.db].vendor == 'postgresql':
+            SearchDocument.objects.using(self._state.db).filter(pk=self.pk).update(
+                search_vector=self.search_vector_expression()
+            )
+
+    def __str__(self):
+        return f"{self.content_type}: {self.title}"
+
+
 class SiteSettings(models.Model):
     id = models.PositiveSmallIntegerField(primary_key=True, default=1, editable=False)
     church_name = models.CharField(max_length=120, default="Grace Cathedral")
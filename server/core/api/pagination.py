@@ -0,0 +1,152 @@
+import base64
+import json
+from collections import OrderedDict
+from datetime import date, datetime
+from uuid import UUID
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPaginationMixin:
+    """
+    Opt-in keyset ("cursor") pagination layered over page-number pagination.
+
+    Requests that carry ``?cursor=`` (empty for the first page) are ordered by
+    the view's ``cursor_ordering``, e.g. ``('-created_at', '-id')``, and each
+    page filters past the last row of the previous one. There is no OFFSET
+    scan and no COUNT(*), so page cost stays flat however deep a client
+    scrolls. Requests without ``cursor`` keep the regular ``?page=`` behaviour.
+    NULL keys sort last in both directions.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, 'cursor_ordering', None)
+        self.use_cursor = bool(ordering) and self.cursor_query_param in request.query_params
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        keys = self._cursor_keys(queryset.model, ordering)
+        rows = list(self.cursor_queryset(queryset, request, view)[:page_size + 1])
+        self.next_position = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_position = [getattr(rows[-1], field) for field, _, _ in keys]
+        return rows
+
+    def cursor_queryset(self, queryset, request, view):
+        """``queryset`` in cursor order, starting after the requested cursor."""
+        model = queryset.model
+        keys = self._cursor_keys(model, view.cursor_ordering)
+        # NULLS LAST only where a key can be NULL: on NOT NULL keys it changes
+        # nothing but stops PostgreSQL from walking a plain DESC index.
+        queryset = queryset.order_by(*[
+            (F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True))
+            if nullable else (F(field).desc() if descending else F(field).asc())
+            for field, descending, nullable in keys
+        ])
+
+        position = self._decode_cursor(request, model, keys)
+        if position is not None:
+            queryset = queryset.filter(self._after(keys, position))
+        return queryset
+
+    def _cursor_keys(self, model, ordering):
+        return [
+            (name.lstrip('-'), name.startswith('-'), model._meta.get_field(name.lstrip('-')).null)
+            for name in ordering
+        ]
+
+    def _after(self, keys, position):
+        """Build the filter for rows strictly after ``position`` in key order."""
+        (field, descending, nullable), rest = keys[0], keys[1:]
+        value = position[0]
+        tail = self._after(rest, position[1:]) if rest else None
+
+        if value is None:
+            # Only other NULLs follow a NULL; they are ordered by the remaining keys.
+            if tail is None:
+                return Q(pk__in=[])
+            return Q(**{f'{field}__isnull': True}) & tail
+
+        condition = Q(**{f"{field}__{'lt' if descending else 'gt'}": value})
+        if nullable:
+            condition |= Q(**{f'{field}__isnull': True})
+        if tail is not None:
+            condition |= Q(**{field: value}) & tail
+        return condition
+
+    def _encode_cursor(self, position):
+        values = [
+            value.isoformat() if isinstance(value, (date, datetime))
+            else str(value) if isinstance(value, UUID)
+            else value
+            for value in position
+        ]
+        return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+    def _decode_cursor(self, request, model, keys):
+        encoded = request.query_params.get(self.cursor_query_param, '')
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            if not isinstance(values, list) or len(values) != len(keys):
+                raise ValueError
+            return [
+                None if value is None else model._meta.get_field(field).to_python(value)
+                for (field, _, _), value in zip(keys, values)
+            ]
+        except (TypeError, ValueError, UnicodeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self._encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+
+class StandardPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class LargePagination(StandardPagination):
+    page_size = 20
+
+
+class ConfigPagination(StandardPagination):
+    page_size = 50
+    max_page_size = 200
+
+
+class SectionConfigPagination(ConfigPagination):
+    page_size = 100
+
+
+class FeedPagination(KeysetPaginationMixin, StandardPagination):
+    pass
+
+
+class LargeFeedPagination(FeedPagination):
+    page_size = 20
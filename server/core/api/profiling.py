@@ -0,0 +1,161 @@
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+DEFAULTS = {
+    'ENABLED': False,
+    # Wall times kept per endpoint for the percentile figures.
+    'SAMPLE_SIZE': 200,
+    # Duplicated-query fingerprints reported per endpoint.
+    'TOP_DUPLICATES': 5,
+}
+
+_IN_LIST_RE = re.compile(r'\bIN \((?:%s, )*%s\)', re.IGNORECASE)
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _policy():
+    return {**DEFAULTS, **getattr(settings, 'REQUEST_PROFILING', {})}
+
+
+def fingerprint(sql):
+    """SQL with literals and IN-list lengths folded, so repeats of one query compare equal."""
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    sql = _LITERAL_RE.sub('?', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class RequestProfile:
+    """Timings for one request, filled in by the database execute wrapper."""
+
+    def __init__(self):
+        self.db_ms = 0.0
+        self.queries = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - started) * 1000
+            self.queries[fingerprint(sql)] += 1
+
+    @property
+    def query_count(self):
+        return sum(self.queries.values())
+
+    @property
+    def duplicates(self):
+        return {sql: count for sql, count in self.queries.items() if count > 1}
+
+
+class ProfileStats:
+    """Per-endpoint aggregates for this process, safe to update from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, wall_ms, profile):
+        policy = _policy()
+        with self._lock:
+            entry = self._endpoints.get(endpoint)
+            if entry is None:
+                entry = self._endpoints[endpoint] = {
+                    'requests': 0,
+                    'wall_ms_total': 0.0,
+                    'wall_ms_max': 0.0,
+                    'db_ms_total': 0.0,
+                    'queries_total': 0,
+                    'queries_max': 0,
+                    'samples': deque(maxlen=policy['SAMPLE_SIZE']),
+                    'duplicates': Counter(),
+                }
+            entry['requests'] += 1
+            entry['wall_ms_total'] += wall_ms
+            entry['wall_ms_max'] = max(entry['wall_ms_max'], wall_ms)
+            entry['db_ms_total'] += profile.db_ms
+            entry['queries_total'] += profile.query_count
+            entry['queries_max'] = max(entry['queries_max'], profile.query_count)
+            entry['samples'].append(wall_ms)
+            entry['duplicates'].update(profile.duplicates)
+
+    def snapshot(self):
+        top = _policy()['TOP_DUPLICATES']
+        with self._lock:
+            endpoints = {name: dict(entry, samples=list(entry['samples']), duplicates=entry['duplicates'].most_common(top))
+                         for name, entry in self._endpoints.items()}
+        rows = []
+        for name, entry in endpoints.items():
+            requests = entry['requests']
+            rows.append({
+                'endpoint': name,
+                'requests': requests,
+                'wall_ms_total': round(entry['wall_ms_total'], 2),
+                'wall_ms_avg': round(entry['wall_ms_total'] / requests, 2),
+                'wall_ms_p50': round(_percentile(entry['samples'], 0.5), 2),
+                'wall_ms_p95': round(_percentile(entry['samples'], 0.95), 2),
+                'wall_ms_max': round(entry['wall_ms_max'], 2),
+                'db_ms_avg': round(entry['db_ms_total'] / requests, 2),
+                'queries_avg': round(entry['queries_total'] / requests, 2),
+                'queries_max': entry['queries_max'],
+                'duplicate_queries': [{'sql': sql, 'count': count} for sql, count in entry['duplicates']],
+            })
+        # Endpoints that cost the most time overall come first.
+        return sorted(rows, key=lambda row: row['wall_ms_total'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+stats = ProfileStats()
+
+
+def _endpoint(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return f'{request.method} <unresolved>'
+    return f'{request.method} {match.view_name or match.route}'
+
+
+class RequestProfilingMiddleware:
+    """
+    Times every request and its SQL, adds a ``Server-Timing`` header and feeds
+    ``stats``. Enabled with ``REQUEST_PROFILING['ENABLED']``; otherwise Django
+    drops it from the chain at startup.
+    """
+
+    def __init__(self, get_response):
+        if not _policy()['ENABLED']:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(profile))
+            response = self.get_response(request)
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        stats.record(_endpoint(request), wall_ms, profile)
+        response['Server-Timing'] = (
+            f'app;dur={wall_ms:.1f}, '
+            f'db;dur={profile.db_ms:.1f};desc="{profile.query_count} queries", '
+            f'dupes;desc="{sum(profile.duplicates.values())} duplicated queries"'
+        )
+        return response
@@ -0,0 +1,109 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+
+from .models import Announcement, Devotion, Event, Reel, Reflection, Resource, Sermon
+
+DEFAULTS = {
+    'ENABLED': True,
+    # Signals invalidate a group at once in a shared cache (e.g. Redis); the
+    # timeout bounds staleness for per-process local-memory caches and for
+    # writes that skip signals, such as like counters.
+    'TIMEOUT': 60,
+}
+
+# Cache group -> models whose writes change the group's responses.
+GROUPS = {
+    'sermons': (Sermon, Resource),
+    'events': (Event,),
+    'devotions': (Devotion, Reflection),
+    'announcements': (Announcement,),
+    'reels': (Reel,),
+}
+
+# Response headers replayed from the cache.
+STORED_HEADERS = ('ETag',)
+
+
+def _policy():
+    return {**DEFAULTS, **getattr(settings, 'RESPONSE_CACHE', {})}
+
+
+def _version_key(group):
+    return f'response-cache:{group}:version'
+
+
+def _version(group):
+    # Bumping the version orphans every cached page of the group in one write;
+    # the orphans age out on their own. Works on any cache backend.
+    return cache.get_or_set(_version_key(group), time.time_ns, None)
+
+
+def invalidate(group):
+    cache.set(_version_key(group), time.time_ns(), None)
+
+
+def groups_for(model):
+    return [group for group, models in GROUPS.items() if model in models]
+
+
+class CachedResponseMixin:
+    """
+    Serve repeated GETs of a list view from the shared cache, keyed on the
+    absolute URL (scheme, host, path and query string), staff/public role and response format. Writes to any model
+    in ``GROUPS[response_cache_group]`` invalidate the group through signals.
+    Goes before ``ConditionalGetMixin``: while caching is on, the ETag is a
+    hash of the rendered body, so neither hits nor misses run its validator
+    query.
+    """
+    response_cache_group = None
+
+    def _response_cache_key(self, request):
+        role = 'staff' if request.user.is_authenticated and request.user.is_staff else 'public'
+        # Absolute: responses embed build_absolute_uri() links, so a request
+        # with a forged Host must not fill the entry other hosts read.
+        path = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+        fmt = request.accepted_renderer.format
+        version = _version(self.response_cache_group)
+        return f'response-cache:{self.response_cache_group}:{version}:{role}:{fmt}:{path}'
+
+    def uses_validator_query(self):
+        return not _policy()['ENABLED']
+
+    def get(self, request, *args, **kwargs):
+        if not _policy()['ENABLED']:
+            return super().get(request, *args, **kwargs)
+
+        key = self._response_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code == 200:
+                response.add_post_render_callback(lambda rendered: self._store(request, key, rendered))
+            response['X-Cache'] = 'MISS'
+            return response
+
+        headers = dict(entry['headers'])
+        not_modified = get_conditional_response(request, etag=headers.get('ETag'))
+        response = not_modified or HttpResponse(entry['content'], content_type=entry['content_type'])
+        for name, value in headers.items():
+            response[name] = value
+        response['X-Cache'] = 'HIT'
+        return response
+
+    def _store(self, request, key, response):
+        response['ETag'] = '"%s"' % hashlib.md5(response.content).hexdigest()
+        cache.set(key, {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'headers': [(name, response[name]) for name in STORED_HEADERS if response.has_header(name)],
+        }, _policy()['TIMEOUT'])
+        # A miss can still answer a matching If-None-Match.
+        not_modified = get_conditional_response(request, etag=response['ETag'], response=response)
+        if not_modified is not None:
+            not_modified['X-Cache'] = 'MISS'
+        return not_modified
@@ -0,0 +1,117 @@
+from datetime import datetime, time
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .bible_warmup import devotion_references
+from .models import Announcement, Devotion, Event, Reel, Resource, SearchDocument, Sermon, Series
+
+
+def _aware(value):
+    # Event.date is a DateField and Devotion.date may be naive.
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def _join(*parts):
+    return "\n".join(str(part) for part in parts if part)
+
+
+def _sermon(sermon):
+    return {"title": sermon.title, "body": _join(sermon.description, sermon.preacher), "date": sermon.date}
+
+
+def _series(series):
+    return {"title": series.title, "body": series.description, "date": series.date}
+
+
+def _devotion(devotion):
+    return {
+        "title": devotion.title,
+        "body": _join("; ".join(devotion_references(devotion)), devotion.content),
+        "date": devotion.date,
+    }
+
+
+def _event(event):
+    return {"title": event.name, "body": _join(event.description, event.location), "date": event.date}
+
+
+def _reel(reel):
+    return {
+        "title": reel.title,
+        "body": _join(reel.caption, reel.category),
+        "date": reel.published_at or reel.created_at,
+        "is_public": reel.is_published,
+    }
+
+
+def _announcement(announcement):
+    return {"title": announcement.title, "body": announcement.content, "date": announcement.date}
+
+
+def _resource(resource):
+    return {"title": resource.name, "body": _join(resource.category, resource.description), "date": None}
+
+
+# Indexed model -> (SearchDocument.content_type, builder of the document fields).
+SOURCES = {
+    Sermon: ("sermon", _sermon),
+    Series: ("series", _series),
+    Devotion: ("devotion", _devotion),
+    Event: ("event", _event),
+    Reel: ("reel", _reel),
+    Announcement: ("announcement", _announcement),
+    Resource: ("resource", _resource),
+}
+
+# content_type -> (detail URL name, its kwarg) for linking results.
+DETAIL_URLS = {
+    "sermon": ("sermon-detail", "sermon_id"),
+    "series": ("series-detail", "series_id"),
+    "devotion": ("devotion-detail", "devotion_id"),
+    "event": ("event-detail", "event_id"),
+    "reel": ("reel-detail", "reel_id"),
+    "announcement": ("announcement-detail", "announcement_id"),
+    "resource": ("resource-detail", "resource_id"),
+}
+
+
+def _fields(instance):
+    content_type, build = SOURCES[type(instance)]
+    fields = {"is_public": True, **build(instance)}
+    fields["date"] = _aware(fields["date"])
+    return content_type, fields
+
+
+def index_instance(instance):
+    """Create or refresh the search document of one saved object."""
+    content_type, fields = _fields(instance)
+    SearchDocument.objects.update_or_create(content_type=content_type, object_id=instance.pk, defaults=fields)
+
+
+def remove_instance(instance):
+    content_type, _ = SOURCES[type(instance)]
+    SearchDocument.objects.filter(content_type=content_type, object_id=instance.pk).delete()
+
+
+@transaction.atomic
+def rebuild():
+    """
+    Recreate every search document from the source tables. Needed after bulk
+    writes (``bulk_create``, ``QuerySet.update``) that skip the signals.
+    Returns the number of documents written.
+    """
+    SearchDocument.objects.all().delete()
+    documents = []
+    for model in SOURCES:
+        for instance in model.objects.iterator(chunk_size=500):
+            content_type, fields = _fields(instance)
+            documents.append(SearchDocument(content_type=content_type, object_id=instance.pk, **fields))
+    SearchDocument.objects.bulk_create(documents, batch_size=500)
+    if connection.vendor == "postgresql":
+        SearchDocument.objects.update(search_vector=SearchDocument.search_vector_expression())
+    return len(documents)
@@ -1,6 +1,9 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from django.utils import timezone
+from django.db import transaction
+from django.db.models import Count, F, Prefetch, Window
+from django.db.models.functions import Lag, Lead, RowNumber
 from decimal import Decimal
 from .models import (
     Sermon,
@@ -23,7 +26,9 @@ from .models import (
     NavigationItem,
     PageConfig,
     SectionConfig,
+    SearchDocument,
 )
+from .search_index import DETAIL_URLS
 from datetime import date
 from django.urls import reverse
 from django.contrib.auth import get_user_model
@@ -48,6 +53,16 @@ class BiblePassageSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'translation', 'passage_text', 'raw_response', 'fetched_at']
 
 
+class BiblePassageLookupSerializer(serializers.Serializer):
+    reference = serializers.CharField(max_length=200, help_text="Bible reference, e.g. 'John 3:16'")
+    translation = serializers.CharField(max_length=50, required=False, allow_blank=True, help_text="Translation code; defaults to the batch translation")
+
+
+class BiblePassageBatchSerializer(serializers.Serializer):
+    translation = serializers.CharField(max_length=50, required=False, default='kjv', help_text="Translation for passages that do not name one. Default is kjv.")
+    passages = BiblePassageLookupSerializer(many=True, allow_empty=False, max_length=50, help_text="Up to 50 passages, returned in the same order")
+
+
 class ReflectionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Reflection
@@ -74,42 +89,47 @@ class SermonSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'date', 'resource_details', 'next_sermon', 'previous_sermon']
         
+    def _sermon_url(self, sermon_id):
+        if not sermon_id:
+            return None
+        url = reverse('sermon-detail', kwargs={'sermon_id': sermon_id})
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(url)
+        return url
+
     @extend_schema_field(serializers.URLField(allow_null=True))
     def get_next_sermon(self, obj):
-        series = self.context.get('series')
-        if not series:
-            return None
-        sermons = list(series.sermon_series.order_by('date'))
-        try:
-            index = sermons.index(obj)
-            if index < len(sermons) - 1:
-                next_obj = sermons[index + 1]
-                request = self.context.get('request')
-                if request:
-                    return request.build_absolute_uri(reverse('sermon-detail', kwargs={'sermon_id': next_obj.id}))
-                return reverse('sermon-detail', kwargs={'sermon_id': next_obj.id})
-        except ValueError:
-            pass
-        return None
+        # Neighbours are annotated by with_series_neighbours(); plain sermon
+        # querysets have no series ordering to walk.
+        return self._sermon_url(getattr(obj, 'next_sermon_id', None))
 
     @extend_schema_field(serializers.URLField(allow_null=True))
     def get_previous_sermon(self, obj):
-        series = self.context.get('series')
-        if not series:
-            return None
-        sermons = list(series.sermon_series.order_by('date'))
-        try:
-            index = sermons.index(obj)
-            if index > 0:
-                prev_obj = sermons[index - 1]
-                request = self.context.get('request')
-                if request:
-                    return request.build_absolute_uri(reverse('sermon-detail', kwargs={'sermon_id': prev_obj.id}))
-                return reverse('sermon-detail', kwargs={'sermon_id': prev_obj.id})
-        except ValueError:
-            pass
-        return None
-    
+        return self._sermon_url(getattr(obj, 'previous_sermon_id', None))
+
+
+def with_series_neighbours(queryset):
+    """Annotate each sermon with the ids of its neighbours inside its series."""
+    window = {'partition_by': [F('series_id')], 'order_by': [F('date').asc(), F('id').asc()]}
+    return queryset.annotate(
+        previous_sermon_id=Window(Lag('id'), **window),
+        next_sermon_id=Window(Lead('id'), **window),
+    ).order_by('date', 'id')
+
+
+def with_available_sermons(queryset):
+    """Prefetch every series' thoughts and sermons, with neighbour links and resources."""
+    return queryset.prefetch_related(
+        'thoughts',
+        Prefetch(
+            'sermon_series',
+            queryset=with_series_neighbours(Sermon.objects.select_related('resource')),
+            to_attr='available_sermon_list',
+        ),
+    )
+
+
 class SeriesSerializer(serializers.ModelSerializer):
     available_sermons = serializers.SerializerMethodField()
 
@@ -119,7 +139,9 @@ class SeriesSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
     def get_available_sermons(self, obj):
-        sermons = obj.sermon_series.order_by('date')
+        sermons = getattr(obj, 'available_sermon_list', None)
+        if sermons is None:
+            sermons = with_series_neighbours(obj.sermon_series.select_related('resource'))
         return SermonSerializer(sermons, many=True, context={'series': obj, 'request': self.context.get('request')}).data
 
 
@@ -148,15 +170,61 @@ class EventSerializer(serializers.ModelSerializer):
     
 
 
+REFLECTION_PREVIEW_SIZE = 3
+
+
+def with_reflection_preview(queryset):
+    """
+    Annotate each devotion with its reflection count and prefetch only its
+    latest ``REFLECTION_PREVIEW_SIZE`` reflections, ranked in the database.
+    """
+    ranked = Reflection.objects.annotate(
+        preview_rank=Window(
+            RowNumber(),
+            partition_by=[F('devotion_id')],
+            order_by=[F('date').desc(), F('id').desc()],
+        )
+    ).filter(preview_rank__lte=REFLECTION_PREVIEW_SIZE).order_by('-date', '-id')
+    return queryset.annotate(reflection_count=Count('reflections')).prefetch_related(
+        Prefetch('reflections', queryset=ranked, to_attr='reflection_preview')
+    )
+
+
 class DevotionSerializer(serializers.ModelSerializer):
     Bible_verse = serializers.JSONField(required=False, allow_null=True)
-    reflections = ReflectionSerializer(many=True, read_only=True)
+    reflections = serializers.SerializerMethodField()
+    reflection_count = serializers.SerializerMethodField()
+    reflections_url = serializers.SerializerMethodField()
     thumbnail = serializers.URLField(required=False, allow_blank=True, allow_null=True)
 
     class Meta:
         model = Devotion
-        fields = ['id', 'title', 'Bible_verse', 'content', 'thumbnail', 'date', 'reflections']
-        read_only_fields = ['id', 'date', 'reflections']
+        fields = [
+            'id', 'title', 'Bible_verse', 'content', 'thumbnail', 'date',
+            'reflections', 'reflection_count', 'reflections_url'
+        ]
+        read_only_fields = ['id', 'date']
+
+    @extend_schema_field(ReflectionSerializer(many=True))
+    def get_reflections(self, obj):
+        # The latest few only; reflections_url pages through the rest.
+        preview = getattr(obj, 'reflection_preview', None)
+        if preview is None:
+            preview = obj.reflections.order_by('-date', '-id')[:REFLECTION_PREVIEW_SIZE]
+        return ReflectionSerializer(preview, many=True, context=self.context).data
+
+    @extend_schema_field(serializers.IntegerField())
+    def get_reflection_count(self, obj):
+        count = getattr(obj, 'reflection_count', None)
+        return obj.reflections.count() if count is None else count
+
+    @extend_schema_field(serializers.URLField())
+    def get_reflections_url(self, obj):
+        url = reverse('reflections-for-devotion', kwargs={'devotion_id': obj.id})
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(url)
+        return url
 
     def create(self, validated_data):
         bible = validated_data.pop('Bible_verse', {})
@@ -276,46 +344,53 @@ class GallerySerializer(serializers.ModelSerializer):
 
     def _sync_images(self, gallery, image_urls):
         image_urls = self._dedupe_urls(image_urls)
-        existing_images = list(gallery.images.all())
         existing_by_url = {}
-        for image in existing_images:
+        for image in gallery.images.all():
             existing_by_url.setdefault(image.image, []).append(image)
 
-        keep_ids = []
+        # bulk_update() bypasses save(), so auto_now has to be applied by hand.
+        now = timezone.now()
+        to_update = []
+        to_create = []
         for index, url in enumerate(image_urls, start=1):
             image_title = f"{gallery.title} - Image {index}"
             matching_images = existing_by_url.get(url, [])
             if matching_images:
                 image = matching_images.pop(0)
-                keep_ids.append(image.id)
-                updates = {}
-                if image.title != image_title:
-                    updates['title'] = image_title
-                if image.description != gallery.description:
-                    updates['description'] = gallery.description
-                if image.venue != gallery.venue:
-                    updates['venue'] = gallery.venue
-                if updates:
-                    GalleryImage.objects.filter(pk=image.pk).update(**updates)
+                if (image.title, image.description, image.venue) != (image_title, gallery.description, gallery.venue):
+                    image.title = image_title
+                    image.description = gallery.description
+                    image.venue = gallery.venue
+                    image.updated_at = now
+                    to_update.append(image)
                 continue
 
-            created = GalleryImage.objects.create(
+            to_create.append(GalleryImage(
                 gallery=gallery,
                 title=image_title,
                 image=url,
                 description=gallery.description,
                 venue=gallery.venue,
-            )
-            keep_ids.append(created.id)
+            ))
 
-        gallery.images.exclude(pk__in=keep_ids).delete()
+        # Whatever is left unmatched is no longer part of the album.
+        stale_ids = [image.id for images in existing_by_url.values() for image in images]
 
+        if stale_ids:
+            GalleryImage.objects.filter(pk__in=stale_ids).delete()
+        if to_update:
+            GalleryImage.objects.bulk_update(to_update, ['title', 'description', 'venue', 'updated_at'], batch_size=500)
+        if to_create:
+            GalleryImage.objects.bulk_create(to_create, batch_size=500)
+
+    @transaction.atomic
     def create(self, validated_data):
         image_urls = validated_data.pop('image_urls', [])
         gallery = super().create(validated_data)
         self._sync_images(gallery, image_urls)
         return gallery
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         image_urls = validated_data.pop('image_urls', None)
         gallery = super().update(instance, validated_data)
@@ -384,6 +459,19 @@ class ContributionIntentSerializer(serializers.ModelSerializer):
         return instance
 
 
+class ContributionIntentExportFilterSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=ContributionIntent.STATUS_CHOICES, required=False)
+    channel = serializers.UUIDField(required=False, help_text="Only intents sent to this channel")
+    purpose = serializers.ChoiceField(choices=ContributionIntent.PURPOSE_CHOICES, required=False)
+    date_from = serializers.DateField(required=False, help_text="First creation day to include")
+    date_to = serializers.DateField(required=False, help_text="Last creation day to include")
+
+    def validate(self, attrs):
+        if attrs.get('date_from') and attrs.get('date_to') and attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError({'date_to': 'date_to must not be before date_from.'})
+        return attrs
+
+
 class ReelSerializer(serializers.ModelSerializer):
     created_by = serializers.SerializerMethodField()
 
@@ -477,7 +565,9 @@ class NavigationItemSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'children', 'updated_at']
 
     def get_children(self, obj):
-        queryset = obj.children.filter(is_enabled=True).order_by('display_order', 'label')
+        queryset = getattr(obj, 'enabled_children', None)
+        if queryset is None:
+            queryset = obj.children.filter(is_enabled=True).order_by('display_order', 'label')
         return [
             {
                 'id': child.id,
@@ -532,3 +622,34 @@ class PageConfigSerializer(serializers.ModelSerializer):
             'updated_at', 'sections',
         ]
         read_only_fields = ['updated_at', 'sections']
+
+
+SEARCH_SNIPPET_LENGTH = 200
+
+
+class SearchResultSerializer(serializers.ModelSerializer):
+    type = serializers.CharField(source='content_type', read_only=True)
+    id = serializers.UUIDField(source='object_id', read_only=True)
+    snippet = serializers.SerializerMethodField()
+    url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SearchDocument
+        fields = ['type', 'id', 'title', 'snippet', 'date', 'url']
+        read_only_fields = fields
+
+    @extend_schema_field(serializers.CharField())
+    def get_snippet(self, obj):
+        body = ' '.join(obj.body.split())
+        if len(body) <= SEARCH_SNIPPET_LENGTH:
+            return body
+        return body[:SEARCH_SNIPPET_LENGTH].rsplit(' ', 1)[0] + '…'
+
+    @extend_schema_field(serializers.URLField())
+    def get_url(self, obj):
+        name, kwarg = DETAIL_URLS[obj.content_type]
+        url = reverse(name, kwargs={kwarg: obj.object_id})
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(url)
+        return url
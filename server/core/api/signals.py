@@ -0,0 +1,92 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import response_cache, search_index
+from .bible_warmup import devotion_references, enqueue_warmup
+from .models import (
+    Announcement,
+    Devotion,
+    Event,
+    NavigationItem,
+    PageConfig,
+    Reel,
+    Reflection,
+    Resource,
+    SectionConfig,
+    Sermon,
+    Series,
+    SiteSettings,
+    ThemeSettings,
+)
+from .site_config import invalidate_public_snapshot
+
+
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+@receiver(post_save, sender=ThemeSettings)
+@receiver(post_delete, sender=ThemeSettings)
+@receiver(post_save, sender=NavigationItem)
+@receiver(post_delete, sender=NavigationItem)
+@receiver(post_save, sender=PageConfig)
+@receiver(post_delete, sender=PageConfig)
+@receiver(post_save, sender=SectionConfig)
+@receiver(post_delete, sender=SectionConfig)
+def invalidate_site_config(sender, **kwargs):
+    # Drop the snapshot now and again after commit, so a request that rebuilt
+    # it from pre-commit data in the meantime does not leave it stale.
+    invalidate_public_snapshot()
+    transaction.on_commit(invalidate_public_snapshot)
+
+
+@receiver(post_save, sender=Devotion)
+def warm_devotion_passages(sender, instance, **kwargs):
+    # Fetch quoted passages before the first reader asks for them.
+    references = devotion_references(instance)
+    if references:
+        transaction.on_commit(lambda: enqueue_warmup(references))
+
+
+@receiver(post_save, sender=Sermon)
+@receiver(post_save, sender=Series)
+@receiver(post_save, sender=Devotion)
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Reel)
+@receiver(post_save, sender=Announcement)
+@receiver(post_save, sender=Resource)
+def index_search_document(sender, instance, raw=False, **kwargs):
+    # Same transaction as the write, so the document never outlives a rollback.
+    if not raw:
+        search_index.index_instance(instance)
+
+
+@receiver(post_delete, sender=Sermon)
+@receiver(post_delete, sender=Series)
+@receiver(post_delete, sender=Devotion)
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Reel)
+@receiver(post_delete, sender=Announcement)
+@receiver(post_delete, sender=Resource)
+def remove_search_document(sender, instance, **kwargs):
+    search_index.remove_instance(instance)
+
+
+@receiver(post_save, sender=Sermon)
+@receiver(post_delete, sender=Sermon)
+@receiver(post_save, sender=Resource)
+@receiver(post_delete, sender=Resource)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Devotion)
+@receiver(post_delete, sender=Devotion)
+@receiver(post_save, sender=Reflection)
+@receiver(post_delete, sender=Reflection)
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+@receiver(post_save, sender=Reel)
+@receiver(post_delete, sender=Reel)
+def invalidate_cached_responses(sender, **kwargs):
+    # As with the site config: now, and again once the write is visible.
+    for group in response_cache.groups_for(sender):
+        response_cache.invalidate(group)
+        transaction.on_commit(lambda group=group: response_cache.invalidate(group))
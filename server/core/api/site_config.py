@@ -0,0 +1,67 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Prefetch
+from rest_framework.renderers import JSONRenderer
+
+from .models import NavigationItem, PageConfig, SiteSettings, ThemeSettings
+from .serializers import (
+    NavigationItemSerializer,
+    PageConfigSerializer,
+    SiteSettingsSerializer,
+    ThemeSettingsSerializer,
+)
+
+# Bump when the payload shape changes so snapshots cached by an older
+# release are never served.
+SNAPSHOT_VERSION = 2
+SNAPSHOT_CACHE_KEY = f"site-config:public:v{SNAPSHOT_VERSION}"
+# Signals invalidate the snapshot immediately in a shared cache; the timeout
+# bounds staleness when each worker has its own local-memory cache.
+SNAPSHOT_TIMEOUT = 60 * 5
+
+
+def build_public_snapshot():
+    """
+    Render the public site configuration and return ``{"etag", "body"}``,
+    the JSON bytes and their hash, cached together so requests serve them
+    without re-serialising or re-hashing.
+    """
+    navigation_queryset = NavigationItem.objects.filter(
+        is_enabled=True,
+        parent__isnull=True
+    ).prefetch_related(
+        Prefetch(
+            'children',
+            queryset=NavigationItem.objects.filter(is_enabled=True).order_by('display_order', 'label'),
+            to_attr='enabled_children',
+        )
+    ).order_by('location', 'display_order', 'label')
+
+    pages_queryset = PageConfig.objects.filter(is_enabled=True).prefetch_related('sections').order_by(
+        'display_order', 'slug'
+    )
+
+    payload = {
+        "site": SiteSettingsSerializer(SiteSettings.load()).data,
+        "theme": ThemeSettingsSerializer(ThemeSettings.load()).data,
+        "navigation": NavigationItemSerializer(navigation_queryset, many=True).data,
+        "pages": PageConfigSerializer(pages_queryset, many=True).data,
+    }
+    body = JSONRenderer().render(payload)
+    return {
+        "etag": '"%s"' % hashlib.md5(body).hexdigest(),
+        "body": body,
+    }
+
+
+def get_public_snapshot():
+    snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+    if snapshot is None:
+        snapshot = build_public_snapshot()
+        cache.set(SNAPSHOT_CACHE_KEY, snapshot, SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def invalidate_public_snapshot():
+    cache.delete(SNAPSHOT_CACHE_KEY)
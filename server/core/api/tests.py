@@ -1,13 +1,70 @@
+import csv
+import json
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from urllib.parse import unquote, urlsplit
+from uuid import UUID
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 
-from .models import Gallery, GalleryImage, SiteSettings, ThemeSettings
+from . import counters, profiling, views
+from .profiling import RequestProfile
+from .bible_reference import canonical_reference, reference_key
+from .bible_warmup import _warm_in_background, devotion_references
+from .bible_service import (
+    BibleClient,
+    BiblePassageNotFound,
+    BibleServiceUnavailable,
+    CircuitBreaker,
+    fetch_bible_passage,
+)
+from .models import (
+    Announcement,
+    BiblePassageCache,
+    BibleVerse,
+    ContributionChannel,
+    ContributionIntent,
+    DailyMetric,
+    Devotion,
+    Event,
+    Gallery,
+    GalleryImage,
+    Live_stream,
+    NavigationItem,
+    PageConfig,
+    Reel,
+    Reflection,
+    Resource,
+    SectionConfig,
+    Sermon,
+    Series,
+    SiteSettings,
+    ThemeSettings,
+)
+from .pagination import StandardPagination
 
 
 class SiteConfigApiTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.public_url = reverse('site-config-public')
         self.settings_url = reverse('site-settings')
         self.theme_url = reverse('theme-settings')
@@ -31,10 +88,10 @@ class SiteConfigApiTests(APITestCase):
     def test_public_site_config_returns_defaults(self):
         response = self.client.get(self.public_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('site', response.data)
-        self.assertIn('theme', response.data)
-        self.assertIn('navigation', response.data)
-        self.assertIn('pages', response.data)
+        self.assertIn('site', response.json())
+        self.assertIn('theme', response.json())
+        self.assertIn('navigation', response.json())
+        self.assertIn('pages', response.json())
         self.assertTrue(SiteSettings.objects.filter(pk=1).exists())
         self.assertTrue(ThemeSettings.objects.filter(pk=1).exists())
 
@@ -60,6 +117,39 @@ class SiteConfigApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+    def test_public_site_config_is_served_from_cache_with_etag(self):
+        NavigationItem.objects.create(label='About', url='/about', item_type='dropdown')
+        first = self.client.get(self.public_url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertTrue(first['ETag'])
+
+        # Hits replay the cached bytes: no queries, no serialising, no hashing.
+        with self.assertNumQueries(0), mock.patch('api.site_config.JSONRenderer.render') as render:
+            second = self.client.get(self.public_url)
+        render.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(second['Content-Type'], 'application/json')
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(self.public_url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_public_site_config_is_invalidated_on_save(self):
+        first = self.client.get(self.public_url)
+        parent = NavigationItem.objects.create(label='Ministries', item_type='dropdown')
+        NavigationItem.objects.create(label='Youth', url='/youth', parent=parent)
+
+        response = self.client.get(self.public_url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertEqual(response.json()['navigation'][0]['children'][0]['label'], 'Youth')
+
+        self.client.force_authenticate(self.admin)
+        self.client.patch(self.settings_url, {'church_name': 'Elevation Accra'}, format='json')
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.public_url).json()['site']['church_name'], 'Elevation Accra')
+
 class GalleryApiTests(APITestCase):
     def setUp(self):
         User = get_user_model()
@@ -139,3 +229,1254 @@ class GalleryApiTests(APITestCase):
             GalleryImage.objects.filter(gallery_id=gallery_id).values_list('image', flat=True)
         )
         self.assertEqual(initial_images, updated_images)
+
+    def _album_queries(self, size):
+        urls = [f'https://example.com/album-{size}/{index}.jpg' for index in range(size)]
+        with CaptureQueriesContext(connection) as create_queries:
+            response = self.client.post(self.create_url, {
+                'title': f'Sunday Album {size}',
+                'description': 'Sunday service',
+                'venue': 'Main Hall',
+                'image_urls': urls,
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        update_url = reverse('gallery-update', kwargs={'gallery_id': response.data['id']})
+        replacement = urls[size // 2:] + [f'https://example.com/album-{size}/new-{index}.jpg' for index in range(size // 2)]
+        with CaptureQueriesContext(connection) as update_queries:
+            response = self.client.patch(update_url, {
+                'title': f'Sunday Album {size} (edited)',
+                'image_urls': replacement,
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(GalleryImage.objects.filter(gallery_id=response.data['id']).count(), size)
+        return len(create_queries.captured_queries), len(update_queries.captured_queries)
+
+    def test_gallery_image_sync_query_count_is_constant(self):
+        self.client.force_authenticate(self.admin)
+        self.assertEqual(self._album_queries(4), self._album_queries(60))
+
+
+class SeriesApiTests(APITestCase):
+    def setUp(self):
+        self.series = Series.objects.create(title='Faith', description='A series on faith')
+        start = timezone.now() - timedelta(days=30)
+        self.sermons = []
+        for index in range(4):
+            sermon = Sermon.objects.create(title=f'Part {index + 1}', description='Sermon', series=self.series)
+            Sermon.objects.filter(pk=sermon.pk).update(date=start + timedelta(days=index))
+            self.sermons.append(sermon)
+        self.detail_url = reverse('series-detail', kwargs={'series_id': self.series.id})
+
+    def _sermon_url(self, sermon):
+        return 'http://testserver' + reverse('sermon-detail', kwargs={'sermon_id': sermon.id})
+
+    def test_available_sermons_link_to_neighbours_in_date_order(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        sermons = response.data['available_sermons']
+        self.assertEqual([s['title'] for s in sermons], ['Part 1', 'Part 2', 'Part 3', 'Part 4'])
+        self.assertIsNone(sermons[0]['previous_sermon'])
+        self.assertEqual(sermons[0]['next_sermon'], self._sermon_url(self.sermons[1]))
+        self.assertEqual(sermons[2]['previous_sermon'], self._sermon_url(self.sermons[1]))
+        self.assertEqual(sermons[2]['next_sermon'], self._sermon_url(self.sermons[3]))
+        self.assertIsNone(sermons[3]['next_sermon'])
+
+    def test_series_detail_query_count_does_not_grow_with_sermons(self):
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.detail_url)
+        for index in range(10):
+            Sermon.objects.create(title=f'Extra {index}', description='Sermon', series=self.series)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(self.detail_url)
+
+        self.assertEqual(len(response.data['available_sermons']), 14)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+
+class AnalyticsApiTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin = User.objects.create_user(
+            username='analytics_admin',
+            email='analytics-admin@example.com',
+            password='pass12345',
+            is_staff=True,
+            is_superuser=True,
+        )
+        self.client.force_authenticate(self.admin)
+
+        Sermon.objects.create(title='Grace', description='Sermon', likes=3, comments='Amen')
+        Sermon.objects.create(title='Hope', description='Sermon', likes=2)
+        Reel.objects.create(title='Clip', video_url='https://example.com/clip.mp4', likes_count=4)
+        Live_stream.objects.create(title='Sunday', description='Live', reactions=5, comments='Hallelujah', date=timezone.now())
+        channel = ContributionChannel.objects.create(
+            name='Main MOMO', channel_type='momo', account_name='Elevation', account_number='0240000000'
+        )
+        for amount, intent_status in [('10.50', 'confirmed'), ('20.25', 'confirmed'), ('5.00', 'pending'), ('7.10', 'rejected')]:
+            ContributionIntent.objects.create(channel=channel, amount=Decimal(amount), status=intent_status)
+
+    def test_overview_totals_come_from_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('analytics-overview'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        overview = response.data['overview']
+        self.assertEqual(overview['sermons'], 2)
+        self.assertEqual(overview['reels'], 1)
+        self.assertEqual(overview['events'], 0)
+        self.assertEqual(overview['contribution_intents'], 4)
+        self.assertEqual(overview['staff_users'], 1)
+
+    def test_contribution_amounts_are_split_by_status(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('analytics-contributions'))
+        contributions = response.data['contributions']
+
+        self.assertEqual(contributions['intent_count'], 4)
+        self.assertEqual(contributions['total_amount'], Decimal('42.85'))
+        self.assertEqual(contributions['confirmed_amount'], Decimal('30.75'))
+        self.assertEqual(contributions['pending_amount'], Decimal('5.00'))
+        self.assertEqual(contributions['rejected_amount'], Decimal('7.10'))
+        self.assertEqual(contributions['status_breakdown'], {'pending': 1, 'confirmed': 2, 'rejected': 1})
+
+    def test_engagement_and_growth_metrics(self):
+        with self.assertNumQueries(1):
+            engagement = self.client.get(reverse('analytics-engagement')).data['engagement']
+        self.assertEqual(engagement['total_likes'], 9)
+        self.assertEqual(engagement['live_reactions'], 5)
+        self.assertEqual(engagement['comment_records'], 2)
+
+        old = Sermon.objects.create(title='Older', description='Sermon')
+        Sermon.objects.filter(pk=old.pk).update(date=timezone.now() - timedelta(days=40))
+        with self.assertNumQueries(2):
+            growth = self.client.get(reverse('analytics-growth'), {'days': 30}).data['growth']
+        self.assertEqual(growth['sermons'], {'current': 2, 'previous': 1, 'change_pct': 100.0})
+        self.assertEqual(growth['contribution_intents']['current'], 4)
+
+    def test_timeline_reads_rollup_and_counts_today_live(self):
+        today = timezone.localdate()
+        for days_ago in (1, 1, 3):
+            sermon = Sermon.objects.create(title=f'Past {days_ago}', description='Sermon')
+            Sermon.objects.filter(pk=sermon.pk).update(date=timezone.now() - timedelta(days=days_ago))
+
+        call_command('rollup_daily_metrics', stdout=StringIO())
+        self.assertTrue(DailyMetric.objects.filter(day=today - timedelta(days=1), metric='sermons', count=2).exists())
+        self.assertFalse(DailyMetric.objects.filter(day=today).exists())
+
+        # Rows written after the rollup only show up through the live tail.
+        Sermon.objects.filter(title='Past 3').delete()
+        with self.assertNumQueries(2):
+            timeline = self.client.get(reverse('analytics-timeline'), {'days': 7}).data['timeline']
+        by_day = {row['day']: row['sermons'] for row in timeline}
+        self.assertEqual(by_day[today.isoformat()], 2)
+        self.assertEqual(by_day[(today - timedelta(days=1)).isoformat()], 2)
+        self.assertEqual(by_day[(today - timedelta(days=3)).isoformat()], 1)
+
+        call_command('rollup_daily_metrics', '--rebuild', stdout=StringIO())
+        timeline = self.client.get(reverse('analytics-timeline'), {'days': 7}).data['timeline']
+        by_day = {row['day']: row['sermons'] for row in timeline}
+        self.assertEqual(by_day[(today - timedelta(days=3)).isoformat()], 0)
+
+
+@override_settings(RESPONSE_CACHE={'ENABLED': False})
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.sermon = Sermon.objects.create(title='Grace', description='Sermon')
+        self.list_url = reverse('sermon-list')
+        self.detail_url = reverse('sermon-detail', kwargs={'sermon_id': self.sermon.id})
+
+    def test_list_returns_304_until_a_record_changes(self):
+        first = self.client.get(self.list_url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Last-Modified', first)
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.sermon.title = 'Grace Abounds'
+        self.sermon.save()
+        changed = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+    def test_deleting_a_record_changes_the_list_etag(self):
+        Sermon.objects.create(title='Hope', description='Sermon')
+        first = self.client.get(self.list_url)
+
+        self.sermon.delete()
+        changed = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(changed.data['results']), 1)
+
+    def test_detail_sends_last_modified(self):
+        detail = self.client.get(self.detail_url)
+        self.assertIn('Last-Modified', detail)
+        self.assertEqual(
+            self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=detail['Last-Modified']).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+    def test_detail_and_query_string_have_their_own_validators(self):
+        detail = self.client.get(self.detail_url)
+        self.assertEqual(
+            self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail['ETag']).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        page = self.client.get(self.list_url, {'page': 1})
+        self.assertNotEqual(page['ETag'], self.client.get(self.list_url)['ETag'])
+
+    def test_nested_relation_changes_invalidate_parent_list(self):
+        gallery = Gallery.objects.create(title='Retreat', description='Retreat photos')
+        image = GalleryImage.objects.create(gallery=gallery, title='Day 1', image='https://example.com/1.jpg', description='Day 1')
+        url = reverse('gallery-list')
+        first = self.client.get(url)
+
+        image.title = 'Day One'
+        image.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['images'][0]['title'], 'Day One')
+
+
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        devotion = Devotion.objects.create(title='Morning', content='Devotion')
+        base = timezone.now()
+        self.expected = []
+        for index in range(23):
+            reflection = Reflection.objects.create(name=f'Member {index}', content='Amen', devotion=devotion)
+            # Pairs share a timestamp so the id tiebreaker is exercised.
+            Reflection.objects.filter(pk=reflection.pk).update(date=base - timedelta(minutes=index // 2))
+        self.expected = list(Reflection.objects.order_by('-date', '-id').values_list('id', flat=True))
+        self.url = reverse('reflection-list')
+
+    def _walk(self, url, params):
+        seen, query_counts = [], []
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            query_counts.append(len(queries.captured_queries))
+            seen.extend(UUID(str(row['id'])) for row in response.data['results'])
+            url, params = response.data['next'], None
+        return seen, query_counts
+
+    def test_cursor_mode_walks_every_row_once_in_order(self):
+        seen, query_counts = self._walk(self.url, {'cursor': ''})
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(len(set(query_counts)), 1)
+
+    def test_page_mode_is_unchanged_without_cursor(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['count'], 23)
+
+    def test_nullable_keys_are_paged_last(self):
+        User = get_user_model()
+        staff = User.objects.create_user(username='reels_staff', password='pass12345', is_staff=True)
+        self.client.force_authenticate(staff)
+        for index in range(14):
+            Reel.objects.create(
+                title=f'Reel {index}',
+                video_url='https://example.com/reel.mp4',
+                is_published=index % 2 == 0,
+                published_at=timezone.now() - timedelta(hours=index) if index % 2 == 0 else None,
+            )
+
+        seen, _ = self._walk(reverse('reel-list'), {'cursor': '', 'page_size': 4})
+        self.assertEqual(len(seen), 14)
+        self.assertEqual(len(set(seen)), 14)
+        published = list(Reel.objects.filter(published_at__isnull=False).order_by('-published_at').values_list('id', flat=True))
+        self.assertEqual(seen[:7], published)
+        # Page mode lists drafts last too, in the same order.
+        page = self.client.get(reverse('reel-list'), {'page_size': 14})
+        self.assertEqual([UUID(str(row['id'])) for row in page.data['results']], seen)
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class PaginationTests(APITestCase):
+    def setUp(self):
+        for index in range(25):
+            Sermon.objects.create(title=f'Sermon {index}', description='Sermon')
+            Reel.objects.create(title=f'Reel {index}', video_url='https://example.com/reel.mp4', is_published=True)
+
+    def test_each_endpoint_uses_its_own_page_size(self):
+        self.assertEqual(len(self.client.get(reverse('sermon-list')).data['results']), 10)
+        self.assertEqual(len(self.client.get(reverse('reel-list')).data['results']), 20)
+        self.assertEqual(len(self.client.get(reverse('gallery-image-list')).data['results']), 0)
+
+    def test_clients_can_tune_page_size_up_to_the_cap(self):
+        response = self.client.get(reverse('sermon-list'), {'page_size': 5})
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertEqual(response.data['count'], 25)
+
+        with mock.patch.object(StandardPagination, 'max_page_size', 7):
+            capped = self.client.get(reverse('sermon-list'), {'page_size': 1000})
+        self.assertEqual(len(capped.data['results']), 7)
+
+
+class QueryPlanTests(APITestCase):
+    """Every list/detail endpoint runs a fixed number of queries however many rows it serializes."""
+
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(
+            username='plan_admin', email='plan-admin@example.com', password='pass12345', is_staff=True
+        )
+        self.sequence = 0
+
+    def next_id(self):
+        self.sequence += 1
+        return self.sequence
+
+    def assertQueriesIndependentOfRows(self, url, add_rows, admin=False):
+        if admin:
+            self.client.force_authenticate(self.admin)
+        add_rows(2)
+        with CaptureQueriesContext(connection) as few:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        add_rows(5)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries), url)
+
+    def resource(self):
+        return Resource.objects.create(name=f'Book {self.next_id()}', purchase_link='https://example.com', price=Decimal('5.00'))
+
+    def add_sermons(self, count, series=None):
+        for _ in range(count):
+            Sermon.objects.create(title='Sermon', description='...', series=series, resource=self.resource())
+
+    def add_series(self, count):
+        for _ in range(count):
+            self.add_sermons(2, Series.objects.create(title=f'Series {self.next_id()}', description='...'))
+
+    def add_galleries(self, count, gallery=None):
+        for _ in range(count):
+            album = gallery or Gallery.objects.create(title=f'Album {self.next_id()}', description='...')
+            for _ in range(1 if gallery else 2):
+                GalleryImage.objects.create(gallery=album, title='Photo', image='https://example.com/p.jpg', description='...')
+
+    def add_reels(self, count):
+        for _ in range(count):
+            author = get_user_model().objects.create(username=f'author{self.next_id()}')
+            Reel.objects.create(title='Reel', video_url='https://example.com/r.mp4', created_by=author)
+
+    def add_devotions(self, count):
+        for _ in range(count):
+            devotion = Devotion.objects.create(title='Devotion', content='...')
+            for _ in range(4):
+                Reflection.objects.create(name='Member', content='Amen', devotion=devotion)
+
+    def add_pages(self, count):
+        for _ in range(count):
+            page = PageConfig.objects.create(slug=f'page-{self.next_id()}', title='Page')
+            for key in ('hero', 'body'):
+                SectionConfig.objects.create(page=page, key=key)
+
+    def add_navigation(self, count):
+        for _ in range(count):
+            parent = NavigationItem.objects.create(label=f'Menu {self.next_id()}', item_type='dropdown')
+            for label in ('First', 'Second'):
+                NavigationItem.objects.create(label=label, url='/page', parent=parent)
+
+    def add_intents(self, count):
+        for _ in range(count):
+            channel = ContributionChannel.objects.create(
+                name=f'Channel {self.next_id()}', channel_type='momo', account_name='Elevation', account_number='024'
+            )
+            ContributionIntent.objects.create(channel=channel, amount=Decimal('1.00'), confirmed_by=self.admin)
+
+    def test_sermon_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('sermon-list'), self.add_sermons)
+
+    def test_series_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('series-list'), self.add_series)
+        series = Series.objects.create(title='Detail', description='...')
+        self.assertQueriesIndependentOfRows(
+            reverse('series-detail', kwargs={'series_id': series.id}),
+            lambda count: self.add_sermons(count, series),
+        )
+
+    def test_gallery_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('gallery-list'), self.add_galleries)
+        gallery = Gallery.objects.create(title='Detail', description='...')
+        self.assertQueriesIndependentOfRows(
+            reverse('gallery-detail', kwargs={'gallery_id': gallery.id}),
+            lambda count: self.add_galleries(count, gallery),
+        )
+
+    def test_reel_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('reel-list'), self.add_reels)
+
+    def test_devotion_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('devotion-list'), self.add_devotions)
+
+    def test_site_config_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('page-config-list'), self.add_pages, admin=True)
+        self.assertQueriesIndependentOfRows(reverse('section-config-list'), self.add_pages, admin=True)
+        self.assertQueriesIndependentOfRows(reverse('navigation-list'), self.add_navigation, admin=True)
+
+    def test_contribution_intent_endpoints(self):
+        self.assertQueriesIndependentOfRows(reverse('contribution-intent-list'), self.add_intents, admin=True)
+
+
+class DevotionApiTests(APITestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.devotions = []
+        for index in range(4):
+            devotion = Devotion.objects.create(title=f'Day {index}', content='...', date=now - timedelta(days=index))
+            for offset in range(index * 2):
+                reflection = Reflection.objects.create(name=f'Member {offset}', content='Amen', devotion=devotion)
+                Reflection.objects.filter(pk=reflection.pk).update(date=now - timedelta(minutes=offset))
+            self.devotions.append(devotion)
+
+    def test_list_embeds_bounded_preview_in_constant_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('devotion-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Count, page and one prefetch for every preview; the response cache
+        # validates the rendered body, so there is no validator query.
+        self.assertEqual(len(queries), 3)
+
+        results = {item['title']: item for item in response.data['results']}
+        busiest = results['Day 3']
+        self.assertEqual(busiest['reflection_count'], 6)
+        self.assertEqual(
+            [reflection['name'] for reflection in busiest['reflections']],
+            ['Member 0', 'Member 1', 'Member 2'],
+        )
+        self.assertTrue(busiest['reflections_url'].endswith(
+            reverse('reflections-for-devotion', kwargs={'devotion_id': self.devotions[3].id})
+        ))
+        self.assertEqual(results['Day 0']['reflections'], [])
+
+    def test_detail_matches_list_preview(self):
+        response = self.client.get(reverse('devotion-detail', kwargs={'devotion_id': self.devotions[2].id}))
+        self.assertEqual(response.data['reflection_count'], 4)
+        self.assertEqual(len(response.data['reflections']), 3)
+
+
+class BibleReferenceTests(TestCase):
+    def test_spellings_of_a_reference_share_one_key(self):
+        for spelling in ['John 3:16', 'john 3:16', 'Jn 3:16', 'John 3 : 16', 'jhn 3.16']:
+            self.assertEqual(reference_key(spelling), 'john 3:16')
+
+    def test_canonical_reference_handles_numbered_books_and_ranges(self):
+        self.assertEqual(canonical_reference('1 jn 4:7-8'), '1 John 4:7-8')
+        self.assertEqual(canonical_reference('II Kings 2'), '2 Kings 2')
+        self.assertEqual(canonical_reference('isa 53:5 – 6'), 'Isaiah 53:5-6')
+        self.assertEqual(canonical_reference('Ps 23'), 'Psalms 23')
+        self.assertEqual(canonical_reference('Rom 8:28-9:1'), 'Romans 8:28-9:1')
+
+    def test_unknown_reference_keeps_collapsed_text(self):
+        self.assertEqual(canonical_reference('  Phi   4:13 '), 'Phi 4:13')
+        self.assertEqual(reference_key('Phi 4:13'), 'phi 4:13')
+
+    def test_cache_row_stores_key_on_save(self):
+        passage = BiblePassageCache.objects.create(reference='Gen 1:1')
+        self.assertEqual(passage.reference_key, 'genesis 1:1')
+
+
+class BiblePassageSearchTests(APITestCase):
+    def setUp(self):
+        BiblePassageCache.objects.create(reference='John 3:16', passage_text='For God so loved the world')
+        BiblePassageCache.objects.create(reference='John 3:17', passage_text='For God sent not his Son')
+        BiblePassageCache.objects.create(reference='Psalms 23:1', passage_text='The LORD is my shepherd')
+
+    def references(self, params):
+        response = self.client.get(reverse('bible-passage-search'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(item['reference'] for item in response.data['results'])
+
+    def test_reference_filter_uses_normalised_key(self):
+        self.assertEqual(self.references({'reference': 'Jn 3'}), ['John 3:16', 'John 3:17'])
+        self.assertEqual(self.references({'reference': 'ps 23:1'}), ['Psalms 23:1'])
+
+    def test_reference_filter_stops_at_reference_boundaries(self):
+        BiblePassageCache.objects.create(reference='1 John 3:1', passage_text='Behold, what manner of love')
+        BiblePassageCache.objects.create(reference='John 3:16-18', passage_text='For God so loved the world')
+        BiblePassageCache.objects.create(reference='Psalms 23:10', passage_text='Not a verse')
+
+        self.assertEqual(self.references({'reference': 'John 3'}), ['John 3:16', 'John 3:16-18', 'John 3:17'])
+        self.assertEqual(self.references({'reference': 'John 3:16'}), ['John 3:16', 'John 3:16-18'])
+        self.assertEqual(self.references({'reference': 'Psalms 23:1'}), ['Psalms 23:1'])
+        self.assertEqual(self.references({'reference': '1 John'}), ['1 John 3:1'])
+
+    def test_text_query_matches_passage_text(self):
+        self.assertEqual(self.references({'query': 'shepherd'}), ['Psalms 23:1'])
+
+
+class BiblePassageCachePolicyTests(APITestCase):
+    def setUp(self):
+        self.passage = BiblePassageCache.objects.create(reference='John 3:16', passage_text='cached')
+        self.url = reverse('bible-passage-detail')
+
+    def age(self, passage, **delta):
+        BiblePassageCache.objects.filter(pk=passage.pk).update(
+            fetched_at=timezone.now() - timedelta(**delta),
+            last_accessed_at=timezone.now() - timedelta(**delta),
+        )
+
+    def fetched(self, text):
+        return {'reference': 'John 3:16', 'translation': 'kjv', 'passage_text': text, 'raw_response': {}}
+
+    def test_fresh_hit_is_counted_without_fetching(self):
+        with mock.patch('api.views.fetch_bible_passage') as fetch:
+            self.client.get(self.url, {'reference': 'John 3:16'})
+            response = self.client.get(self.url, {'reference': 'jn 3:16'})
+        fetch.assert_not_called()
+        self.assertEqual(response.data['passage_text'], 'cached')
+        self.assertEqual(BiblePassageCache.objects.get().hit_count, 2)
+
+    @override_settings(BIBLE_PASSAGE_CACHE={'DEFAULT_TTL': 3600, 'TRANSLATION_TTLS': {}})
+    def test_expired_passage_is_refetched_in_place(self):
+        self.age(self.passage, hours=2)
+        with mock.patch('api.views.fetch_bible_passage', return_value=self.fetched('fresh')):
+            response = self.client.get(self.url, {'reference': 'John 3:16'})
+
+        self.assertEqual(response.data['passage_text'], 'fresh')
+        self.assertEqual(BiblePassageCache.objects.get().pk, self.passage.pk)
+
+    @override_settings(BIBLE_PASSAGE_CACHE={'DEFAULT_TTL': 3600, 'TRANSLATION_TTLS': {'kjv': None}})
+    def test_translation_ttl_overrides_default(self):
+        self.age(self.passage, days=365)
+        with mock.patch('api.views.fetch_bible_passage') as fetch:
+            self.client.get(self.url, {'reference': 'John 3:16'})
+        fetch.assert_not_called()
+
+    @override_settings(BIBLE_PASSAGE_CACHE={'DEFAULT_TTL': 3600, 'TRANSLATION_TTLS': {}})
+    def test_expired_passage_is_served_while_upstream_is_down(self):
+        self.age(self.passage, hours=2)
+        with mock.patch('api.views.fetch_bible_passage', side_effect=BibleServiceUnavailable('down')):
+            response = self.client.get(self.url, {'reference': 'John 3:16'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['passage_text'], 'cached')
+
+    @override_settings(BIBLE_PASSAGE_CACHE={'DEFAULT_TTL': 3600, 'TRANSLATION_TTLS': {'web': None}, 'MAX_ROWS': 2})
+    def test_prune_removes_expired_then_least_recently_used(self):
+        expired = BiblePassageCache.objects.create(reference='Genesis 1:1')
+        kept_forever = BiblePassageCache.objects.create(reference='Genesis 1:1', translation='web')
+        recent = BiblePassageCache.objects.create(reference='Exodus 1:1')
+        self.age(expired, hours=2)
+        self.age(kept_forever, days=400)
+        self.age(self.passage, minutes=30)
+
+        out = StringIO()
+        call_command('prune_bible_cache', stdout=out)
+
+        self.assertIn('Removed 1 expired and 1 least recently used', out.getvalue())
+        self.assertEqual(
+            set(BiblePassageCache.objects.values_list('pk', flat=True)),
+            {self.passage.pk, recent.pk},
+        )
+
+
+class BibleWarmupTests(APITestCase):
+    def passage(self, reference, translation='kjv'):
+        return {'reference': reference, 'translation': translation, 'passage_text': f'Text of {reference}', 'raw_response': {}}
+
+    def test_devotion_references_are_extracted(self):
+        devotion = Devotion(Bible_verse={'reference': 'jn 3:16; Ps 23 ;', 'verse_content': ''})
+        self.assertEqual(devotion_references(devotion), ['John 3:16', 'Psalms 23'])
+        devotion.Bible_verse = json.dumps({'reference': 'Gen 1:1'})
+        self.assertEqual(devotion_references(devotion), ['Genesis 1:1'])
+        devotion.Bible_verse = {'verse_content': 'no reference'}
+        self.assertEqual(devotion_references(devotion), [])
+
+    def test_saving_a_devotion_enqueues_warmup_after_commit(self):
+        with mock.patch('api.bible_warmup._executor') as executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                Devotion.objects.create(title='Love', content='...', Bible_verse={'reference': 'John 3:16'})
+                executor.submit.assert_not_called()
+        executor.submit.assert_called_once_with(_warm_in_background, ['John 3:16'], 'kjv')
+
+    def test_command_warms_missing_passages_once(self):
+        Devotion.objects.create(title='One', content='...', Bible_verse={'reference': 'John 3:16; Ps 23'})
+        Devotion.objects.create(title='Two', content='...', Bible_verse={'reference': 'jn 3:16'})
+        with mock.patch('api.bible_service.client') as network:
+            network.fetch_passage.side_effect = self.passage
+            out = StringIO()
+            call_command('warm_bible_cache', stdout=out)
+            call_command('warm_bible_cache', stdout=StringIO())
+
+        self.assertIn('2 devotion passages are cached; 0 could not be fetched.', out.getvalue())
+        self.assertEqual(network.fetch_passage.call_count, 2)
+        self.assertEqual(
+            sorted(BiblePassageCache.objects.values_list('reference', 'hit_count')),
+            [('John 3:16', 0), ('Psalms 23', 0)],
+        )
+
+
+class LocalBibleStoreTests(APITestCase):
+    def setUp(self):
+        rows = [
+            {'book': 'Jn', 'chapter': 3, 'verse': verse, 'text': f'  John three {verse} '}
+            for verse in range(14, 19)
+        ] + [
+            {'book': 'John', 'chapter': 4, 'verse': verse, 'text': f'John four {verse}'}
+            for verse in range(1, 4)
+        ] + [
+            {'book_name': 'Jude', 'chapter': 1, 'verse': 3, 'text': 'Jude three'},
+        ]
+        path = Path(self.enterContext(tempfile.TemporaryDirectory())) / 'kjv.json'
+        path.write_text(json.dumps({'verses': rows}), encoding='utf-8')
+        call_command('import_bible', str(path), translation='KJV', stdout=StringIO())
+
+    def test_import_replaces_translation(self):
+        self.assertEqual(BibleVerse.objects.filter(translation='kjv').count(), 9)
+        self.assertEqual(BibleVerse.objects.get(chapter=3, verse=14).text, 'John three 14')
+
+        path = Path(self.enterContext(tempfile.TemporaryDirectory())) / 'kjv.csv'
+        path.write_text('book,chapter,verse,text\nGenesis,1,1,In the beginning\n', encoding='utf-8')
+        call_command('import_bible', str(path), translation='kjv', stdout=StringIO())
+        self.assertEqual(list(BibleVerse.objects.values_list('book', flat=True)), ['Genesis'])
+
+    def test_import_rejects_unknown_books(self):
+        path = Path(self.enterContext(tempfile.TemporaryDirectory())) / 'bad.csv'
+        path.write_text('book,chapter,verse,text\nNotABook,1,1,text\n', encoding='utf-8')
+        with self.assertRaises(CommandError):
+            call_command('import_bible', str(path), translation='web', stdout=StringIO())
+        self.assertFalse(BibleVerse.objects.filter(translation='web').exists())
+
+    def test_verse_ranges_are_sliced_locally(self):
+        with mock.patch('api.bible_service.client') as network:
+            single = fetch_bible_passage('jn 3:16')
+            spans = fetch_bible_passage('John 3:17-4:1,2')
+            listed = fetch_bible_passage('John 3:14-15,18')
+            chapter = fetch_bible_passage('John 4')
+            jude = fetch_bible_passage('Jude 3')
+        network.fetch_passage.assert_not_called()
+
+        self.assertEqual(single['reference'], 'John 3:16')
+        self.assertEqual(single['passage_text'], 'John three 16')
+        self.assertEqual(spans['passage_text'], 'John three 17\nJohn three 18\nJohn four 1\nJohn four 2')
+        self.assertEqual(listed['passage_text'], 'John three 14\nJohn three 15\nJohn three 18')
+        self.assertEqual(chapter['passage_text'], 'John four 1\nJohn four 2\nJohn four 3')
+        self.assertEqual(jude['raw_response']['verses'], [
+            {'book_name': 'Jude', 'chapter': 1, 'verse': 3, 'text': 'Jude three'},
+        ])
+
+    def test_missing_verses_in_imported_translation_are_not_found(self):
+        with mock.patch('api.bible_service.client') as network:
+            with self.assertRaises(BiblePassageNotFound):
+                fetch_bible_passage('John 5:1')
+        network.fetch_passage.assert_not_called()
+
+    def test_other_translations_use_the_network(self):
+        with mock.patch('api.bible_service.client') as network:
+            network.fetch_passage.return_value = {'passage_text': 'remote'}
+            self.assertEqual(fetch_bible_passage('John 3:16', 'web'), {'passage_text': 'remote'})
+        network.fetch_passage.assert_called_once_with('John 3:16', 'web')
+
+
+class _StubBibleHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits.append(self.path)
+            server.clients.add(self.client_address)
+        reference = unquote(urlsplit(self.path).path.lstrip('/'))
+        if reference == 'broken':
+            status_code, payload = 500, {'error': 'upstream down'}
+        elif reference == 'missing':
+            status_code, payload = 404, {'error': 'not found'}
+        else:
+            time.sleep(server.delay)
+            status_code, payload = 200, {'reference': reference.title(), 'text': f'Text of {reference}\n'}
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BibleClientTests(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubBibleHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.hits = []
+        self.server.clients = set()
+        self.server.delay = 0
+        self.client_under_test = BibleClient(
+            base_url=self.base_url,
+            breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        )
+
+    def test_fetch_reuses_pooled_connection(self):
+        first = self.client_under_test.fetch_passage('john 3:16')
+        self.client_under_test.fetch_passage('john 3:17', 'WEB')
+
+        self.assertEqual(first['reference'], 'John 3:16')
+        self.assertEqual(first['passage_text'], 'Text of john 3:16')
+        self.assertEqual(first['translation'], 'kjv')
+        self.assertIn('translation=web', self.server.hits[1])
+        self.assertEqual(len(self.server.clients), 1)
+
+    def test_concurrent_identical_fetches_are_coalesced(self):
+        self.server.delay = 0.3
+        results = []
+        barrier = threading.Barrier(5)
+
+        def fetch():
+            barrier.wait()
+            results.append(self.client_under_test.fetch_passage('Psalm 23'))
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(self.server.hits), 1)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_circuit_opens_after_repeated_upstream_failures(self):
+        for _ in range(2):
+            with self.assertRaises(BibleServiceUnavailable):
+                self.client_under_test.fetch_passage('broken')
+        self.assertTrue(self.client_under_test.breaker.is_open)
+
+        with self.assertRaises(BibleServiceUnavailable):
+            self.client_under_test.fetch_passage('john 1:1')
+        self.assertEqual(len(self.server.hits), 2)
+
+    def test_circuit_half_opens_after_reset_timeout(self):
+        now = [0.0]
+        self.client_under_test.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: now[0])
+        with self.assertRaises(BibleServiceUnavailable):
+            self.client_under_test.fetch_passage('broken')
+
+        now[0] = 31
+        self.client_under_test.fetch_passage('john 1:1')
+        self.assertFalse(self.client_under_test.breaker.is_open)
+
+    def test_missing_passage_does_not_trip_breaker(self):
+        for _ in range(3):
+            with self.assertRaises(BiblePassageNotFound):
+                self.client_under_test.fetch_passage('missing')
+        self.assertFalse(self.client_under_test.breaker.is_open)
+
+    def test_passage_view_caches_upstream_result(self):
+        url = reverse('bible-passage-detail')
+        with mock.patch('api.bible_service.client', self.client_under_test):
+            response = self.client.get(url, {'reference': 'John 3:16'})
+            cached = self.client.get(url, {'reference': 'Jn 3 : 16'})
+            missing = self.client.get(url, {'reference': 'missing'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['passage_text'], 'Text of John 3:16')
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(len(self.server.hits), 2)
+        self.assertEqual(BiblePassageCache.objects.get().reference_key, 'john 3:16')
+
+    def test_batch_view_returns_results_in_order(self):
+        BiblePassageCache.objects.create(reference='Psalms 23:1', passage_text='cached')
+        self.server.delay = 0.4
+        payload = {'passages': [
+            {'reference': 'John 1:1'},
+            {'reference': 'ps 23:1'},
+            {'reference': 'missing'},
+            {'reference': 'Gen 1:1', 'translation': 'WEB'},
+            {'reference': 'jn 1:1'},
+        ]}
+        started = time.monotonic()
+        with mock.patch('api.bible_service.client', self.client_under_test):
+            response = self.client.post(reverse('bible-passage-batch'), payload, format='json')
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual(
+            [(item['reference'], item['translation'], item['status']) for item in results],
+            [
+                ('John 1:1', 'kjv', 200),
+                ('Psalms 23:1', 'kjv', 200),
+                ('missing', 'kjv', 404),
+                ('Genesis 1:1', 'web', 200),
+                ('John 1:1', 'kjv', 200),
+            ],
+        )
+        self.assertEqual(results[1]['passage']['passage_text'], 'cached')
+        self.assertEqual(results[0]['passage'], results[4]['passage'])
+        self.assertEqual(results[2]['detail'], 'not found')
+        # John 1:1 is fetched once and the two slow fetches overlap.
+        self.assertEqual(len(self.server.hits), 3)
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(BiblePassageCache.objects.get(reference_key='psalms 23:1').hit_count, 1)
+        self.assertEqual(BiblePassageCache.objects.count(), 3)
+
+    def test_batch_view_validates_payload(self):
+        url = reverse('bible-passage-batch')
+        self.assertEqual(self.client.post(url, {'passages': []}, format='json').status_code, 400)
+        too_many = {'passages': [{'reference': f'John 1:{verse}'} for verse in range(1, 52)]}
+        self.assertEqual(self.client.post(url, too_many, format='json').status_code, 400)
+        self.assertEqual(self.server.hits, [])
+
+    def test_passage_view_reports_open_circuit(self):
+        self.client_under_test.breaker.record_failure()
+        self.client_under_test.breaker.record_failure()
+        with mock.patch('api.bible_service.client', self.client_under_test):
+            response = self.client.get(reverse('bible-passage-detail'), {'reference': 'John 3:16'})
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(self.server.hits, [])
+
+
+@override_settings(REQUEST_PROFILING={'ENABLED': True})
+class RequestProfilingTests(APITestCase):
+    def setUp(self):
+        profiling.stats.reset()
+        self.admin = get_user_model().objects.create(username='profiling_admin', is_staff=True, is_superuser=True)
+        Sermon.objects.create(title='Grace', description='Sermon')
+
+    def test_responses_carry_server_timing(self):
+        response = self.client.get(reverse('sermon-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        timing = response['Server-Timing']
+        self.assertIn('app;dur=', timing)
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+    def test_stats_endpoint_aggregates_per_view(self):
+        for _ in range(3):
+            self.client.get(reverse('sermon-list'))
+        self.client.force_authenticate(self.admin)
+
+        response = self.client.get(reverse('analytics-profiling'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = {row['endpoint']: row for row in response.data['endpoints']}
+        sermons = rows['GET sermon-list']
+        self.assertEqual(sermons['requests'], 3)
+        self.assertGreater(sermons['queries_avg'], 0)
+        self.assertGreaterEqual(sermons['wall_ms_p95'], sermons['wall_ms_p50'])
+
+        self.client.delete(reverse('analytics-profiling'))
+        endpoints = [row['endpoint'] for row in profiling.stats.snapshot()]
+        self.assertNotIn('GET sermon-list', endpoints)
+
+    def test_stats_endpoint_is_staff_only(self):
+        response = self.client.get(reverse('analytics-profiling'))
+
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_repeated_queries_are_fingerprinted_as_duplicates(self):
+        profile = RequestProfile()
+        execute = mock.Mock(return_value=None)
+        for pk in (1, 2, 3):
+            profile(execute, f'SELECT * FROM "api_sermon" WHERE "id" = {pk}', None, False, {})
+        profile(execute, 'SELECT * FROM "api_series" WHERE "id" IN (%s, %s, %s)', None, False, {})
+
+        self.assertEqual(profile.query_count, 4)
+        self.assertEqual(profile.duplicates, {'SELECT * FROM "api_sermon" WHERE "id" = ?': 3})
+        self.assertEqual(profiling.fingerprint('"id" IN (%s, %s)'), profiling.fingerprint('"id" IN (%s)'))
+
+    @override_settings(REQUEST_PROFILING={'ENABLED': False})
+    def test_disabled_middleware_adds_nothing(self):
+        response = self.client.get(reverse('sermon-list'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(profiling.stats.snapshot(), [])
+
+
+class CounterApiTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(counters.flush)
+        self.sermon = Sermon.objects.create(title='Grace', description='Sermon', likes=4)
+        self.stream = Live_stream.objects.create(title='Sunday service', description='Live', date=timezone.now())
+
+    def test_like_increments_in_place_and_returns_total(self):
+        url = reverse('sermon-like', kwargs={'pk': self.sermon.id})
+
+        first = self.client.post(url)
+        second = self.client.post(url)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data['likes'], 5)
+        self.assertEqual(second.data['likes'], 6)
+        self.sermon.refresh_from_db()
+        self.assertEqual(self.sermon.likes, 6)
+
+    def test_unknown_and_unpublished_objects_are_not_found(self):
+        draft = Reel.objects.create(title='Draft', video_url='https://example.com/reel.mp4', is_published=False)
+
+        missing = self.client.post(reverse('reel-like', kwargs={'pk': UUID(int=1)}))
+        unpublished = self.client.post(reverse('reel-like', kwargs={'pk': draft.id}))
+
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(unpublished.status_code, status.HTTP_404_NOT_FOUND)
+        draft.refresh_from_db()
+        self.assertEqual(draft.likes_count, 0)
+
+    @override_settings(COUNTER_BUFFER={'HOT_THRESHOLD': 3, 'RATE_WINDOW': 3600, 'FLUSH_INTERVAL': 3600})
+    def test_bursts_on_a_hot_object_are_buffered_then_flushed_in_one_update(self):
+        url = reverse('live-stream-react', kwargs={'pk': self.stream.id})
+
+        totals = [self.client.post(url).data['reactions'] for _ in range(10)]
+
+        self.assertEqual(totals, list(range(1, 11)))
+        self.stream.refresh_from_db()
+        self.assertEqual(self.stream.reactions, 3)
+        self.assertEqual(counters.pending('live-streams', self.stream.id), 7)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counters.flush(), 7)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.stream.refresh_from_db()
+        self.assertEqual(self.stream.reactions, 10)
+        self.assertEqual(counters.pending('live-streams', self.stream.id), 0)
+
+    @override_settings(COUNTER_BUFFER={'HOT_THRESHOLD': 3, 'RATE_WINDOW': 3600, 'FLUSH_INTERVAL': 3600})
+    def test_flush_command_drains_increments_buffered_by_other_processes(self):
+        url = reverse('live-stream-react', kwargs={'pk': self.stream.id})
+        for _ in range(7):
+            self.client.post(url)
+
+        # The pending index lives in the shared cache, not in this process.
+        out = StringIO()
+        call_command('flush_counters', stdout=out)
+
+        self.assertIn('Flushed 4 buffered increments.', out.getvalue())
+        self.stream.refresh_from_db()
+        self.assertEqual(self.stream.reactions, 7)
+        self.assertEqual(counters.pending('live-streams', self.stream.id), 0)
+        self.assertEqual(counters.flush(), 0)
+
+    def test_likes_invalidate_the_list_cache_at_most_once_per_interval(self):
+        list_url = reverse('sermon-list')
+        like_url = reverse('sermon-like', kwargs={'pk': self.sermon.id})
+        self.client.post(like_url)
+        self.client.get(list_url)
+
+        for _ in range(3):
+            self.client.post(like_url)
+
+        self.assertEqual(self.client.get(list_url)['X-Cache'], 'HIT')
+        cache.delete('counter:invalidated:sermons')
+        self.client.post(like_url)
+        self.assertEqual(self.client.get(list_url)['X-Cache'], 'MISS')
+
+    def test_like_changes_the_list_validators_and_cached_response(self):
+        list_url = reverse('sermon-list')
+        before = self.client.get(list_url)
+
+        self.client.post(reverse('sermon-like', kwargs={'pk': self.sermon.id}))
+        after = self.client.get(list_url, HTTP_IF_NONE_MATCH=before['ETag'])
+
+        self.assertEqual(after.status_code, status.HTTP_200_OK)
+        self.assertEqual(after['X-Cache'], 'MISS')
+        self.assertNotEqual(after['ETag'], before['ETag'])
+
+
+class SearchAndFilterTests(APITestCase):
+    def setUp(self):
+        grace = Series.objects.create(title='Grace Abounding', description='Romans')
+        Sermon.objects.create(title='Amazing grace', description='Romans 5', preacher='Pastor Obed', series=grace)
+        Sermon.objects.create(title='Living hope', description='1 Peter 1', preacher='Pastor Ama')
+        Sermon.objects.create(title='Faith that works', description='James 2', preacher='Pastor Obed')
+
+    def titles(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(row['title'] for row in response.data['results'])
+
+    def test_search_matches_any_declared_field_case_insensitively(self):
+        self.assertEqual(self.titles(self.client.get(reverse('sermon-list'), {'search': 'GRACE'})), ['Amazing grace'])
+        self.assertEqual(self.titles(self.client.get(reverse('sermon-list'), {'search': 'peter'})), ['Living hope'])
+        self.assertEqual(self.titles(self.client.get(reverse('sermon-list'), {'search': 'abounding'})), ['Amazing grace'])
+
+    def test_filterset_fields_filter_exactly_and_combine_with_search(self):
+        by_preacher = self.client.get(reverse('sermon-list'), {'preacher': 'Pastor Obed'})
+        combined = self.client.get(reverse('sermon-list'), {'preacher': 'Pastor Obed', 'search': 'james'})
+        unknown = self.client.get(reverse('sermon-list'), {'likes': 0})
+
+        self.assertEqual(self.titles(by_preacher), ['Amazing grace', 'Faith that works'])
+        self.assertEqual(self.titles(combined), ['Faith that works'])
+        self.assertEqual(len(unknown.data['results']), 3)
+
+    def test_search_keeps_the_view_visibility_rules(self):
+        Reel.objects.create(title='Choir rehearsal', video_url='https://example.com/a.mp4')
+        Reel.objects.create(title='Choir draft', video_url='https://example.com/b.mp4', is_published=False)
+
+        response = self.client.get(reverse('reel-list'), {'search': 'choir'})
+
+        self.assertEqual(self.titles(response), ['Choir rehearsal'])
+
+
+class UnifiedSearchTests(APITestCase):
+    def setUp(self):
+        self.sermon = Sermon.objects.create(title='Baptism and new life', description='Romans 6', preacher='Pastor Ama')
+        Event.objects.create(name='Baptism service', description='Riverside baptisms', location='Lake', date=timezone.now().date())
+        Announcement.objects.create(title='Choir practice', content='Bring your baptism certificate')
+        Reel.objects.create(title='Baptism draft', video_url='https://example.com/reel.mp4', is_published=False)
+        Devotion.objects.create(title='Walking in grace', Bible_verse={'reference': 'Rom 6:4'}, content='Buried with him by baptism')
+
+    def search(self, **params):
+        response = self.client.get(reverse('search'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['results']
+
+    def test_one_query_searches_every_content_type(self):
+        results = self.search(q='baptism')
+
+        self.assertEqual(sorted(row['type'] for row in results), ['announcement', 'devotion', 'event', 'sermon'])
+        sermon = next(row for row in results if row['type'] == 'sermon')
+        self.assertEqual(sermon['id'], str(self.sermon.id))
+        self.assertTrue(sermon['url'].endswith(reverse('sermon-detail', kwargs={'sermon_id': self.sermon.id})))
+
+    def test_type_filter_and_multiple_terms(self):
+        self.assertEqual([row['type'] for row in self.search(q='baptism', type='event,sermon')].count('sermon'), 1)
+        self.assertEqual([row['title'] for row in self.search(q='baptism pastor')], ['Baptism and new life'])
+        self.assertEqual(self.search(q=''), [])
+
+    def test_documents_follow_saves_and_deletes(self):
+        self.sermon.title = 'Born again'
+        self.sermon.description = 'John 3'
+        self.sermon.save()
+        self.assertEqual([row['title'] for row in self.search(q='born')], ['Born again'])
+
+        self.sermon.delete()
+        self.assertEqual(self.search(q='born'), [])
+
+    def test_unpublished_reels_are_hidden_from_the_public(self):
+        self.assertNotIn('reel', [row['type'] for row in self.search(q='draft')])
+
+        self.client.force_authenticate(get_user_model().objects.create(username='search_staff', is_staff=True))
+        self.assertEqual([row['type'] for row in self.search(q='draft')], ['reel'])
+
+    def test_rebuild_restores_documents_skipped_by_bulk_writes(self):
+        Sermon.objects.bulk_create([Sermon(title='Bulk imported sermon', description='Archive')])
+        self.assertEqual(self.search(q='archive'), [])
+
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        self.assertEqual([row['title'] for row in self.search(q='archive')], ['Bulk imported sermon'])
+
+
+class IndexUsageTests(TestCase):
+    """EXPLAIN each list view's query and check the planner picks its index."""
+
+    def plan(self, view_class, user=None, query=None, **kwargs):
+        request = Request(APIRequestFactory().get('/', query or {}))
+        request.user = user or AnonymousUser()
+        view = view_class()
+        view.setup(request, **kwargs)
+        queryset = view.filter_queryset(view.get_queryset())
+        if 'cursor' in request.query_params:
+            queryset = view.paginator.cursor_queryset(queryset, request, view)
+        queryset = queryset[:10]
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # Test tables are tiny; make the planner show which index it
+                # would use at production volumes.
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        return queryset.explain()
+
+    def assertUsesIndex(self, index_name, view_class, **kwargs):
+        plan = self.plan(view_class, **kwargs)
+        self.assertIn(index_name, plan, f'{view_class.__name__} does not use {index_name}:\n{plan}')
+
+    def test_list_views_order_through_an_index(self):
+        cases = [
+            ('sermon_date_idx', views.ListSermon),
+            ('series_date_idx', views.ListSeries),
+            ('event_date_idx', views.ListEvent),
+            ('devotion_date_idx', views.ListDevotion),
+            ('reflection_date_idx', views.ListReflection),
+            ('prayer_request_date_idx', views.ListPrayerRequest),
+            ('announcement_date_idx', views.ListAnnouncement),
+            ('live_stream_date_idx', views.ListLiveStream),
+            ('gallery_date_idx', views.ListGallery),
+            ('galleryimage_date_idx', views.ListGalleryImage),
+            ('intent_created_idx', views.ListContributionIntent),
+        ]
+        for index_name, view_class in cases:
+            with self.subTest(view=view_class.__name__):
+                self.assertUsesIndex(index_name, view_class)
+
+    def test_filtered_views_use_partial_indexes(self):
+        self.assertUsesIndex('reel_published_feed_idx', views.ListReel)
+        self.assertUsesIndex('channel_active_order_idx', views.ListContributionChannel)
+
+        staff = get_user_model().objects.create(username='index_staff', is_staff=True)
+        self.assertUsesIndex('reel_feed_idx', views.ListReel, user=staff)
+
+    def test_cursor_pages_order_through_an_index(self):
+        staff = get_user_model().objects.create(username='cursor_staff', is_staff=True)
+        cases = [
+            ('reel_published_feed_idx', views.ListReel, None),
+            ('reel_feed_idx', views.ListReel, staff),
+            ('reflection_date_idx', views.ListReflection, None),
+            ('prayer_request_date_idx', views.ListPrayerRequest, staff),
+            ('intent_created_idx', views.ListContributionIntent, staff),
+        ]
+        for index_name, view_class, user in cases:
+            # A later page starts after a (dates..., id) position.
+            position = [timezone.now()] * (len(view_class.cursor_ordering) - 1) + [UUID(int=1)]
+            later = view_class.pagination_class()._encode_cursor(position)
+            for cursor in ('', later):
+                with self.subTest(view=view_class.__name__, staff=bool(user), cursor=cursor):
+                    self.assertUsesIndex(index_name, view_class, user=user, query={'cursor': cursor})
+
+    def test_reflections_for_a_devotion_use_the_composite_index(self):
+        self.assertUsesIndex('reflection_devotion_date_idx', views.get_reflections_for_devotion, devotion_id=UUID(int=1))
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.sermon = Sermon.objects.create(title='Grace', description='Sermon')
+        self.url = reverse('sermon-list')
+
+    def test_repeat_requests_are_served_from_the_cache_without_queries(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_misses_validate_the_rendered_body_without_an_extra_query(self):
+        first = self.client.get(self.url)
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified['X-Cache'], 'MISS')
+        self.assertEqual(not_modified['ETag'], first['ETag'])
+        self.assertFalse(any('MAX(' in query['sql'].upper() for query in queries.captured_queries))
+
+    def test_query_string_and_role_get_their_own_entries(self):
+        self.client.get(self.url)
+
+        self.assertEqual(self.client.get(self.url, {'search': 'grace'})['X-Cache'], 'MISS')
+        self.client.force_authenticate(get_user_model().objects.create(username='cache_staff', is_staff=True))
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+    def test_each_host_gets_its_own_entry(self):
+        Devotion.objects.create(title='Morning', content='Devotion')
+        url = reverse('devotion-list')
+
+        forged = self.client.get(url, HTTP_HOST='evil.example')
+        genuine = self.client.get(url, HTTP_HOST='api.church.org')
+
+        self.assertEqual(forged['X-Cache'], 'MISS')
+        self.assertEqual(genuine['X-Cache'], 'MISS')
+        self.assertNotIn(b'evil.example', genuine.content)
+        self.assertIn(b'http://api.church.org/', genuine.content)
+        self.assertEqual(self.client.get(url, HTTP_HOST='api.church.org')['X-Cache'], 'HIT')
+
+    def test_writes_to_grouped_models_invalidate(self):
+        self.client.get(self.url)
+        self.sermon.title = 'Grace Abounds'
+        self.sermon.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['title'], 'Grace Abounds')
+
+        devotion = Devotion.objects.create(title='Morning', content='Devotion')
+        devotions_url = reverse('devotion-list')
+        self.client.get(devotions_url)
+        Reflection.objects.create(name='Ama', content='Amen', devotion=devotion)
+        self.assertEqual(self.client.get(devotions_url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'HIT')
+
+
+class ContributionIntentExportTests(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create(username='finance', is_staff=True)
+        self.momo = ContributionChannel.objects.create(name='MTN MOMO', channel_type='momo', account_name='Elevation', account_number='0240000000')
+        self.bank = ContributionChannel.objects.create(name='GCB', channel_type='bank', account_name='Elevation', account_number='1010')
+        now = timezone.now()
+        rows = [
+            (self.momo, 'confirmed', 'tithe', '=HYPERLINK("x")', now - timedelta(days=10)),
+            (self.momo, 'pending', 'offering', 'Ama', now - timedelta(days=2)),
+            (self.bank, 'confirmed', 'tithe', 'Kofi', now - timedelta(days=1)),
+        ]
+        for channel, intent_status, purpose, donor, created in rows:
+            intent = ContributionIntent.objects.create(
+                channel=channel, amount=Decimal('50.00'), status=intent_status, purpose=purpose, donor_name=donor,
+            )
+            ContributionIntent.objects.filter(pk=intent.pk).update(created_at=created)
+        self.client.force_authenticate(self.admin)
+
+    def read(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_csv_streams_every_intent_oldest_first_in_one_query(self):
+        response = self.client.get(reverse('contribution-intent-export-csv'))
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('attachment; filename="contribution-intents-', response['Content-Disposition'])
+
+        with self.assertNumQueries(1):
+            rows = list(csv.DictReader(self.read(response).splitlines()))
+
+        self.assertEqual([row['donor_name'] for row in rows], ['\'=HYPERLINK("x")', 'Ama', 'Kofi'])
+        self.assertEqual(rows[2]['channel'], 'GCB')
+        self.assertEqual(rows[2]['amount'], '50.00')
+
+    def test_ndjson_applies_status_channel_purpose_and_date_filters(self):
+        url = reverse('contribution-intent-export-ndjson')
+        since = (timezone.now() - timedelta(days=5)).date().isoformat()
+
+        confirmed = [json.loads(line) for line in self.read(self.client.get(url, {'status': 'confirmed'})).splitlines()]
+        recent_momo = [json.loads(line) for line in self.read(
+            self.client.get(url, {'channel': str(self.momo.id), 'date_from': since})
+        ).splitlines()]
+        tithes_to_date = self.read(self.client.get(url, {'purpose': 'tithe', 'date_to': since}))
+
+        self.assertEqual([row['donor_name'] for row in confirmed], ['=HYPERLINK("x")', 'Kofi'])
+        self.assertEqual([row['donor_name'] for row in recent_momo], ['Ama'])
+        self.assertEqual(len(tithes_to_date.splitlines()), 1)
+
+    def test_invalid_filters_and_non_staff_are_rejected(self):
+        bad = self.client.get(reverse('contribution-intent-export-csv'), {'status': 'lost', 'date_from': '2026-02-01', 'date_to': '2026-01-01'})
+        self.assertEqual(bad.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(None)
+        self.assertIn(
+            self.client.get(reverse('contribution-intent-export-csv')).status_code,
+            (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN),
+        )
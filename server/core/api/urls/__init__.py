@@ -15,6 +15,7 @@ from . import (
     analytics,
     site_config,
     bible,
+    search,
 )
 
 urlpatterns = [
@@ -34,6 +35,7 @@ urlpatterns = [
     path('analytics/', include(analytics.urlpatterns)),
     path('bible/', include(bible.urlpatterns)),
     path('site-config/', include(site_config.urlpatterns)),
+    path('search/', include(search.urlpatterns)),
 
 
 ]
@@ -10,4 +10,5 @@ urlpatterns = [
     path('upcoming/', views.AnalyticsUpcoming.as_view(), name='analytics-upcoming'),
     path('top-content/', views.AnalyticsTopContent.as_view(), name='analytics-top-content'),
     path('timeline/', views.AnalyticsTimeline.as_view(), name='analytics-timeline'),
+    path('profiling/', views.AnalyticsProfiling.as_view(), name='analytics-profiling'),
 ]
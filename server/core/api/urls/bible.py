@@ -3,5 +3,6 @@ from api import views
 
 urlpatterns = [
     path('passage/', views.BiblePassageDetail.as_view(), name='bible-passage-detail'),
+    path('passages/', views.BiblePassageBatch.as_view(), name='bible-passage-batch'),
     path('search/', views.BiblePassageSearch.as_view(), name='bible-passage-search'),
 ]
@@ -8,6 +8,8 @@ urlpatterns = [
     path('channels/<uuid:channel_id>/update/', views.UpdateContributionChannel.as_view(), name='contribution-channel-update'),
 
     path('intents/', views.ListContributionIntent.as_view(), name='contribution-intent-list'),
+    path('intents/export/csv/', views.ExportContributionIntent.as_view(export_format='csv'), name='contribution-intent-export-csv'),
+    path('intents/export/ndjson/', views.ExportContributionIntent.as_view(export_format='ndjson'), name='contribution-intent-export-ndjson'),
     path('intents/create/', views.CreateContributionIntent.as_view(), name='contribution-intent-create'),
     path('intents/<uuid:intent_id>/', views.DetailContributionIntent.as_view(), name='contribution-intent-detail'),
     path('intents/<uuid:intent_id>/update/', views.UpdateContributionIntent.as_view(), name='contribution-intent-update'),
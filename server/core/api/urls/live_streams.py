@@ -6,4 +6,5 @@ urlpatterns = [
     path('<uuid:live_stream_id>/', views.DetailLiveStream.as_view(), name='live-stream-detail'),
     path('create/', views.CreateLiveStream.as_view(), name='live-stream'),
     path('<uuid:live_stream_id>/update/', views.UpdateLiveStream.as_view(), name='live-stream-update'),
+    path('<uuid:pk>/react/', views.IncrementCounter.as_view(kind='live-streams'), name='live-stream-react'),
 ]
@@ -6,4 +6,5 @@ urlpatterns = [
     path('<uuid:reel_id>/', views.DetailReel.as_view(), name='reel-detail'),
     path('create/', views.CreateReel.as_view(), name='reel-create'),
     path('<uuid:reel_id>/update/', views.UpdateReel.as_view(), name='reel-update'),
+    path('<uuid:pk>/like/', views.IncrementCounter.as_view(kind='reels'), name='reel-like'),
 ]
@@ -6,5 +6,6 @@ urlpatterns = [
     path('<uuid:reflection_id>/', views.DetailReflection.as_view(), name='reflection-detail'),
     path('create/', views.CreateReflection.as_view(), name='reflection'),
     path('<uuid:reflection_id>/update/', views.UpdateReflection.as_view(), name='reflection-update'),
+    path('<uuid:pk>/like/', views.IncrementCounter.as_view(kind='reflections'), name='reflection-like'),
     path('devotion/<uuid:devotion_id>/', views.get_reflections_for_devotion.as_view(), name='reflections-for-devotion'),
 ]
@@ -0,0 +1,6 @@
+from django.urls import path
+from api import views
+
+urlpatterns = [
+    path('', views.UnifiedSearch.as_view(), name='search'),
+]
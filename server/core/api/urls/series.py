@@ -6,4 +6,5 @@ urlpatterns = [
     path('<uuid:series_id>/', views.DetailSeries.as_view(), name='series-detail'),
     path('create/', views.CreateSeries.as_view(), name='series'),
     path('<uuid:series_id>/update/', views.UpdateSeries.as_view(), name='series-update'),
+    path('<uuid:pk>/like/', views.IncrementCounter.as_view(kind='series'), name='series-like'),
 ]
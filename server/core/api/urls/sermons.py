@@ -7,5 +7,6 @@ urlpatterns = [
     path('<uuid:sermon_id>/', views.DetailSermon.as_view(), name='sermon-detail'),
     path('create/', views.CreateSermon.as_view(), name='sermon'),
     path('<uuid:sermon_id>/update/', views.UpdateSermon.as_view(), name='sermon-update'),
+    path('<uuid:pk>/like/', views.IncrementCounter.as_view(kind='sermons'), name='sermon-like'),
     
 ]
@@ -22,6 +22,7 @@ from .models import (
     NavigationItem,
     PageConfig,
     SectionConfig,
+    SearchDocument,
     )
 from .serializers import ( 
     SermonSerializer, 
@@ -34,6 +35,7 @@ from .serializers import (
     AnnouncementSerializer,
     LiveStreamSerializer,
     BiblePassageSerializer,
+    BiblePassageBatchSerializer,
     StaffUserSerializer, 
     GallerySerializer,
     GalleryImageSerializer,
@@ -45,34 +47,126 @@ from .serializers import (
     NavigationItemSerializer,
     PageConfigSerializer,
     SectionConfigSerializer,
+    SearchResultSerializer,
+    ContributionIntentExportFilterSerializer,
+    with_available_sermons,
+    with_reflection_preview,
     )
-from .bible_service import fetch_bible_passage
+from . import bible_cache, counters, exports, profiling
+from .bible_reference import canonical_reference, reference_key
+from .bible_service import (
+    BiblePassageNotFound,
+    BibleServiceUnavailable,
+    fetch_bible_passage,
+)
+from .analytics import aggregate_metrics, daily_counts
+from .site_config import get_public_snapshot
+from .response_cache import CachedResponseMixin
+from .pagination import (
+    ConfigPagination,
+    FeedPagination,
+    LargeFeedPagination,
+    LargePagination,
+    SectionConfigPagination,
+    StandardPagination,
+)
 from rest_framework.permissions import IsAdminUser, AllowAny, BasePermission, SAFE_METHODS
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.throttling import ScopedRateThrottle
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from django.contrib.auth import get_user_model
 from rest_framework import parsers
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
-from django.db.models import Count, Sum, Q
-from django.db.models.functions import TruncDate
-from datetime import timedelta
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import Count, F, Max, Prefetch, Sum, Q
+from datetime import datetime, time, timedelta
+import hashlib
+import json
+import os
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET with 304 Not Modified while the client's validators still
+    match. They come from one aggregate over the rows the view would
+    serialize (count + latest updated_at, plus the same for each nested
+    relation in ``conditional_related``), checked before serialization.
+
+    Lists send only an ETag: a deleted row lowers the count but cannot move
+    the latest updated_at, so Last-Modified would keep clients on a stale
+    page. Detail views send both.
+    """
+    conditional_related = ()
+
+    def _is_detail(self):
+        return (self.lookup_url_kwarg or self.lookup_field) in self.kwargs
+
+    def _validator_queryset(self):
+        queryset = self.get_queryset()
+        if self._is_detail():
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            return queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return self.filter_queryset(queryset)
+
+    def uses_validator_query(self):
+        """False where another layer validates the rendered body instead."""
+        return True
+
+    def _validators(self, request):
+        aggregates = {"count": Count("pk", distinct=True), "updated": Max("updated_at")}
+        for index, relation in enumerate(self.conditional_related):
+            aggregates[f"related_{index}_count"] = Count(f"{relation}__pk", distinct=True)
+            aggregates[f"related_{index}_updated"] = Max(f"{relation}__updated_at")
+        values = self._validator_queryset().order_by().aggregate(**aggregates)
+
+        last_modified = None
+        if self._is_detail() and values["updated"] is not None:
+            stamps = [value for key, value in values.items() if key.endswith("_updated") or key == "updated"]
+            last_modified = int(max(stamp for stamp in stamps if stamp is not None).timestamp())
+
+        role = "staff" if request.user.is_authenticated and request.user.is_staff else "public"
+        fingerprint = repr((request.get_full_path(), role, sorted(values.items())))
+        etag = '"%s"' % hashlib.md5(fingerprint.encode("utf-8")).hexdigest()
+        return etag, last_modified
+
+    def get(self, request, *args, **kwargs):
+        if not self.uses_validator_query():
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = self._validators(request)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
 
 
 @extend_schema(tags=['Sermons'], description="Retrieve a list of sermons ordered by date.")
-class ListSermon(generics.ListAPIView):
-    queryset = Sermon.objects.order_by('-date')
+class ListSermon(CachedResponseMixin, ConditionalGetMixin, generics.ListAPIView):
+    response_cache_group = 'sermons'
+    queryset = Sermon.objects.select_related('resource').order_by('-date')
     serializer_class = SermonSerializer
+    conditional_related = ('resource',)
     ordering = ['-date']
     filterset_fields = ['series__title', 'preacher']
     search_fields = ['title', 'description', 'preacher', 'series__title']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
     
 
 @extend_schema(tags=['Sermons'], description="Retrieve details of a specific sermon by its ID.")
-class DetailSermon(generics.RetrieveAPIView):
-    queryset = Sermon.objects.all()
+class DetailSermon(ConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = Sermon.objects.select_related('resource')
     serializer_class = SermonSerializer
+    conditional_related = ('resource',)
     lookup_field = 'id'
     lookup_url_kwarg = 'sermon_id'
 
@@ -94,17 +188,16 @@ class UpdateSermon(generics.RetrieveUpdateDestroyAPIView):
     #Resources
 
 @extend_schema(tags=['Resources'], description="Retrieve a list of resources ordered by name.")
-class ListResource(generics.ListAPIView):
+class ListResource(ConditionalGetMixin, generics.ListAPIView):
     queryset = Resource.objects.order_by('-name')
     serializer_class = ResourceSerializer
     ordering = ['name']
     search_fields = ['name']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
 
 
 @extend_schema(tags=['Resources'], description="Retrieve details of a specific resource by its ID.")
-class DetailResource(generics.RetrieveAPIView):
+class DetailResource(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Resource.objects.all()
     serializer_class = ResourceSerializer
     lookup_field = 'id'
@@ -127,18 +220,20 @@ class UpdateResource(generics.RetrieveUpdateDestroyAPIView):
     #series
 
 @extend_schema(tags=['Series'], description="Retrieve a list of series ordered by date.")
-class ListSeries(generics.ListAPIView):
-    queryset = Series.objects.order_by('-date')
+class ListSeries(ConditionalGetMixin, generics.ListAPIView):
+    queryset = with_available_sermons(Series.objects.order_by('-date'))
     serializer_class = SeriesSerializer
+    conditional_related = ('sermon_series', 'sermon_series__resource')
     ordering = ['-date']
     search_fields = ['title', 'description']
-    pagination_class = PageNumberPagination
+    pagination_class = StandardPagination
     
 
 @extend_schema(tags=['Series'], description="Retrieve details of a specific series by its ID.")
-class DetailSeries(generics.RetrieveAPIView):
-    queryset = Series.objects.all()
+class DetailSeries(ConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = with_available_sermons(Series.objects.all())
     serializer_class = SeriesSerializer
+    conditional_related = ('sermon_series', 'sermon_series__resource')
     lookup_field = 'id'
     lookup_url_kwarg = 'series_id'
 
@@ -159,17 +254,17 @@ class UpdateSeries(generics.RetrieveUpdateDestroyAPIView):
     #Events
 
 @extend_schema(tags=['Events'], description="Retrieve a list of events ordered by date.")
-class ListEvent(generics.ListAPIView):
+class ListEvent(CachedResponseMixin, ConditionalGetMixin, generics.ListAPIView):
+    response_cache_group = 'events'
     queryset = Event.objects.order_by('date')
     serializer_class = EventSerializer
     ordering = ['-date', '-start_time']
     search_fields = ['name', 'description', 'location']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
     
 
 @extend_schema(tags=['Events'])
-class DetailEvent(generics.RetrieveAPIView):
+class DetailEvent(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     lookup_field = 'id'
@@ -192,18 +287,20 @@ class UpdateEvent(generics.RetrieveUpdateDestroyAPIView):
 
 #Devotions
 @extend_schema(tags=['Devotions'])
-class ListDevotion(generics.ListAPIView):
-    queryset = Devotion.objects.order_by('-date')
+class ListDevotion(CachedResponseMixin, ConditionalGetMixin, generics.ListAPIView):
+    response_cache_group = 'devotions'
+    queryset = with_reflection_preview(Devotion.objects.order_by('-date'))
     serializer_class = DevotionSerializer
+    conditional_related = ('reflections',)
     ordering = ['-date']
     search_fields = ['title', 'Bible_verse', 'content', 'date']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
 
 @extend_schema(tags=['Devotions'])
-class DetailDevotion(generics.RetrieveAPIView):
-    queryset = Devotion.objects.all()
+class DetailDevotion(ConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = with_reflection_preview(Devotion.objects.all())
     serializer_class = DevotionSerializer
+    conditional_related = ('reflections',)
     lookup_field = 'id'
     lookup_url_kwarg = 'devotion_id'
 
@@ -222,6 +319,14 @@ class UpdateDevotion(generics.RetrieveUpdateDestroyAPIView):
     lookup_url_kwarg = 'devotion_id'
 
 
+def _bible_error_status(exc):
+    if isinstance(exc, BiblePassageNotFound):
+        return 404
+    if isinstance(exc, BibleServiceUnavailable):
+        return 503
+    return 502
+
+
 @extend_schema(
     tags=['Bible'],
     summary='Fetch a Bible passage by reference',
@@ -255,33 +360,89 @@ class BiblePassageDetail(generics.GenericAPIView):
         if not reference:
             return Response({'detail': 'The reference query parameter is required.'}, status=400)
 
-        cached_passage = BiblePassageCache.objects.filter(reference__iexact=reference, translation=translation).first()
-        if cached_passage is not None:
+        reference = canonical_reference(reference)
+        cached_passage = BiblePassageCache.objects.filter(
+            reference_key=reference_key(reference), translation=translation
+        ).first()
+        if cached_passage is not None and bible_cache.is_fresh(cached_passage):
+            bible_cache.record_hit(cached_passage)
             serializer = BiblePassageSerializer(cached_passage)
             return Response(serializer.data)
 
-        passage_data = fetch_bible_passage(reference, translation)
-        cached_passage = BiblePassageCache.objects.create(
-            reference=reference,
-            translation=translation,
-            passage_text=passage_data['passage_text'],
-            raw_response=passage_data['raw_response'],
-        )
+        try:
+            passage_data = fetch_bible_passage(reference, translation)
+        except ValueError as exc:
+            if cached_passage is not None and not isinstance(exc, BiblePassageNotFound):
+                # Serve the expired copy rather than fail while the upstream is down.
+                bible_cache.record_hit(cached_passage)
+                return Response(BiblePassageSerializer(cached_passage).data)
+            return Response({'detail': str(exc)}, status=_bible_error_status(exc))
+
+        # Coalesced requests for the same reference all land here at once.
+        cached_passage = bible_cache.store_passage(reference, translation, passage_data)
         serializer = BiblePassageSerializer(cached_passage)
         return Response(serializer.data)
 
 
+@extend_schema(
+    tags=['Bible'],
+    summary='Fetch several Bible passages at once',
+    description=(
+        'Resolve up to 50 references in one request, e.g. every passage quoted on a devotion page. '
+        'Cached passages are read in a single query and the rest are fetched concurrently. '
+        'Results come back in request order; each carries its own status, and failed lookups carry a detail message.'
+    ),
+    request=BiblePassageBatchSerializer,
+)
+class BiblePassageBatch(generics.GenericAPIView):
+    permission_classes = [AllowAny]
+    serializer_class = BiblePassageBatchSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        default_translation = serializer.validated_data['translation'].strip().lower() or 'kjv'
+
+        lookups = [
+            (
+                canonical_reference(item['reference']),
+                (item.get('translation') or '').strip().lower() or default_translation,
+            )
+            for item in serializer.validated_data['passages']
+        ]
+        resolved = bible_cache.resolve_passages(lookups)
+
+        results = []
+        for reference, translation in lookups:
+            result = resolved[(reference_key(reference), translation)]
+            if isinstance(result, Exception):
+                results.append({
+                    'reference': reference,
+                    'translation': translation,
+                    'status': _bible_error_status(result),
+                    'detail': str(result),
+                })
+            else:
+                results.append({
+                    'reference': reference,
+                    'translation': translation,
+                    'status': 200,
+                    'passage': BiblePassageSerializer(result).data,
+                })
+        return Response({'results': results})
+
+
 @extend_schema(
     tags=['Bible'],
     summary='Search cached Bible passages',
-    description='Search the locally cached Bible passage results by reference or passage text. Use query or reference to filter results.',
+    description='Search the locally cached Bible passage results by reference or passage text. Use query or reference to filter results. Text searches are ranked by relevance, with reference matches weighted above passage text.',
     responses=BiblePassageSerializer,
     parameters=[
         OpenApiParameter(
             name='query',
             type=str,
             location=OpenApiParameter.QUERY,
-            description='Text search term for passage content or reference. Optional.',
+            description='Text search term for passage content or reference. Supports quoted phrases, OR and -exclusions. Optional.',
             required=False,
         ),
         OpenApiParameter(
@@ -297,8 +458,7 @@ class BiblePassageSearch(generics.ListAPIView):
     queryset = BiblePassageCache.objects.order_by('-fetched_at')
     serializer_class = BiblePassageSerializer
     permission_classes = [AllowAny]
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 20
+    pagination_class = LargePagination
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -306,25 +466,37 @@ class BiblePassageSearch(generics.ListAPIView):
         reference = self.request.query_params.get('reference', '').strip()
 
         if reference:
-            queryset = queryset.filter(reference__icontains=reference)
+            # "Jn 3" matches every cached passage of John 3, but not 1 John 3
+            # or John 31. Prefix lookups can walk the reference_key index.
+            key = reference_key(reference)
+            matches = Q(reference_key=key)
+            for boundary in (' ', ':', '-'):
+                matches |= Q(reference_key__startswith=key + boundary)
+            queryset = queryset.filter(matches)
         if query:
-            queryset = queryset.filter(Q(reference__icontains=query) | Q(passage_text__icontains=query))
+            if connection.vendor == 'postgresql':
+                search_query = SearchQuery(query, search_type='websearch', config='english')
+                queryset = queryset.filter(search_vector=search_query).annotate(
+                    rank=SearchRank(F('search_vector'), search_query)
+                ).order_by('-rank', '-fetched_at')
+            else:
+                queryset = queryset.filter(Q(reference__icontains=query) | Q(passage_text__icontains=query))
 
         return queryset
 
 
 #Reflections
 @extend_schema(tags=['Reflections'])
-class ListReflection(generics.ListAPIView):
-    queryset = Reflection.objects.order_by('-date')
+class ListReflection(ConditionalGetMixin, generics.ListAPIView):
+    queryset = Reflection.objects.order_by('-date', '-id')
     serializer_class = ReflectionSerializer
     ordering = ['-date']
+    cursor_ordering = ['-date', '-id']
     search_fields = ['name', 'content', 'date', 'devotion__title']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = FeedPagination
 
 @extend_schema(tags=['Reflections'])
-class DetailReflection(generics.RetrieveAPIView):
+class DetailReflection(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Reflection.objects.all()
     serializer_class = ReflectionSerializer
     lookup_field = 'id'
@@ -345,10 +517,9 @@ class UpdateReflection(generics.RetrieveUpdateDestroyAPIView):
     lookup_url_kwarg = 'reflection_id'
 
 @extend_schema(tags=['Reflections'])
-class get_reflections_for_devotion(generics.ListAPIView):
+class get_reflections_for_devotion(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = ReflectionSerializer
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
 
     def get_queryset(self):
         devotion_id = self.kwargs['devotion_id']
@@ -356,13 +527,13 @@ class get_reflections_for_devotion(generics.ListAPIView):
 
 @extend_schema(tags=['Prayer Requests'])
 class ListPrayerRequest(generics.ListAPIView):
-    queryset = Prayer_request.objects.order_by('-date')
+    queryset = Prayer_request.objects.order_by('-date', '-id')
     serializer_class = PrayerRequestSerializer
     permission_classes = [IsAdminUser]
     ordering = ['-date']
+    cursor_ordering = ['-date', '-id']
     search_fields = ['name', 'subject', 'date']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = FeedPagination
 
 @extend_schema(tags=['Prayer Requests'])
 class DetailPrayerRequest(generics.RetrieveAPIView):
@@ -387,16 +558,16 @@ class DeletePrayerRequest(generics.RetrieveDestroyAPIView):
     lookup_url_kwarg = 'prayer_request_id'
 
 @extend_schema(tags=['Announcements'])
-class ListAnnouncement(generics.ListAPIView):
+class ListAnnouncement(CachedResponseMixin, ConditionalGetMixin, generics.ListAPIView):
+    response_cache_group = 'announcements'
     queryset = Announcement.objects.order_by('-date')
     serializer_class = AnnouncementSerializer
     ordering = ['-date']
     search_fields = ['title', 'content', 'date']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
 
 @extend_schema(tags=['Announcements'])
-class DetailAnnouncement(generics.RetrieveAPIView):
+class DetailAnnouncement(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Announcement.objects.all()
     serializer_class = AnnouncementSerializer
     lookup_field = 'id'
@@ -419,16 +590,15 @@ class UpdateAnnouncement(generics.RetrieveUpdateDestroyAPIView):
 
 #Live Streams
 @extend_schema(tags=['Live Streams'])
-class ListLiveStream(generics.ListAPIView):
+class ListLiveStream(ConditionalGetMixin, generics.ListAPIView):
     queryset = Live_stream.objects.order_by('-date')
     serializer_class = LiveStreamSerializer
     ordering = ['-date']
     search_fields = ['title', 'description', 'status', 'date']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
 
 @extend_schema(tags=['Live Streams'])
-class DetailLiveStream(generics.RetrieveAPIView):
+class DetailLiveStream(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Live_stream.objects.all()
     serializer_class = LiveStreamSerializer
     lookup_field = 'id'
@@ -480,18 +650,29 @@ class RetrieveUpdateThemeSettings(SingletonRetrieveUpdateMixin):
 
 @extend_schema(tags=['Site Config'], description="List and create navigation items.")
 class ListCreateNavigationItem(generics.ListCreateAPIView):
-    queryset = NavigationItem.objects.select_related('parent').order_by('location', 'display_order', 'label')
+    queryset = NavigationItem.objects.select_related('parent').prefetch_related(
+        Prefetch(
+            'children',
+            queryset=NavigationItem.objects.filter(is_enabled=True).order_by('display_order', 'label'),
+            to_attr='enabled_children',
+        )
+    ).order_by('location', 'display_order', 'label')
     serializer_class = NavigationItemSerializer
     permission_classes = [IsAdminUser]
     ordering = ['location', 'display_order', 'label']
     search_fields = ['label', 'url', 'location', 'item_type']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 50
+    pagination_class = ConfigPagination
 
 
 @extend_schema(tags=['Site Config'], description="Retrieve, update, or delete one navigation item.")
 class DetailUpdateNavigationItem(generics.RetrieveUpdateDestroyAPIView):
-    queryset = NavigationItem.objects.select_related('parent').all()
+    queryset = NavigationItem.objects.select_related('parent').prefetch_related(
+        Prefetch(
+            'children',
+            queryset=NavigationItem.objects.filter(is_enabled=True).order_by('display_order', 'label'),
+            to_attr='enabled_children',
+        )
+    )
     serializer_class = NavigationItemSerializer
     permission_classes = [IsAdminUser]
     lookup_field = 'id'
@@ -500,18 +681,17 @@ class DetailUpdateNavigationItem(generics.RetrieveUpdateDestroyAPIView):
 
 @extend_schema(tags=['Site Config'], description="List and create page configs.")
 class ListCreatePageConfig(generics.ListCreateAPIView):
-    queryset = PageConfig.objects.order_by('display_order', 'slug')
+    queryset = PageConfig.objects.prefetch_related('sections').order_by('display_order', 'slug')
     serializer_class = PageConfigSerializer
     permission_classes = [IsAdminUser]
     ordering = ['display_order', 'slug']
     search_fields = ['slug', 'title', 'subtitle']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 50
+    pagination_class = ConfigPagination
 
 
 @extend_schema(tags=['Site Config'], description="Retrieve, update, or delete one page config.")
 class DetailUpdatePageConfig(generics.RetrieveUpdateDestroyAPIView):
-    queryset = PageConfig.objects.all()
+    queryset = PageConfig.objects.prefetch_related('sections')
     serializer_class = PageConfigSerializer
     permission_classes = [IsAdminUser]
     lookup_field = 'slug'
@@ -524,8 +704,7 @@ class ListCreateSectionConfig(generics.ListCreateAPIView):
     permission_classes = [IsAdminUser]
     ordering = ['page__slug', 'display_order', 'key']
     search_fields = ['key', 'title', 'page__slug']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 100
+    pagination_class = SectionConfigPagination
 
     def get_queryset(self):
         queryset = SectionConfig.objects.select_related('page').order_by('page__slug', 'display_order', 'key')
@@ -549,37 +728,24 @@ class PublicSiteConfiguration(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        site = SiteSettingsSerializer(SiteSettings.load()).data
-        theme = ThemeSettingsSerializer(ThemeSettings.load()).data
-
-        navigation_queryset = NavigationItem.objects.filter(
-            is_enabled=True,
-            parent__isnull=True
-        ).order_by('location', 'display_order', 'label')
-        navigation = NavigationItemSerializer(navigation_queryset, many=True).data
-
-        pages_queryset = PageConfig.objects.filter(is_enabled=True).prefetch_related('sections').order_by(
-            'display_order', 'slug'
-        )
-        pages = PageConfigSerializer(pages_queryset, many=True).data
-
-        return Response({
-            "site": site,
-            "theme": theme,
-            "navigation": navigation,
-            "pages": pages,
-        })
+        snapshot = get_public_snapshot()
+        not_modified = get_conditional_response(request, etag=snapshot["etag"])
+        if not_modified is not None:
+            return not_modified
+        if request.accepted_renderer.format != "json":
+            # e.g. the browsable API; only JSON clients get the cached bytes.
+            return Response(json.loads(snapshot["body"]), headers={"ETag": snapshot["etag"]})
+        return HttpResponse(snapshot["body"], content_type="application/json", headers={"ETag": snapshot["etag"]})
 
 
 # Contributions
 @extend_schema(tags=['Contributions'], description="List active contribution channels for users.")
-class ListContributionChannel(generics.ListAPIView):
+class ListContributionChannel(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = ContributionChannelSerializer
     permission_classes = [AllowAny]
     ordering = ['display_order', 'name']
     search_fields = ['name', 'account_name', 'account_number', 'bank_name', 'network']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 20
+    pagination_class = LargePagination
 
     def get_queryset(self):
         if self.request.user.is_authenticated and self.request.user.is_staff:
@@ -588,7 +754,7 @@ class ListContributionChannel(generics.ListAPIView):
 
 
 @extend_schema(tags=['Contributions'], description="Retrieve details of a contribution channel.")
-class DetailContributionChannel(generics.RetrieveAPIView):
+class DetailContributionChannel(ConditionalGetMixin, generics.RetrieveAPIView):
     serializer_class = ContributionChannelSerializer
     permission_classes = [AllowAny]
     lookup_field = 'id'
@@ -625,13 +791,56 @@ class CreateContributionIntent(generics.CreateAPIView):
 
 @extend_schema(tags=['Contributions'], description="List contribution intents. Staff/Admin only.")
 class ListContributionIntent(generics.ListAPIView):
-    queryset = ContributionIntent.objects.select_related('channel', 'confirmed_by').order_by('-created_at')
+    queryset = ContributionIntent.objects.select_related('channel', 'confirmed_by').order_by('-created_at', '-id')
     serializer_class = ContributionIntentSerializer
     permission_classes = [IsAdminUser]
     ordering = ['-created_at']
+    cursor_ordering = ['-created_at', '-id']
     search_fields = ['donor_name', 'donor_phone', 'reference', 'channel__name']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 20
+    pagination_class = LargeFeedPagination
+
+
+@extend_schema(
+    tags=['Contributions'],
+    parameters=[ContributionIntentExportFilterSerializer],
+    responses={(200, 'text/csv'): OpenApiTypes.STR, (200, 'application/x-ndjson'): OpenApiTypes.STR},
+    description="Stream every matching contribution intent as CSV or NDJSON, oldest first. Staff/Admin only.",
+)
+class ExportContributionIntent(APIView):
+    permission_classes = [IsAdminUser]
+    export_format = 'csv'
+    content_types = {
+        'csv': 'text/csv; charset=utf-8',
+        'ndjson': 'application/x-ndjson',
+    }
+
+    def get_queryset(self, filters):
+        queryset = ContributionIntent.objects.order_by('created_at', 'id')
+        for field in ('status', 'purpose'):
+            if field in filters:
+                queryset = queryset.filter(**{field: filters[field]})
+        if 'channel' in filters:
+            queryset = queryset.filter(channel_id=filters['channel'])
+        # Whole days in the site time zone, as plain ranges so the
+        # created_at index still applies.
+        if 'date_from' in filters:
+            start = datetime.combine(filters['date_from'], time.min)
+            queryset = queryset.filter(created_at__gte=timezone.make_aware(start))
+        if 'date_to' in filters:
+            end = datetime.combine(filters['date_to'] + timedelta(days=1), time.min)
+            queryset = queryset.filter(created_at__lt=timezone.make_aware(end))
+        return queryset
+
+    def get(self, request):
+        params = ContributionIntentExportFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        rows = exports.intent_rows(self.get_queryset(params.validated_data))
+        lines = exports.csv_lines(rows) if self.export_format == 'csv' else exports.ndjson_lines(rows)
+
+        response = StreamingHttpResponse(lines, content_type=self.content_types[self.export_format])
+        filename = f"contribution-intents-{timezone.now():%Y%m%d-%H%M%S}.{self.export_format}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
 
 
 @extend_schema(tags=['Contributions'], description="Retrieve one contribution intent. Staff/Admin only.")
@@ -654,30 +863,34 @@ class UpdateContributionIntent(generics.RetrieveUpdateDestroyAPIView):
 
 # Reels
 @extend_schema(tags=['Reels'], description="List reels for users (published reels) and staff (all reels).")
-class ListReel(generics.ListAPIView):
+class ListReel(CachedResponseMixin, ConditionalGetMixin, generics.ListAPIView):
+    response_cache_group = 'reels'
     serializer_class = ReelSerializer
     permission_classes = [AllowAny]
-    ordering = ['-published_at', '-created_at']
+    ordering = [F('published_at').desc(nulls_last=True), '-created_at']
+    cursor_ordering = ['-published_at', '-created_at', '-id']
     search_fields = ['title', 'caption', 'category']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 20
+    pagination_class = LargeFeedPagination
 
     def get_queryset(self):
-        queryset = Reel.objects.order_by('-published_at', '-created_at')
+        queryset = (
+            Reel.objects.select_related('created_by')
+            .order_by(F('published_at').desc(nulls_last=True), '-created_at', '-id')
+        )
         if self.request.user.is_authenticated and self.request.user.is_staff:
             return queryset
         return queryset.filter(is_published=True)
 
 
 @extend_schema(tags=['Reels'], description="Retrieve a reel.")
-class DetailReel(generics.RetrieveAPIView):
+class DetailReel(ConditionalGetMixin, generics.RetrieveAPIView):
     serializer_class = ReelSerializer
     permission_classes = [AllowAny]
     lookup_field = 'id'
     lookup_url_kwarg = 'reel_id'
 
     def get_queryset(self):
-        queryset = Reel.objects.all()
+        queryset = Reel.objects.select_related('created_by')
         if self.request.user.is_authenticated and self.request.user.is_staff:
             return queryset
         return queryset.filter(is_published=True)
@@ -734,19 +947,20 @@ class DeleteStaffUser(generics.DestroyAPIView):
         instance.delete()
 
 @extend_schema(tags=['Galleries'])
-class ListGallery(generics.ListAPIView):
-    queryset = Gallery.objects.order_by('-date')
+class ListGallery(ConditionalGetMixin, generics.ListAPIView):
+    queryset = Gallery.objects.prefetch_related('images').order_by('-date')
     serializer_class = GallerySerializer
+    conditional_related = ('images',)
     ordering = ['-date']
     search_fields = ['title', 'description', 'venue']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
 
 
 @extend_schema(tags=['Galleries'])
-class DetailGallery(generics.RetrieveAPIView):
-    queryset = Gallery.objects.all()
+class DetailGallery(ConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = Gallery.objects.prefetch_related('images')
     serializer_class = GallerySerializer
+    conditional_related = ('images',)
     lookup_field = 'id'
     lookup_url_kwarg = 'gallery_id'
 
@@ -768,17 +982,16 @@ class UpdateGallery(generics.RetrieveUpdateDestroyAPIView):
 
 
 @extend_schema(tags=['Gallery Images'])
-class ListGalleryImage(generics.ListAPIView):
+class ListGalleryImage(ConditionalGetMixin, generics.ListAPIView):
     queryset = GalleryImage.objects.order_by('-date')
     serializer_class = GalleryImageSerializer
     ordering = ['-date']
     search_fields = ['title', 'description', 'gallery__title']
-    pagination_class = PageNumberPagination
-    PageNumberPagination.page_size = 10
+    pagination_class = StandardPagination
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
 
 @extend_schema(tags=['Gallery Images'])
-class DetailGalleryImage(generics.RetrieveAPIView):
+class DetailGalleryImage(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = GalleryImage.objects.all()
     serializer_class = GalleryImageSerializer
     lookup_field = 'id'
@@ -807,36 +1020,16 @@ class AnalyticsBase(APIView):
             return 100.0 if current > 0 else 0.0
         return round(((current - previous) / previous) * 100, 2)
 
-    def _period_stats_dt(self, queryset, field_name, start, end):
-        prev_start = start - (end - start)
-        current = queryset.filter(**{f"{field_name}__gte": start, f"{field_name}__lt": end}).count()
-        previous = queryset.filter(**{f"{field_name}__gte": prev_start, f"{field_name}__lt": start}).count()
-        return {
-            "current": current,
-            "previous": previous,
-            "change_pct": self._safe_pct(current, previous),
-        }
-
-    def _period_stats_date(self, queryset, field_name, start_date, end_date):
+    def _period_stats(self, days, start_date, end_date):
         prev_start_date = start_date - (end_date - start_date)
-        current = queryset.filter(**{f"{field_name}__gte": start_date, f"{field_name}__lt": end_date}).count()
-        previous = queryset.filter(**{f"{field_name}__gte": prev_start_date, f"{field_name}__lt": start_date}).count()
+        current = sum(count for day, count in days.items() if start_date <= day < end_date)
+        previous = sum(count for day, count in days.items() if prev_start_date <= day < start_date)
         return {
             "current": current,
             "previous": previous,
             "change_pct": self._safe_pct(current, previous),
         }
 
-    def _daily_counts(self, queryset, field_name, start, end):
-        rows = (
-            queryset.filter(**{f"{field_name}__gte": start, f"{field_name}__lt": end})
-            .annotate(day=TruncDate(field_name))
-            .values("day")
-            .annotate(count=Count("id"))
-            .order_by("day")
-        )
-        return {row["day"].isoformat(): row["count"] for row in rows}
-
     def _get_period(self, request):
         try:
             period_days = int(request.query_params.get("days", 30))
@@ -860,58 +1053,65 @@ class AnalyticsBase(APIView):
         }
 
     def _overview(self):
-        totals = {
-            "sermons": Sermon.objects.count(),
-            "series": Series.objects.count(),
-            "events": Event.objects.count(),
-            "devotions": Devotion.objects.count(),
-            "reflections": Reflection.objects.count(),
-            "prayer_requests": Prayer_request.objects.count(),
-            "announcements": Announcement.objects.count(),
-            "live_streams": Live_stream.objects.count(),
-            "galleries": Gallery.objects.count(),
-            "gallery_images": GalleryImage.objects.count(),
-            "resources": Resource.objects.count(),
-            "reels": Reel.objects.count(),
-            "contribution_channels": ContributionChannel.objects.count(),
-            "contribution_intents": ContributionIntent.objects.count(),
-            "staff_users": get_user_model().objects.filter(is_staff=True).count(),
-        }
-        return totals
+        return aggregate_metrics({
+            "sermons": (Sermon, Count("pk")),
+            "series": (Series, Count("pk")),
+            "events": (Event, Count("pk")),
+            "devotions": (Devotion, Count("pk")),
+            "reflections": (Reflection, Count("pk")),
+            "prayer_requests": (Prayer_request, Count("pk")),
+            "announcements": (Announcement, Count("pk")),
+            "live_streams": (Live_stream, Count("pk")),
+            "galleries": (Gallery, Count("pk")),
+            "gallery_images": (GalleryImage, Count("pk")),
+            "resources": (Resource, Count("pk")),
+            "reels": (Reel, Count("pk")),
+            "contribution_channels": (ContributionChannel, Count("pk")),
+            "contribution_intents": (ContributionIntent, Count("pk")),
+            "staff_users": (get_user_model(), Count("pk", filter=Q(is_staff=True))),
+        })
 
     def _growth(self, period):
-        growth = {
-            "sermons": self._period_stats_dt(Sermon.objects.all(), "date", period["start"], period["end"]),
-            "series": self._period_stats_dt(Series.objects.all(), "date", period["start"], period["end"]),
-            "events": self._period_stats_date(Event.objects.all(), "date", period["start_date"], period["end_date"]),
-            "devotions": self._period_stats_dt(Devotion.objects.all(), "date", period["start"], period["end"]),
-            "reflections": self._period_stats_dt(Reflection.objects.all(), "date", period["start"], period["end"]),
-            "prayer_requests": self._period_stats_dt(Prayer_request.objects.all(), "date", period["start"], period["end"]),
-            "gallery_images": self._period_stats_dt(GalleryImage.objects.all(), "date", period["start"], period["end"]),
-            "reels": self._period_stats_dt(Reel.objects.all(), "created_at", period["start"], period["end"]),
-            "contribution_intents": self._period_stats_dt(ContributionIntent.objects.all(), "created_at", period["start"], period["end"]),
-        }
-        return growth
-
-    def _engagement(self, totals):
-        sermon_likes = Sermon.objects.aggregate(v=Sum("likes"))["v"] or 0
-        series_likes = Series.objects.aggregate(v=Sum("likes"))["v"] or 0
-        reflection_likes = Reflection.objects.aggregate(v=Sum("likes"))["v"] or 0
-        gallery_likes = Gallery.objects.aggregate(v=Sum("likes"))["v"] or 0
-        gallery_image_likes = GalleryImage.objects.aggregate(v=Sum("likes"))["v"] or 0
-        reel_likes = Reel.objects.aggregate(v=Sum("likes_count"))["v"] or 0
-        live_reactions = Live_stream.objects.aggregate(v=Sum("reactions"))["v"] or 0
-
-        comment_records = (
-            Sermon.objects.exclude(comments__exact="").count()
-            + Reflection.objects.exclude(comments__exact="").count()
-            + Live_stream.objects.exclude(comments__exact="").count()
-        )
+        metrics = [
+            "sermons", "series", "events", "devotions", "reflections",
+            "prayer_requests", "gallery_images", "reels", "contribution_intents",
+        ]
+        start_date, end_date = period["start_date"], period["end_date"]
+        counts = daily_counts(metrics, start_date - (end_date - start_date), end_date)
+        return {metric: self._period_stats(counts[metric], start_date, end_date) for metric in metrics}
+
+    def _engagement(self):
+        commented = ~Q(comments__exact="")
+        metrics = aggregate_metrics({
+            "sermons": (Sermon, Count("pk")),
+            "sermon_likes": (Sermon, Sum("likes")),
+            "sermon_comments": (Sermon, Count("pk", filter=commented)),
+            "series": (Series, Count("pk")),
+            "series_likes": (Series, Sum("likes")),
+            "devotions": (Devotion, Count("pk")),
+            "reflections": (Reflection, Count("pk")),
+            "reflection_likes": (Reflection, Sum("likes")),
+            "reflection_comments": (Reflection, Count("pk", filter=commented)),
+            "gallery_likes": (Gallery, Sum("likes")),
+            "gallery_images": (GalleryImage, Count("pk")),
+            "gallery_image_likes": (GalleryImage, Sum("likes")),
+            "reels": (Reel, Count("pk")),
+            "reel_likes": (Reel, Sum("likes_count")),
+            "live_reactions": (Live_stream, Sum("reactions")),
+            "live_comments": (Live_stream, Count("pk", filter=commented)),
+        })
+        metrics = {key: value or 0 for key, value in metrics.items()}
+
+        live_reactions = metrics["live_reactions"]
+        comment_records = metrics["sermon_comments"] + metrics["reflection_comments"] + metrics["live_comments"]
 
-        total_likes = sermon_likes + series_likes + reflection_likes + gallery_likes + gallery_image_likes + reel_likes
+        total_likes = (
+            metrics["sermon_likes"] + metrics["series_likes"] + metrics["reflection_likes"]
+            + metrics["gallery_likes"] + metrics["gallery_image_likes"] + metrics["reel_likes"]
+        )
         total_reactions = total_likes + live_reactions  # kept for index computation
         content_base = max(
-            totals["sermons"] + totals["series"] + totals["devotions"] + totals["reflections"] + totals["gallery_images"] + totals["reels"],
+            metrics["sermons"] + metrics["series"] + metrics["devotions"] + metrics["reflections"] + metrics["gallery_images"] + metrics["reels"],
             1,
         )
         engagement_index = round(total_reactions / content_base, 2)
@@ -922,23 +1122,28 @@ class AnalyticsBase(APIView):
             "engagement_index": engagement_index,
         }
 
-    def _contributions(self, totals):
-        contribution_totals = ContributionIntent.objects.aggregate(total_amount=Sum("amount"))
-        # Compute status amounts via filtered querysets for broad compatibility.
-        confirmed_amount = ContributionIntent.objects.filter(status="confirmed").aggregate(v=Sum("amount"))["v"] or 0
-        pending_amount = ContributionIntent.objects.filter(status="pending").aggregate(v=Sum("amount"))["v"] or 0
-        rejected_amount = ContributionIntent.objects.filter(status="rejected").aggregate(v=Sum("amount"))["v"] or 0
+    def _contributions(self):
+        metrics = aggregate_metrics({
+            "intent_count": (ContributionIntent, Count("pk")),
+            "total_amount": (ContributionIntent, Sum("amount")),
+            "confirmed_amount": (ContributionIntent, Sum("amount", filter=Q(status="confirmed"))),
+            "pending_amount": (ContributionIntent, Sum("amount", filter=Q(status="pending"))),
+            "rejected_amount": (ContributionIntent, Sum("amount", filter=Q(status="rejected"))),
+            "pending": (ContributionIntent, Count("pk", filter=Q(status="pending"))),
+            "confirmed": (ContributionIntent, Count("pk", filter=Q(status="confirmed"))),
+            "rejected": (ContributionIntent, Count("pk", filter=Q(status="rejected"))),
+        })
 
         contributions = {
-            "intent_count": totals["contribution_intents"],
-            "total_amount": contribution_totals["total_amount"] or 0,
-            "confirmed_amount": confirmed_amount,
-            "pending_amount": pending_amount,
-            "rejected_amount": rejected_amount,
+            "intent_count": metrics["intent_count"],
+            "total_amount": metrics["total_amount"] or 0,
+            "confirmed_amount": metrics["confirmed_amount"] or 0,
+            "pending_amount": metrics["pending_amount"] or 0,
+            "rejected_amount": metrics["rejected_amount"] or 0,
             "status_breakdown": {
-                "pending": ContributionIntent.objects.filter(status="pending").count(),
-                "confirmed": ContributionIntent.objects.filter(status="confirmed").count(),
-                "rejected": ContributionIntent.objects.filter(status="rejected").count(),
+                "pending": metrics["pending"],
+                "confirmed": metrics["confirmed"],
+                "rejected": metrics["rejected"],
             },
             "by_channel_type": list(
                 ContributionIntent.objects.values("channel__channel_type")
@@ -978,25 +1183,16 @@ class AnalyticsBase(APIView):
         return top_content
 
     def _timeline(self, period):
-        dates = [(period["start"].date() + timedelta(days=i)).isoformat() for i in range(period["period_days"])]
-        sermon_daily = self._daily_counts(Sermon.objects.all(), "date", period["start"], period["end"])
-        devotion_daily = self._daily_counts(Devotion.objects.all(), "date", period["start"], period["end"])
-        reflection_daily = self._daily_counts(Reflection.objects.all(), "date", period["start"], period["end"])
-        contribution_daily = self._daily_counts(ContributionIntent.objects.all(), "created_at", period["start"], period["end"])
-        reel_daily = self._daily_counts(Reel.objects.all(), "created_at", period["start"], period["end"])
-        gallery_daily = self._daily_counts(GalleryImage.objects.all(), "date", period["start"], period["end"])
+        metrics = ["sermons", "devotions", "reflections", "contribution_intents", "reels", "gallery_images"]
+        counts = daily_counts(metrics, period["start_date"], period["end_date"])
 
         timeline = []
-        for day in dates:
-            timeline.append({
-                "day": day,
-                "sermons": sermon_daily.get(day, 0),
-                "devotions": devotion_daily.get(day, 0),
-                "reflections": reflection_daily.get(day, 0),
-                "contribution_intents": contribution_daily.get(day, 0),
-                "reels": reel_daily.get(day, 0),
-                "gallery_images": gallery_daily.get(day, 0),
-            })
+        for i in range(period["period_days"]):
+            day = period["start_date"] + timedelta(days=i)
+            row = {"day": day.isoformat()}
+            for metric in metrics:
+                row[metric] = counts[metric].get(day, 0)
+            timeline.append(row)
         return timeline
 
 @extend_schema(tags=['Analytics'], description="Analytics endpoint index. Use dedicated endpoints for faster loads.")
@@ -1014,6 +1210,7 @@ class DashboardAnalytics(AnalyticsBase):
                 "upcoming": "/api/analytics/upcoming/",
                 "top_content": "/api/analytics/top-content/",
                 "timeline": "/api/analytics/timeline/?days=30",
+                "profiling": "/api/analytics/profiling/",
             }
         })
 
@@ -1043,10 +1240,9 @@ class AnalyticsGrowth(AnalyticsBase):
 class AnalyticsEngagement(AnalyticsBase):
     def get(self, request):
         period = self._get_period(request)
-        overview = self._overview()
         return Response({
             "generated_at": period["now"].isoformat(),
-            "engagement": self._engagement(overview),
+            "engagement": self._engagement(),
         })
 
 
@@ -1054,10 +1250,9 @@ class AnalyticsEngagement(AnalyticsBase):
 class AnalyticsContributions(AnalyticsBase):
     def get(self, request):
         period = self._get_period(request)
-        overview = self._overview()
         return Response({
             "generated_at": period["now"].isoformat(),
-            "contributions": self._contributions(overview),
+            "contributions": self._contributions(),
         })
 
 
@@ -1090,3 +1285,78 @@ class AnalyticsTimeline(AnalyticsBase):
             "period_days": period["period_days"],
             "timeline": self._timeline(period),
         })
+
+
+@extend_schema(tags=['Analytics'], description="Per-endpoint request timings collected by the profiling middleware in this process. DELETE resets them.")
+class AnalyticsProfiling(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            "generated_at": timezone.now().isoformat(),
+            "enabled": profiling._policy()["ENABLED"],
+            "pid": os.getpid(),
+            "endpoints": profiling.stats.snapshot(),
+        })
+
+    def delete(self, request):
+        profiling.stats.reset()
+        return Response(status=204)
+
+
+@extend_schema(
+    tags=['Engagement'],
+    request=None,
+    description="Add one like (or, for live streams, one reaction) and return the new total. "
+                "Increments are atomic; bursts on a hot object are buffered and written back in batches.",
+)
+class IncrementCounter(APIView):
+    permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'counters'
+    kind = None
+
+    def post(self, request, pk):
+        _, field = counters.COUNTERS[self.kind]
+        total = counters.increment(self.kind, pk)
+        if total is None:
+            return Response({"detail": "Not found."}, status=404)
+        return Response({"id": str(pk), field: total})
+
+
+@extend_schema(
+    tags=['Search'],
+    parameters=[
+        OpenApiParameter(name='q', type=str, location=OpenApiParameter.QUERY, required=True,
+                         description='Words to search for; supports "quoted phrases", or, and -exclusions.'),
+        OpenApiParameter(name='type', type=str, location=OpenApiParameter.QUERY, required=False,
+                         description='Comma-separated content types to include, e.g. sermon,event.'),
+    ],
+    description="Ranked search across sermons, series, devotions, events, reels, announcements and resources.",
+)
+class UnifiedSearch(generics.ListAPIView):
+    serializer_class = SearchResultSerializer
+    permission_classes = [AllowAny]
+    pagination_class = StandardPagination
+
+    def get_queryset(self):
+        query = self.request.query_params.get('q', '').strip()
+        if not query:
+            return SearchDocument.objects.none()
+
+        queryset = SearchDocument.objects.all()
+        if not (self.request.user.is_authenticated and self.request.user.is_staff):
+            queryset = queryset.filter(is_public=True)
+        types = [value.strip() for value in self.request.query_params.get('type', '').split(',') if value.strip()]
+        if types:
+            queryset = queryset.filter(content_type__in=types)
+
+        if connection.vendor == 'postgresql':
+            search_query = SearchQuery(query, search_type='websearch', config='english')
+            return queryset.filter(search_vector=search_query).annotate(
+                rank=SearchRank(F('search_vector'), search_query)
+            ).order_by('-rank', F('date').desc(nulls_last=True), 'pk')
+
+        for term in query.split():
+            queryset = queryset.filter(Q(title__icontains=term) | Q(body__icontains=term))
+        return queryset.order_by(F('date').desc(nulls_last=True), 'pk')
@@ -64,6 +64,7 @@ if importlib.util.find_spec("cloudinary_storage") and importlib.util.find_spec("
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    'api.profiling.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -170,8 +171,13 @@ if importlib.util.find_spec("cloudinary_storage"):
 REST_FRAMEWORK = {
     # YOUR SETTINGS
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.StandardPagination',
     'PAGE_SIZE': 10,
+    # Honour each view's filterset_fields and search_fields (?search=).
+    'DEFAULT_FILTER_BACKENDS': (
+        'api.filters.FieldFilterBackend',
+        'rest_framework.filters.SearchFilter',
+    ),
 
     'DEFAULT_AUTHENTICATION_CLASSES': (
         
@@ -179,6 +185,9 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication'
         
     ),
+    'DEFAULT_THROTTLE_RATES': {
+        'counters': os.environ.get('COUNTER_THROTTLE_RATE', '120/min'),
+    },
 }
 
 SIMPLE_JWT = {
@@ -233,3 +242,57 @@ SPECTACULAR_SETTINGS = {
         {'name': 'Staff'},
     ],
 }
+
+
+# Bible passage cache policy, applied by api.bible_cache. TTLs are in seconds;
+# a TTL of None keeps that translation's passages until they are evicted.
+BIBLE_PASSAGE_CACHE = {
+    'DEFAULT_TTL': int(os.environ.get('BIBLE_CACHE_TTL', 60 * 60 * 24 * 30)),
+    'TRANSLATION_TTLS': {},
+    'MAX_ROWS': int(os.environ.get('BIBLE_CACHE_MAX_ROWS', 20000)),
+}
+
+
+# Per-request wall/DB timing, reported in Server-Timing headers and at
+# /api/analytics/profiling/. Off unless REQUEST_PROFILING=True; stats are kept
+# per process.
+REQUEST_PROFILING = {
+    'ENABLED': os.environ.get('REQUEST_PROFILING', 'False') == 'True',
+    'SAMPLE_SIZE': 200,
+    'TOP_DUPLICATES': 5,
+}
+
+
+# Like/reaction counters (api.counters). Objects taking more than HOT_THRESHOLD
+# increments per RATE_WINDOW seconds are buffered in the cache and written
+# back at most FLUSH_INTERVAL seconds apart.
+COUNTER_BUFFER = {
+    'HOT_THRESHOLD': 20,
+    'RATE_WINDOW': 10,
+    'FLUSH_INTERVAL': 5,
+}
+
+
+# Local memory by default; set REDIS_URL to share the cache (response cache,
+# site config snapshot, like buffers, throttling) between workers.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'elevation-church',
+        }
+    }
+
+# Rendered anonymous/staff responses of the busiest public lists
+# (api.response_cache), invalidated by model signals.
+RESPONSE_CACHE = {
+    'ENABLED': os.environ.get('RESPONSE_CACHE', 'True') == 'True',
+    'TIMEOUT': int(os.environ.get('RESPONSE_CACHE_TIMEOUT', 60)),
+}